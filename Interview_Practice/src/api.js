@@ -42,6 +42,67 @@ class InterviewAPI {
     }
   }
 
+  // Server-Sent Events over a POST request; calls onEvent(event, data) per event
+  // and resolves with the data of the final `result` event
+  async streamRequest(endpoint, options = {}, onEvent = () => {}) {
+    try {
+      const response = await fetch(`${this.baseURL}${endpoint}`, {
+        method: 'POST',
+        ...options,
+        headers: {
+          'Content-Type': 'application/json',
+          Accept: 'text/event-stream',
+          ...options.headers,
+        },
+        body: options.body && typeof options.body === 'object' ? JSON.stringify(options.body) : options.body,
+      });
+
+      if (!response.ok) {
+        const data = await response.json().catch(() => ({}));
+        throw new Error(data.detail || `HTTP ${response.status}: ${response.statusText}`);
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let result = null;
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+          const frame = buffer.slice(0, boundary);
+          buffer = buffer.slice(boundary + 2);
+
+          let event = 'message';
+          let data = '';
+          for (const line of frame.split('\n')) {
+            if (line.startsWith('event:')) event = line.slice(6).trim();
+            else if (line.startsWith('data:')) data += line.slice(5).trim();
+          }
+          if (!data) continue;
+
+          const parsed = JSON.parse(data);
+          if (event === 'result') result = parsed;
+          onEvent(event, parsed);
+        }
+      }
+
+      return result || { success: false, error: true, message: 'Stream ended without a result' };
+    } catch (err) {
+      console.error(`API Stream Error (${endpoint}):`, err);
+      return {
+        success: false,
+        error: true,
+        message: err.message || 'API request failed',
+        details: err
+      };
+    }
+  }
+
   // Health check to verify backend connection
   async checkHealth() {
     try {
@@ -238,6 +299,23 @@ class InterviewAPI {
     });
   }
 
+  // Streams the detailed feedback to onText as it is generated
+  async submitAnswerStream(questionId, questionText, answerText, responseTimeSeconds = null, onText = () => {}) {
+    if (!this.sessionId) {
+      throw new Error('No active session');
+    }
+
+    return this.streamRequest('/api/evaluation/submit-answer/stream', {
+      body: {
+        session_id: this.sessionId,
+        question_id: questionId,
+        question_text: questionText,
+        answer_text: answerText,
+        response_time_seconds: responseTimeSeconds
+      }
+    }, (event, data) => event === 'feedback' && onText(data.text));
+  }
+
   async getEvaluationHistory() {
     if (!this.sessionId) {
       throw new Error('No active session');
@@ -294,6 +372,13 @@ class InterviewAPI {
     });
   }
 
+  // Streams the answer to onText chunk by chunk; resolves with the full response
+  async askGeneralQuestionStream(question, context = null, onText = () => {}) {
+    return this.streamRequest('/api/questions/ask/stream', {
+      body: { question, context }
+    }, (event, data) => event === 'chunk' && onText(data.text));
+  }
+
   async getPopularQuestions() {
     return this.request('/api/questions/popular-questions');
   }
@@ -311,6 +396,17 @@ class InterviewAPI {
     });
   }
 
+  async explainConceptStream(concept, level = 'intermediate', includeExamples = true, onText = () => {}) {
+    return this.streamRequest(`/api/questions/explain-concept/stream?concept=${encodeURIComponent(concept)}&level=${level}&include_examples=${includeExamples}`, {},
+      (event, data) => event === 'chunk' && onText(data.text));
+  }
+
+  async reviewCodeStream(code, language, focusAreas = null, onText = () => {}) {
+    return this.streamRequest('/api/questions/code-review/stream', {
+      body: { code, language, focus_areas: focusAreas }
+    }, (event, data) => event === 'chunk' && onText(data.text));
+  }
+
   async getInterviewTips(role = null, experienceLevel = null, interviewType = 'technical') {
     return this.request(`/api/questions/interview-tips?role=${role || ''}&experience_level=${experienceLevel || ''}&interview_type=${interviewType}`, {
       method: 'POST'
@@ -372,6 +468,8 @@ export const api = {
   submitAnswer: (qId, qText, aText, time) => apiInstance.submitAnswer(qId, qText, aText, time),
   generateReport: () => apiInstance.generateFinalReport(),
   askQuestion: (question, context) => apiInstance.askGeneralQuestion(question, context),
+  askQuestionStream: (question, context, onText) => apiInstance.askGeneralQuestionStream(question, context, onText),
+  submitAnswerStream: (qId, qText, aText, time, onText) => apiInstance.submitAnswerStream(qId, qText, aText, time, onText),
   
   // Enhanced backend methods
   startInterview: () => apiInstance.startInterview(),
@@ -0,0 +1,4 @@
+"""
+Benchmarks for the AI Interview backend
+Run from the backend directory, e.g. `python -m benchmarks.bench_gemini_event_loop`
+"""
@@ -0,0 +1,85 @@
+"""
+Per-answer overhead of POST /api/interview/answer in main_enhanced, per-request vs shared GeminiService
+
+Every answer that triggers an AI follow-up used to construct a new
+GeminiService: genai.configure, a new GenerativeModel, caches, limiter and
+circuit breaker. Since genai.configure discards the SDK's cached clients, the
+real model then built a new async gRPC client on first use, which is repeated
+here; the TCP/TLS handshake of each fresh channel is not, so production
+savings are larger. The app now creates one service in its lifespan. The
+simulated model answers instantly by default, so the latencies are the
+backend's own overhead.
+
+Usage: python -m benchmarks.bench_enhanced_answer [--sessions 20] [--answers 9] [--latency 0.0]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import FakeGeminiModel, prepare_workspace, summarize
+
+async def _interviews(client, sessions: int, answers: int):
+    latencies = []
+    for session in range(sessions):
+        response = await client.post("/api/interview/start")
+        response.raise_for_status()
+        session_id = response.json()["sessionId"]
+        for index in range(answers):
+            # Long, keyword-bearing answers always get an AI follow-up
+            answer = f"In my experience on project {session}-{index} the main challenge was scaling the write path without downtime."
+            started = time.perf_counter()
+            response = await client.post("/api/interview/answer", json={"answer": answer, "sessionId": session_id})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+async def main(sessions: int, answers: int, latency: float):
+    prepare_workspace()
+
+    import httpx
+    import main_enhanced
+    from google.generativeai import client as genai_client
+    from services.gemini_service import GeminiService
+
+    model = FakeGeminiModel(latency_seconds=latency, payload="Which metric told you the change worked?")
+    shared = GeminiService()
+    shared.model = model
+    genai_client.get_default_generative_async_client()
+    constructed = 0
+
+    def per_request_service():
+        # What generate_ai_followup_question did before the lifespan-managed client
+        nonlocal constructed
+        constructed += 1
+        gemini_service = GeminiService()
+        genai_client.get_default_generative_async_client()
+        gemini_service.model = model
+        return gemini_service
+
+    app = main_enhanced.app
+    app.state.gemini_service = shared
+    app.state.gemini_error = None
+    shared_lookup = main_enhanced.get_gemini_service
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for label, lookup in [("per-request service", per_request_service), ("shared service", shared_lookup)]:
+            main_enhanced.get_gemini_service = lookup
+            model.calls = 0
+            results.append((label, await _interviews(client, sessions, answers), model.calls))
+    main_enhanced.get_gemini_service = shared_lookup
+
+    print(f"\n== {sessions} sessions x {answers} answers, model latency {latency}s ==")
+    for label, summary, calls in results:
+        print(f"{label:<20} per answer p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms model calls={calls}")
+    print(f"GeminiService instances built per-request: {constructed}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--answers", type=int, default=9)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.answers, args.latency))
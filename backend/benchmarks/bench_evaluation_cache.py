@@ -0,0 +1,100 @@
+"""
+Answer submission latency with and without the evaluation cache
+
+Submits many short answers to a canned question. Most are light rewordings of
+a few typical answers (case, punctuation, a dropped word), the way real
+"Tell me about yourself" answers cluster, and the rest are unique.
+
+Usage: python -m benchmarks.bench_evaluation_cache [--answers 300] [--latency 1.0]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import FakeGeminiModel, install_services, prepare_workspace, summarize
+
+QUESTION = "Tell me about yourself and your experience."
+
+TYPICAL_ANSWERS = [
+    "I am a backend developer with two years of experience building REST APIs in Python and Django.",
+    "I recently graduated in computer science and built several web projects with React and Node during my internship.",
+    "I have worked as a software engineer for three years, mostly on cloud services, databases and CI pipelines.",
+]
+
+def _variant(text: str, rng: random.Random) -> str:
+    """A light rewording: change case/punctuation or drop one word"""
+    words = text.split()
+    choice = rng.random()
+    if choice < 0.3:
+        return text.upper()
+    if choice < 0.6:
+        return text.rstrip(".") + "!"
+    del words[rng.randrange(1, len(words))]
+    return " ".join(words)
+
+def build_answers(count: int, unique_share: float, seed: int = 7):
+    rng = random.Random(seed)
+    answers = []
+    for i in range(count):
+        if rng.random() < unique_share:
+            answers.append(f"My background is unusual: project {i} taught me {rng.randrange(10**6)} lessons about teamwork.")
+        else:
+            answers.append(_variant(rng.choice(TYPICAL_ANSWERS), rng))
+    return answers
+
+async def _run_mode(app, services, answers, latency: float):
+    import httpx
+
+    model = FakeGeminiModel(latency_seconds=latency)
+    services.gemini_service.model = model
+
+    session_service = services.session_service
+    session_id = await session_service.create_session()
+    await session_service.update_session(session_id, {"role": "Backend Developer", "experience_level": "1-2"})
+    await session_service.start_interview(session_id, [{"id": i, "question": QUESTION} for i in range(1, len(answers) + 1)])
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for question_id, answer in enumerate(answers, 1):
+            started = time.perf_counter()
+            response = await client.post("/api/evaluation/submit-answer", json={
+                "session_id": session_id,
+                "question_id": question_id,
+                "question_text": QUESTION,
+                "answer_text": answer
+            })
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies), model.calls
+
+async def main(count: int, latency: float, unique_share: float):
+    prepare_workspace()
+
+    import main as backend
+
+    services = await install_services(backend.app)
+    answers = build_answers(count, unique_share)
+    evaluation_cache = services.gemini_service.evaluation_cache
+
+    services.gemini_service.evaluation_cache = None
+    uncached, uncached_calls = await _run_mode(backend.app, services, answers, latency)
+
+    services.gemini_service.evaluation_cache = evaluation_cache
+    cached, cached_calls = await _run_mode(backend.app, services, answers, latency)
+    await services.shutdown()
+
+    print(f"\n== {count} answers, {unique_share:.0%} unique, model latency {latency}s ==")
+    print(f"no cache          p50={uncached['p50_ms']}ms p99={uncached['p99_ms']}ms model calls={uncached_calls}")
+    print(f"evaluation cache  p50={cached['p50_ms']}ms p99={cached['p99_ms']}ms model calls={cached_calls}")
+    print(f"cache stats: {evaluation_cache.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--answers", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=1.0, help="Simulated model latency in seconds")
+    parser.add_argument("--unique-share", type=float, default=0.2, help="Fraction of answers that match nothing")
+    args = parser.parse_args()
+    asyncio.run(main(args.answers, args.latency, args.unique_share))
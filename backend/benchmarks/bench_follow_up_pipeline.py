@@ -0,0 +1,108 @@
+"""
+Per-turn latency of answer evaluation plus follow-up, sequential vs pipelined
+
+A turn is what the client does after each answer: submit it for evaluation
+and fetch the follow-up question. Compares generating the follow-up only
+when asked, generating it speculatively during the evaluation, and getting
+both from one submit-answer call with include_follow_up=true.
+
+Usage: python -m benchmarks.bench_follow_up_pipeline [--sessions 10] [--turns 5] [--latency 1.0]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import FakeGeminiModel, fake_questions, install_services, prepare_workspace, summarize
+from services.metrics import GEMINI_FALLBACKS
+
+class FollowUpFakeGeminiModel(FakeGeminiModel):
+    """Evaluation JSON for evaluation prompts, a plain-text question for follow-up prompts"""
+
+    def reply(self, prompt: str, kind: str) -> str:
+        if kind == "follow_up":
+            return "How would you verify the improvement?"
+        return self.payload
+
+def _fallbacks() -> int:
+    return int(GEMINI_FALLBACKS.value(method="evaluate") + GEMINI_FALLBACKS.value(method="follow_up"))
+
+async def _turns(client, services, sessions: int, turns: int, combined: bool):
+    latencies = []
+
+    async def run_session():
+        session_id = await services.interview_service.create_interview_session()
+        await services.session_service.set_interview_role(session_id, "Backend Developer")
+        questions = fake_questions(turns + 1)
+        await services.session_service.start_interview(session_id, questions)
+        for question in questions[:turns]:
+            answer = f"For question {question['id']} I would measure first, then optimise the hot path."
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/evaluation/submit-answer",
+                params={"include_follow_up": "true"} if combined else None,
+                json={
+                    "session_id": session_id,
+                    "question_id": question["id"],
+                    "question_text": question["question"],
+                    "answer_text": answer,
+                    "response_time_seconds": 30
+                }
+            )
+            response.raise_for_status()
+            if not combined:
+                response = await client.post("/api/evaluation/generate-followup", params={
+                    "session_id": session_id,
+                    "original_question": question["question"],
+                    "answer": answer
+                })
+                response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(run_session() for _ in range(sessions)))
+    return summarize(latencies)
+
+async def main(sessions: int, turns: int, latency: float):
+    os.environ["SPECULATIVE_FOLLOW_UPS_ENABLED"] = "True"
+    prepare_workspace()
+
+    import httpx
+    import main as backend
+
+    services = await install_services(backend.app)
+    services.gemini_service.evaluation_cache = None
+    follow_ups = services.interview_service.follow_ups
+
+    results = []
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for label, speculative, combined in [
+            ("sequential", False, False),
+            ("speculative follow-up", True, False),
+            ("include_follow_up (gather)", True, True),
+        ]:
+            services.interview_service.follow_ups = follow_ups if speculative else None
+            model = FollowUpFakeGeminiModel(latency_seconds=latency)
+            services.gemini_service.model = model
+            fallbacks = _fallbacks()
+            summary = await _turns(client, services, sessions, turns, combined)
+            # Timings of fallback turns would measure the failure path, not the pipeline
+            if _fallbacks() != fallbacks:
+                raise RuntimeError(f"{label}: {_fallbacks() - fallbacks} calls fell back; the fake model's replies no longer parse")
+            results.append((label, summary, model.calls))
+
+    await services.shutdown()
+
+    print(f"\n== {sessions} sessions x {turns} turns, model latency {latency}s ==")
+    for label, summary, calls in results:
+        print(f"{label:<28} turn p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms model calls={calls}")
+    print(f"speculation stats: {follow_ups.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=1.0, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.turns, args.latency))
@@ -0,0 +1,92 @@
+"""
+Event-loop lag and latency under concurrent answer evaluation
+
+Fires concurrent POST /api/evaluation/submit-answer calls at the in-process app
+while a health-check poller runs alongside, once with a model that blocks the
+loop (the old synchronous generate_content call) and once with the async path.
+
+Usage: python -m benchmarks.bench_gemini_event_loop [--concurrency 20] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import FakeGeminiModel, LoopLagMonitor, install_services, prepare_workspace, summarize
+
+async def _run_mode(app, services, blocking: bool, concurrency: int, latency: float):
+    import httpx
+
+    session_service = services.session_service
+    services.gemini_service.model = FakeGeminiModel(latency_seconds=latency, blocking=blocking)
+
+    session_ids = []
+    for _ in range(concurrency):
+        session_id = await session_service.create_session()
+        await session_service.start_interview(session_id, [{"id": 1, "question": "Tell me about yourself."}])
+        session_ids.append(session_id)
+
+    submit_latencies = []
+    health_latencies = []
+    monitor = LoopLagMonitor()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def submit(session_id: str):
+            started = time.perf_counter()
+            response = await client.post("/api/evaluation/submit-answer", json={
+                "session_id": session_id,
+                "question_id": 1,
+                "question_text": "Tell me about yourself.",
+                "answer_text": "I am a backend engineer who enjoys building reliable APIs."
+            })
+            response.raise_for_status()
+            submit_latencies.append(time.perf_counter() - started)
+
+        async def poll_health(stop: asyncio.Event):
+            while not stop.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.02)
+
+        stop = asyncio.Event()
+        monitor.start()
+        poller = asyncio.create_task(poll_health(stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(submit(session_id) for session_id in session_ids))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await poller
+        await monitor.stop()
+
+    return {
+        "mode": "blocking (before)" if blocking else "async (after)",
+        "wall_s": round(elapsed, 2),
+        "submit": summarize(submit_latencies),
+        "health": summarize(health_latencies),
+        "loop_lag": summarize(monitor.samples)
+    }
+
+async def main(concurrency: int, latency: float):
+    prepare_workspace()
+
+    import main as backend
+
+    services = await install_services(backend.app)
+    services.gemini_service.evaluation_cache = None  # Every submit sends the same answer
+
+    for blocking in (True, False):
+        result = await _run_mode(backend.app, services, blocking, concurrency, latency)
+        print(f"\n== {result['mode']}: {concurrency} concurrent submits, {latency * 1000:.0f}ms model latency ==")
+        print(f"wall time      {result['wall_s']}s")
+        for name in ("submit", "health", "loop_lag"):
+            stats = result[name]
+            print(f"{name:<14} p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency))
@@ -0,0 +1,100 @@
+"""
+Fallback rate and latency under model failures, with and without retries and the circuit breaker
+
+Two scenarios against a simulated model:
+  transient  a share of calls fail with a 503; retries should turn most of
+             those into real evaluations instead of fallback scores
+  outage     every call hangs until it times out; the breaker should start
+             answering with fallbacks at once instead of each request
+             waiting out timeouts and retries
+
+Backoff delays are scaled down from AIConfig.RETRY_CONFIG so the run is short.
+
+Usage: python -m benchmarks.bench_model_failures [--calls 100] [--failure-rate 0.3]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from benchmarks.common import FakeGeminiModel, prepare_workspace, summarize
+
+def _configure(gemini, resilient: bool, backoff_scale: float):
+    from config.settings import AIConfig
+    from services.resilience import CircuitBreaker, RetryPolicy
+
+    if resilient:
+        policy = RetryPolicy.from_config(AIConfig.RETRY_CONFIG)
+        policy.retry_delay *= backoff_scale
+        gemini.retry_policy = policy
+        gemini.circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout_seconds=30)
+    else:
+        # The old behaviour: first error falls back, nothing short-circuits
+        gemini.retry_policy = RetryPolicy(max_retries=0)
+        gemini.circuit_breaker = CircuitBreaker(failure_threshold=10**9)
+
+async def _run(gemini, model, calls: int, concurrency: int):
+    fallbacks = 0
+    original_fallback = gemini._get_fallback_evaluation
+
+    def counting_fallback(answer):
+        nonlocal fallbacks
+        fallbacks += 1
+        return original_fallback(answer)
+
+    gemini._get_fallback_evaluation = counting_fallback
+    gemini.model = model
+
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def evaluate(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await gemini.evaluate_answer(f"Question {i}", f"Answer {i}", "Backend Developer", "1-2")
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(evaluate(i) for i in range(calls)))
+    elapsed = time.perf_counter() - started
+    gemini._get_fallback_evaluation = original_fallback
+    return summarize(latencies), fallbacks, elapsed
+
+async def main(calls: int, failure_rate: float, latency: float, timeout: float, backoff_scale: float):
+    prepare_workspace()
+    logging.disable(logging.CRITICAL)  # Every injected failure is logged as an error
+
+    from services.gemini_service import GeminiService
+
+    gemini = GeminiService()
+    gemini.evaluation_cache = None
+    gemini.request_timeout_seconds = timeout
+
+    print(f"\n== transient: {failure_rate:.0%} of calls fail, model latency {latency}s, {calls} calls ==")
+    for resilient in (False, True):
+        _configure(gemini, resilient, backoff_scale)
+        model = FakeGeminiModel(latency_seconds=latency, failure_rate=failure_rate)
+        stats, fallbacks, _ = await _run(gemini, model, calls, concurrency=1)
+        label = "retry + breaker" if resilient else "no retry"
+        print(f"{label:16} p50={stats['p50_ms']}ms p99={stats['p99_ms']}ms fallbacks={fallbacks} model calls={model.calls}")
+
+    print(f"\n== outage: every call hangs past the {timeout}s timeout, {calls} calls, 10 concurrent ==")
+    for resilient in (False, True):
+        _configure(gemini, resilient, backoff_scale)
+        model = FakeGeminiModel(latency_seconds=timeout * 10)
+        stats, fallbacks, elapsed = await _run(gemini, model, calls, concurrency=10)
+        label = "retry + breaker" if resilient else "no retry"
+        print(f"{label:16} p50={stats['p50_ms']}ms p99={stats['p99_ms']}ms fallbacks={fallbacks} "
+              f"model calls={model.calls} wall={elapsed:.1f}s")
+    print(f"breaker: {gemini.circuit_breaker.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--failure-rate", type=float, default=0.3)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated model latency in seconds")
+    parser.add_argument("--timeout", type=float, default=0.5, help="Per-attempt model timeout in seconds")
+    parser.add_argument("--backoff-scale", type=float, default=0.05, help="Multiplier on RETRY_CONFIG delays")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.failure_rate, args.latency, args.timeout, args.backoff_scale))
@@ -0,0 +1,115 @@
+"""
+Traffic spike against a rate-limited model, with and without the model limiter
+
+A simulated model rejects calls beyond a per-second quota with a 429-style error,
+as the Gemini API does. A spike of interactive answer evaluations arrives
+together with background report generation. Without pacing most calls fail and
+users get fallback scores; with the limiter the spike queues, interactive
+evaluations go first, and nothing falls back.
+
+Usage: python -m benchmarks.bench_model_limiter [--evaluations 40] [--reports 20] [--quota 5]
+"""
+
+import argparse
+import asyncio
+import time
+from collections import deque
+
+from benchmarks.common import prepare_workspace, summarize
+from services.fake_model import FakeModelBackend, FakeModelError
+from services.metrics import GEMINI_FALLBACKS
+
+class QuotaFakeGeminiModel(FakeModelBackend):
+    """Fake model that raises once more than `quota_per_second` calls start within a second
+
+    Replies are FakeModelBackend's, so evaluations and reports both validate
+    and every failure in the run is a quota rejection.
+    """
+
+    def __init__(self, quota_per_second: int, latency_seconds: float):
+        super().__init__(latency_ms=latency_seconds * 1000, latency_distribution="fixed")
+        self.quota_per_second = quota_per_second
+        self.rejected = 0
+        self._started = deque()
+
+    async def generate_content_async(self, prompt, **kwargs):
+        now = time.monotonic()
+        while self._started and now - self._started[0] >= 1.0:
+            self._started.popleft()
+        if len(self._started) >= self.quota_per_second:
+            self.rejected += 1
+            raise FakeModelError(429, "Resource has been exhausted (e.g. check quota).")
+        self._started.append(now)
+        return await super().generate_content_async(prompt, **kwargs)
+
+async def _run_mode(gemini, evaluations: int, reports: int):
+    evaluation_latencies, report_latencies = [], []
+
+    async def evaluate(i: int):
+        started = time.perf_counter()
+        await gemini.evaluate_answer(f"Question {i}", f"Distinct answer number {i} about caching.", "Backend Developer", "1-2")
+        evaluation_latencies.append(time.perf_counter() - started)
+
+    async def report(i: int):
+        started = time.perf_counter()
+        await gemini.generate_final_report({"role": "Backend Developer"}, {"answers": [], "session_id": f"s{i}"})
+        report_latencies.append(time.perf_counter() - started)
+
+    # Background work is already queued when the interactive spike lands
+    tasks = [asyncio.create_task(report(i)) for i in range(reports)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(evaluate(i)) for i in range(evaluations)]
+    await asyncio.gather(*tasks)
+    return summarize(evaluation_latencies), summarize(report_latencies)
+
+def _fallbacks() -> int:
+    return int(GEMINI_FALLBACKS.value(method="evaluate") + GEMINI_FALLBACKS.value(method="report"))
+
+async def main(evaluations: int, reports: int, quota: int, latency: float):
+    prepare_workspace()
+
+    from services.gemini_service import GeminiService
+    from services.rate_limiter import ModelRateLimiter
+    from services.resilience import CircuitBreaker
+    from services.structured_output import StructuredOutputParser
+
+    gemini = GeminiService()
+    gemini.evaluation_cache = None
+
+    results = {}
+    for mode in ("unlimited", "limiter"):
+        if mode == "limiter":
+            # Pace just under the quota with no burst allowance
+            requests_per_minute = (quota - 1) * 60
+            gemini.limiter = ModelRateLimiter(max_in_flight=8, requests_per_minute=requests_per_minute,
+                                              burst_seconds=60 / requests_per_minute)
+        # The unlimited run's 429s open the breaker; each mode starts with a closed one
+        gemini.circuit_breaker = CircuitBreaker(
+            failure_threshold=gemini.circuit_breaker.failure_threshold,
+            recovery_timeout_seconds=gemini.circuit_breaker.recovery_timeout_seconds
+        )
+        gemini.output_parser = StructuredOutputParser()
+        model = QuotaFakeGeminiModel(quota, latency_seconds=latency)
+        gemini.model = model
+        fallbacks = _fallbacks()
+        evaluation_stats, report_stats = await _run_mode(gemini, evaluations, reports)
+        reprompts = sum(counters["reprompted"] for counters in gemini.output_parser.get_stats().values())
+        results[mode] = (evaluation_stats, report_stats, model.rejected, _fallbacks() - fallbacks, reprompts)
+        # Let the quota window reset between modes
+        await asyncio.sleep(1.1)
+
+    print(f"\n== {evaluations} evaluations + {reports} reports at once, quota {quota} calls/s, model latency {latency}s ==")
+    for mode, (evaluation_stats, report_stats, rejected, fallbacks, reprompts) in results.items():
+        print(f"{mode:10} evaluations p50={evaluation_stats['p50_ms']}ms p99={evaluation_stats['p99_ms']}ms  "
+              f"reports p50={report_stats['p50_ms']}ms p99={report_stats['p99_ms']}ms  "
+              f"429s={rejected} fallbacks={fallbacks} re-prompts={reprompts}")
+    print(f"limiter stats: {gemini.limiter.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--evaluations", type=int, default=40)
+    parser.add_argument("--reports", type=int, default=20)
+    parser.add_argument("--quota", type=int, default=5, help="Model calls accepted per second")
+    parser.add_argument("--latency", type=float, default=0.3, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.evaluations, args.reports, args.quota, args.latency))
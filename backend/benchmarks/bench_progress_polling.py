@@ -0,0 +1,84 @@
+"""
+Read-heavy polling from the frontend progress bar
+
+Many clients repeatedly GET /api/interview/progress/{id} and
+/api/interview/next-question/{id}. Compares the old behaviour, where every read
+bumped last_updated and rewrote the session file, with in-memory access tracking.
+
+Usage: python -m benchmarks.bench_progress_polling [--sessions 50] [--polls 40]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from benchmarks.common import count_store_writes, install_services, prepare_workspace, summarize
+
+async def _poll(app, session_ids, polls: int):
+    import httpx
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def poll_session(session_id: str):
+            for _ in range(polls):
+                for path in (f"/api/interview/progress/{session_id}", f"/api/interview/next-question/{session_id}"):
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(poll_session(session_id) for session_id in session_ids))
+        elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+async def main(session_count: int, polls: int):
+    prepare_workspace()
+
+    import main as backend
+
+    services = await install_services(backend.app)
+    session_service = services.session_service
+    questions = [{"id": i, "question": f"Question {i}", "type": "technical", "difficulty": "medium"} for i in range(1, 11)]
+
+    session_ids = []
+    for _ in range(session_count):
+        session_id = await session_service.create_session()
+        await session_service.start_interview(session_id, questions)
+        session_ids.append(session_id)
+    await session_service.writer.flush_all()
+
+    writes = count_store_writes(session_service.store)
+    original_get_session = session_service.get_session
+
+    async def legacy_get_session(session_id):
+        # Old behaviour: every read bumped last_updated and rewrote the session
+        session_data = await original_get_session(session_id)
+        if session_data is not None:
+            session_data["last_updated"] = datetime.now().isoformat()
+            await session_service.store.save(session_id, session_data)
+        return session_data
+
+    for mode in ("write-on-read (before)", "access tracker (after)"):
+        session_service.get_session = legacy_get_session if mode.startswith("write") else original_get_session
+        writes["writes"] = 0
+        latencies, elapsed = await _poll(backend.app, session_ids, polls)
+        await session_service.persist_access_times()
+        await session_service.writer.flush_all()
+
+        stats = summarize(latencies)
+        print(f"\n== {mode}: {session_count} sessions x {polls} polls ==")
+        print(f"requests       {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} req/s)")
+        print(f"latency        p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms")
+        print(f"disk writes    {writes['writes']}")
+
+    await services.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--polls", type=int, default=40)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.polls))
@@ -0,0 +1,91 @@
+"""
+POST /api/interview/setup latency across many configurations, cold vs prefetched bank
+
+Requests are spread over every experience level and difficulty for a few
+roles, so most configurations are requested only once or twice and the
+plain question cache rarely helps. The question bank is then warmed with
+one refill pass and the same requests are replayed.
+
+Usage: python -m benchmarks.bench_question_bank [--roles 4] [--requests 100] [--latency 0.5] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.common import FakeGeminiModel, fake_questions, install_services, prepare_workspace, summarize
+
+async def _setup_requests(client, configurations, requests: int):
+    rng = random.Random(7)
+    latencies = []
+    for _ in range(requests):
+        role, experience, difficulty = rng.choice(configurations)
+        started = time.perf_counter()
+        response = await client.post("/api/interview/setup", json={
+            "role": role,
+            "experience_level": experience,
+            "difficulty": difficulty,
+            "question_count": 10
+        })
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+async def main(roles: int, requests: int, latency: float, concurrency: int):
+    os.environ["QUESTION_BANK_ENABLED"] = "True"
+    os.environ["QUESTION_BANK_CONCURRENCY"] = str(concurrency)
+    prepare_workspace()
+
+    import httpx
+    from config.settings import InterviewConfig
+    os.environ["QUESTION_BANK_ROLES"] = ",".join(InterviewConfig.JOB_ROLES[:roles])
+    import main as backend
+    from services.question_cache import QuestionCache
+
+    services = await install_services(backend.app)
+    gemini = services.gemini_service
+    bank = services.question_bank
+    model = FakeGeminiModel(latency_seconds=latency, payload=fake_questions(10))
+    gemini.model = model
+
+    def fresh_cache():
+        cache = QuestionCache(path="data/cache/question_cache.json", max_keys=len(bank.configurations))
+        gemini.question_cache = cache
+        bank.cache = cache
+
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        fresh_cache()
+        cold = await _setup_requests(client, bank.configurations, requests)
+        cold_calls = model.calls
+
+        fresh_cache()
+        model.calls = 0
+        started = time.perf_counter()
+        generated = await bank.refill()
+        warm_seconds = time.perf_counter() - started
+        warm_calls = model.calls
+
+        model.calls = 0
+        warmed = await _setup_requests(client, bank.configurations, requests)
+        warmed_calls = model.calls
+
+    stats = bank.get_stats()
+    await services.shutdown()
+
+    print(f"\n== {requests} setup requests over {len(bank.configurations)} configurations ({roles} roles), model latency {latency}s ==")
+    print(f"cache only, cold   p50={cold['p50_ms']}ms p95={cold['p95_ms']}ms model calls={cold_calls}")
+    print(f"bank warm-up       {generated} sets in {warm_seconds:.1f}s ({warm_calls} background calls, concurrency {concurrency})")
+    print(f"prefetched bank    p50={warmed['p50_ms']}ms p95={warmed['p95_ms']}ms model calls={warmed_calls}")
+    print(f"fill: {stats['ready_sets']}/{stats['configurations'] * stats['target_sets']} sets, ratio {stats['fill_ratio']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--roles", type=int, default=4, help="How many of InterviewConfig.JOB_ROLES to bank")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated model latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Question bank worker concurrency")
+    args = parser.parse_args()
+    asyncio.run(main(args.roles, args.requests, args.latency, args.concurrency))
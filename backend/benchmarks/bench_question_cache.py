@@ -0,0 +1,71 @@
+"""
+POST /api/interview/setup latency with and without the question cache
+
+Sends setup requests for a handful of common role/experience/difficulty
+configurations against a simulated model, once with the cache disabled and
+once with it enabled, and reports latency and model round trips.
+
+Usage: python -m benchmarks.bench_question_cache [--requests 200] [--latency 2.0]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import FakeGeminiModel, fake_questions, install_services, prepare_workspace, summarize
+
+CONFIGURATIONS = [
+    ("Backend Developer", "1-2", "medium"),
+    ("Frontend Developer", "0-1", "easy"),
+    ("Data Scientist", "2-3", "medium"),
+    ("Software Engineer", "3-5", "hard"),
+]
+
+async def _run_mode(app, services, requests: int, latency: float):
+    import httpx
+
+    model = FakeGeminiModel(latency_seconds=latency, payload=fake_questions(10))
+    services.gemini_service.model = model
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for i in range(requests):
+            role, experience, difficulty = CONFIGURATIONS[i % len(CONFIGURATIONS)]
+            started = time.perf_counter()
+            response = await client.post("/api/interview/setup", json={
+                "role": role,
+                "experience_level": experience,
+                "difficulty": difficulty,
+                "question_count": 10
+            })
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies), model.calls
+
+async def main(requests: int, latency: float):
+    prepare_workspace()
+
+    import main as backend
+
+    services = await install_services(backend.app)
+    question_cache = services.gemini_service.question_cache
+
+    services.gemini_service.question_cache = None
+    uncached, uncached_calls = await _run_mode(backend.app, services, requests, latency)
+
+    services.gemini_service.question_cache = question_cache
+    cached, cached_calls = await _run_mode(backend.app, services, requests, latency)
+    await services.shutdown()
+
+    print(f"\n== {requests} setup requests over {len(CONFIGURATIONS)} configurations, model latency {latency}s ==")
+    print(f"no cache      p50={uncached['p50_ms']}ms p99={uncached['p99_ms']}ms model calls={uncached_calls}")
+    print(f"question cache p50={cached['p50_ms']}ms p99={cached['p99_ms']}ms model calls={cached_calls}")
+    print(f"cache stats: {question_cache.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=2.0, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
@@ -0,0 +1,100 @@
+"""
+GET /api/interview/progress/{id} latency against a large session archive
+
+Compares the old per-request SessionService() construction, which re-reads every
+stored session, with the process-wide service container.
+
+Usage: python -m benchmarks.bench_session_progress [--sizes 10000 100000] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.common import install_services, prepare_workspace, summarize
+
+def seed_sessions(count: int, directory: Path = Path("data/sessions")) -> str:
+    """Write `count` in-progress sessions to disk and return one of their IDs"""
+    directory.mkdir(parents=True, exist_ok=True)
+    now = datetime.now().isoformat()
+    session_id = None
+    for _ in range(count):
+        session_id = f"session_{uuid.uuid4().hex[:12]}"
+        session_data = {
+            "session_id": session_id,
+            "user_email": None,
+            "created_at": now,
+            "last_updated": now,
+            "status": "in_progress",
+            "role": "Backend Developer",
+            "experience_level": "1-2",
+            "difficulty": "medium",
+            "resume_text": None,
+            "questions": [{"id": 1, "question": "Tell me about yourself.", "type": "behavioral", "difficulty": "medium"}],
+            "answers": [],
+            "current_question_index": 0,
+            "scores": {"overall": 0, "technical": 0, "communication": 0, "problem_solving": 0, "confidence": 0},
+            "interview_data": {}
+        }
+        with open(directory / f"{session_id}.json", "w") as f:
+            json.dump(session_data, f, indent=2, default=str)
+    return session_id
+
+async def _measure(app, session_id: str, requests: int):
+    import httpx
+
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(f"/api/interview/progress/{session_id}")
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+async def main(sizes, requests: int, legacy_requests: int):
+    prepare_workspace()
+
+    import main as backend
+    from services.container import get_interview_service
+    from services.interview_service import InterviewService
+    from services.session_service import SessionService
+
+    seeded = 0
+    for size in sizes:
+        session_id = seed_sessions(size - seeded)
+        seeded = size
+
+        started = time.perf_counter()
+        services = await install_services(backend.app)
+        startup_s = time.perf_counter() - started
+
+        # Before: every request built its own SessionService and reloaded the archive
+        async def per_request_interview_service():
+            session_service = SessionService()
+            await session_service.initialize()
+            return InterviewService(services.gemini_service, session_service)
+
+        backend.app.dependency_overrides[get_interview_service] = per_request_interview_service
+        legacy = await _measure(backend.app, session_id, legacy_requests)
+        backend.app.dependency_overrides.clear()
+
+        shared = await _measure(backend.app, session_id, requests)
+
+        print(f"\n== {size} stored sessions (container startup {startup_s:.2f}s) ==")
+        print(f"per-request SessionService  p50={legacy['p50_ms']}ms p99={legacy['p99_ms']}ms ({legacy_requests} requests)")
+        print(f"shared container            p50={shared['p50_ms']}ms p99={shared['p99_ms']}ms ({requests} requests)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--legacy-requests", type=int, default=3,
+                        help="Requests measured in per-request mode, which is slow at large sizes")
+    args = parser.parse_args()
+    asyncio.run(main(sorted(args.sizes), args.requests, args.legacy_requests))
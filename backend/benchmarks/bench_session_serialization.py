@@ -0,0 +1,135 @@
+"""
+Session save/load throughput: stdlib pretty JSON vs the versioned orjson format
+
+Each session carries 20 answers with full evaluations. Measures in-memory
+encode/decode and round trips through JsonFileSessionStore on disk.
+
+Usage: python -m benchmarks.bench_session_serialization [--sessions 500]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.common import FAKE_EVALUATION, prepare_workspace
+
+def build_session(index: int, answers: int = 20) -> dict:
+    """An in-progress session shaped like the ones SessionService writes"""
+    now = datetime.now().isoformat()
+    questions = [
+        {"id": i, "question": f"Question {i}: describe a system you designed and its trade-offs.",
+         "type": "technical", "difficulty": "medium", "expected_duration": 5}
+        for i in range(1, answers + 1)
+    ]
+    return {
+        "session_id": f"session_{index:012d}",
+        "user_email": f"user{index}@example.com",
+        "created_at": now,
+        "last_updated": now,
+        "status": "in_progress",
+        "role": "Backend Developer",
+        "experience_level": "3-5",
+        "difficulty": "medium",
+        "resume_text": "Backend engineer with five years of Python and distributed systems experience. " * 10,
+        "questions": questions,
+        "answers": [
+            {
+                "question_id": i,
+                "answer_text": "I would start by clarifying requirements, then sketch the data model and APIs. " * 8,
+                "evaluation": dict(FAKE_EVALUATION),
+                "submitted_at": now,
+                "score": FAKE_EVALUATION["overall_score"]
+            }
+            for i in range(1, answers + 1)
+        ],
+        "current_question_index": answers,
+        "scores": {"overall": 78, "technical": 80, "communication": 75, "problem_solving": 82, "confidence": 77},
+        "interview_data": {}
+    }
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:,.0f}/s" if seconds > 0 else "n/a"
+
+def bench_codec(sessions):
+    from services.serialization import decode_session, encode_session
+
+    started = time.perf_counter()
+    legacy_payloads = [json.dumps(s, indent=2, default=str) for s in sessions]
+    legacy_encode = time.perf_counter() - started
+    started = time.perf_counter()
+    for payload in legacy_payloads:
+        json.loads(payload)
+    legacy_decode = time.perf_counter() - started
+
+    started = time.perf_counter()
+    payloads = [encode_session(s) for s in sessions]
+    encode = time.perf_counter() - started
+    started = time.perf_counter()
+    for payload in payloads:
+        decode_session(payload)
+    decode = time.perf_counter() - started
+
+    legacy_size = sum(len(p.encode()) for p in legacy_payloads) / len(sessions)
+    size = sum(len(p) for p in payloads) / len(sessions)
+
+    print(f"\n== encode/decode, {len(sessions)} sessions ==")
+    print(f"stdlib json indent=2  encode {_rate(len(sessions), legacy_encode)}  decode {_rate(len(sessions), legacy_decode)}  {legacy_size / 1024:.1f} KiB/session")
+    print(f"orjson v2             encode {_rate(len(sessions), encode)}  decode {_rate(len(sessions), decode)}  {size / 1024:.1f} KiB/session")
+
+async def bench_store(sessions):
+    from services.session_store import JsonFileSessionStore
+
+    # Legacy path: what _save_session / _load_sessions_sync did before
+    legacy_dir = Path("data/legacy_sessions")
+    legacy_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    for s in sessions:
+        with open(legacy_dir / f"{s['session_id']}.json", "w") as f:
+            json.dump(s, f, indent=2, default=str)
+    legacy_save = time.perf_counter() - started
+    started = time.perf_counter()
+    for s in sessions:
+        with open(legacy_dir / f"{s['session_id']}.json", "r") as f:
+            json.load(f)
+    legacy_load = time.perf_counter() - started
+
+    store = JsonFileSessionStore("data/sessions")
+    started = time.perf_counter()
+    for s in sessions:
+        await store.save(s["session_id"], s)
+    save = time.perf_counter() - started
+    started = time.perf_counter()
+    for s in sessions:
+        await store.load(s["session_id"])
+    load = time.perf_counter() - started
+
+    # Compatibility reader on the legacy files, then the one-shot migration
+    compat_store = JsonFileSessionStore(str(legacy_dir))
+    started = time.perf_counter()
+    for s in sessions:
+        await compat_store.load(s["session_id"])
+    compat_load = time.perf_counter() - started
+    started = time.perf_counter()
+    counts = compat_store.migrate()
+    migrate = time.perf_counter() - started
+
+    print(f"\n== JsonFileSessionStore round trips, {len(sessions)} sessions ==")
+    print(f"stdlib json indent=2  save {_rate(len(sessions), legacy_save)}  load {_rate(len(sessions), legacy_load)}")
+    print(f"orjson v2             save {_rate(len(sessions), save)}  load {_rate(len(sessions), load)}")
+    print(f"legacy files via compat reader  load {_rate(len(sessions), compat_load)}")
+    print(f"migration  {counts['migrated']} files in {migrate:.2f}s")
+
+async def main(count: int):
+    prepare_workspace()
+    sessions = [build_session(i) for i in range(count)]
+    bench_codec(sessions)
+    await bench_store(sessions)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions))
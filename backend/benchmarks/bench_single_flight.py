@@ -0,0 +1,75 @@
+"""
+Model calls and latency for a burst of identical /api/questions/ask requests, with and without single-flight
+
+A class of students clicks items from /popular-questions at the same time:
+each burst sends every request for one of a few popular questions within a
+few milliseconds. Without coalescing each request is its own model call and
+they queue behind the concurrency limit; with it, identical prompts in
+flight share one call.
+
+Usage: python -m benchmarks.bench_single_flight [--students 60] [--questions 3] [--latency 1.5] [--max-in-flight 8]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.common import FakeGeminiModel, install_services, prepare_workspace, summarize
+
+async def _burst(client, popular, students: int):
+    rng = random.Random(3)
+    latencies = []
+
+    async def student():
+        question = rng.choice(popular)
+        await asyncio.sleep(rng.random() * 0.05)
+        started = time.perf_counter()
+        response = await client.post("/api/questions/ask", json={"question": question, "context": None})
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(student() for _ in range(students)))
+    return summarize(latencies)
+
+async def main(students: int, questions: int, latency: float, max_in_flight: int):
+    os.environ["GEMINI_MAX_CONCURRENT_REQUESTS"] = str(max_in_flight)
+    prepare_workspace()
+
+    import httpx
+    import main as backend
+    from services.single_flight import SingleFlight
+
+    services = await install_services(backend.app)
+    gemini = services.gemini_service
+
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        response = await client.get("/api/questions/popular-questions")
+        categories = response.json()["data"]["categories"]
+        popular = [question for category in categories.values() for question in category][:questions]
+
+        results = []
+        for label, single_flight in [("per-request calls", None), ("single-flight", SingleFlight())]:
+            gemini.single_flight = single_flight
+            model = FakeGeminiModel(latency_seconds=latency, payload="An explanation with an example. " * 20)
+            gemini.model = model
+            results.append((label, await _burst(client, popular, students), model.calls, single_flight))
+
+    await services.shutdown()
+
+    print(f"\n== {students} students, {questions} popular questions, model latency {latency}s, {max_in_flight} calls in flight ==")
+    for label, summary, calls, single_flight in results:
+        print(f"{label:<18} p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms model calls={calls}")
+        if single_flight is not None:
+            print(f"single-flight stats: {single_flight.get_stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=60)
+    parser.add_argument("--questions", type=int, default=3, help="How many popular questions the burst spreads over")
+    parser.add_argument("--latency", type=float, default=1.5, help="Simulated model latency in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="GEMINI_MAX_CONCURRENT_REQUESTS")
+    args = parser.parse_args()
+    asyncio.run(main(args.students, args.questions, args.latency, args.max_in_flight))
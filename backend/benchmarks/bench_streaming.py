@@ -0,0 +1,121 @@
+"""
+Time to first content: buffered endpoints vs their Server-Sent Events variants
+
+Serves the app with uvicorn on a local port (an in-process ASGI transport
+would buffer the whole body) and compares /api/questions/ask and
+/api/evaluation/submit-answer with /ask/stream and /submit-answer/stream
+against a simulated model that streams its output in chunks.
+
+Usage: python -m benchmarks.bench_streaming [--requests 40] [--latency 3.0] [--first-chunk 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import time
+
+from benchmarks.common import FAKE_EVALUATION, FakeGeminiModel, install_services, prepare_workspace, summarize
+
+ANSWER_TEXT = (
+    "A REST API exposes resources through URLs and standard HTTP verbs. "
+    "Requests are stateless, responses are cacheable, and representations are usually JSON. "
+) * 15
+
+# Feedback first, in the order the evaluation prompt asks for
+EVALUATION = {
+    "detailed_feedback": "The answer covers the main trade-offs and gives a concrete example. " * 10,
+    **{key: value for key, value in FAKE_EVALUATION.items() if key != "detailed_feedback"}
+}
+
+async def _timed_request(client, path: str, **kwargs):
+    """(seconds to first streamed text or full body, seconds to completion)"""
+    started = time.perf_counter()
+    first = None
+    async with client.stream("POST", path, **kwargs) as response:
+        response.raise_for_status()
+        streaming = response.headers.get("content-type", "").startswith("text/event-stream")
+        async for line in response.aiter_lines():
+            if first is None and streaming and line.startswith("data:") and '"text"' in line:
+                first = time.perf_counter() - started
+    total = time.perf_counter() - started
+    return (first if first is not None else total), total
+
+async def _run(client, path: str, requests: int, concurrency: int, body_for):
+    semaphore = asyncio.Semaphore(concurrency)
+    firsts, totals = [], []
+
+    async def one(index: int):
+        async with semaphore:
+            first, total = await _timed_request(client, path, **body_for(index))
+            firsts.append(first)
+            totals.append(total)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return summarize(firsts), summarize(totals)
+
+async def main(requests: int, concurrency: int, latency: float, first_chunk: float):
+    prepare_workspace()
+
+    import httpx
+    import uvicorn
+    import main as backend
+
+    services = await install_services(backend.app)
+    gemini = services.gemini_service
+    gemini.evaluation_cache = None  # Every submission should reach the model
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(backend.app, lifespan="off", log_level="warning"))
+    server_task = asyncio.create_task(server.serve(sockets=[sock]))
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    session_ids = [await services.interview_service.create_interview_session() for _ in range(requests)]
+
+    def ask_body(index: int):
+        return {"json": {"question": f"Explain REST APIs ({index})", "context": None}}
+
+    def answer_body(index: int):
+        return {"json": {
+            "session_id": session_ids[index],
+            "question_id": 1,
+            "question_text": "Design a URL shortener.",
+            "answer_text": f"I would hash the URL and store it in a key-value store ({index}).",
+            "response_time_seconds": 60
+        }}
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=None) as client:
+        results = []
+        for label, path, payload, body_for in [
+            ("/ask", "/api/questions/ask", ANSWER_TEXT, ask_body),
+            ("/ask/stream", "/api/questions/ask/stream", ANSWER_TEXT, ask_body),
+            ("/submit-answer", "/api/evaluation/submit-answer", EVALUATION, answer_body),
+            ("/submit-answer/stream", "/api/evaluation/submit-answer/stream", EVALUATION, answer_body),
+        ]:
+            gemini.model = FakeGeminiModel(
+                latency_seconds=latency,
+                payload=payload if isinstance(payload, str) else json.dumps(payload),
+                first_chunk_seconds=first_chunk
+            )
+            first, total = await _run(client, path, requests, concurrency, body_for)
+            results.append((label, first, total))
+
+    server.should_exit = True
+    await server_task
+    await services.shutdown()
+
+    print(f"\n== {requests} requests per endpoint, {concurrency} concurrent, model {first_chunk}s to first chunk / {latency}s total ==")
+    for label, first, total in results:
+        print(f"{label:<22} first text p50={first['p50_ms']}ms p95={first['p95_ms']}ms   complete p50={total['p50_ms']}ms p95={total['p95_ms']}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=3.0, help="Simulated total model latency in seconds")
+    parser.add_argument("--first-chunk", type=float, default=0.25, help="Simulated time to the first streamed chunk")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency, args.first_chunk))
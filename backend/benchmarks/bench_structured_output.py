@@ -0,0 +1,136 @@
+"""
+Fallback rate and model calls with malformed model output, bracket slicing vs the structured output parser
+
+The simulated model wraps its JSON in the mistakes real responses contain:
+code fences, trailing commas, unescaped quotes, raw newlines, Python
+literals, prose with braces after the JSON, and truncation. The same
+responses are parsed the old way (slice from the first to the last bracket,
+json.loads) and with StructuredOutputParser, which repairs locally and sends
+what it can't repair back with a short fix-up prompt.
+
+Usage: python -m benchmarks.bench_structured_output [--calls 400] [--malformed-rate 0.3] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+
+from benchmarks.common import FAKE_EVALUATION, FakeGeminiModel, fake_questions, install_services, prepare_workspace
+from services.fake_model import FakeResponse
+
+def _corrupt(payload: str, mistake: str) -> str:
+    if mistake == "code fence":
+        return f"Here is the result:\n```json\n{payload}\n```"
+    if mistake == "trailing comma":
+        return payload.replace("]", ",]").replace("}", ",}", 1)
+    if mistake == "unescaped quote":
+        return payload.replace("room for more", 'room for "more"').replace("a problem", 'a "hard" problem')
+    if mistake == "raw newline":
+        return payload.replace(". ", ".\n").replace("Generated", "Generated\n")
+    if mistake == "python literals":
+        return payload.replace("[]", "[None]").replace('"medium"', "'medium'")
+    if mistake == "trailing prose":
+        return payload + "\n\nNote: scores use the {0-100} scale."
+    if mistake == "truncated":
+        return payload[:int(len(payload) * 0.8)]
+    return payload
+
+MISTAKES = ["code fence", "trailing comma", "unescaped quote", "raw newline", "python literals", "trailing prose", "truncated"]
+
+class MalformedOutputModel(FakeGeminiModel):
+    """Returns the payload with one of MISTAKES in a `mistake_rate` share of calls; fix-up prompts get clean JSON
+
+    MISTAKES is a wider set than FakeModelBackend's own malformations, so
+    the backend's `malformed_rate` stays 0 here.
+    """
+
+    def __init__(self, mistake_rate: float, **kwargs):
+        super().__init__(**kwargs)
+        self.mistake_rate = mistake_rate
+        self.fix_calls = 0
+        self._mistakes = random.Random(11)
+
+    async def generate_content_async(self, prompt, stream: bool = False, **kwargs):
+        response = await super().generate_content_async(prompt, stream=stream, **kwargs)
+        if "does not match the expected fields" in prompt:
+            self.fix_calls += 1
+            return response
+        if self._mistakes.random() < self.mistake_rate:
+            return FakeResponse(_corrupt(self.payload, self._mistakes.choice(MISTAKES)))
+        return response
+
+class BracketSliceParser:
+    """The parsing GeminiService used before: first to last bracket, json.loads, no validation"""
+
+    reprompt_enabled = False
+
+    async def parse_or_fix(self, text: str, kind: str, fix) -> object:
+        opener, closer = ("[", "]") if kind == "questions" else ("{", "}")
+        start, end = text.find(opener), text.rfind(closer) + 1
+        if start < 0 or end <= start:
+            raise ValueError("Invalid JSON response from Gemini")
+        return json.loads(text[start:end])
+
+    def get_stats(self):
+        return {}
+
+async def _run(gemini, calls: int, kind: str):
+    """(fallbacks, seconds) for `calls` evaluations or question generations"""
+    fallback_feedback = gemini._get_fallback_evaluation("")["detailed_feedback"]
+    fallbacks = 0
+    started = time.perf_counter()
+
+    async def one(index: int):
+        nonlocal fallbacks
+        if kind == "evaluation":
+            result = await gemini.evaluate_answer(f"Question {index}", "An answer long enough to evaluate.", "Backend Developer", "2-3")
+            fallbacks += result["detailed_feedback"] == fallback_feedback
+        else:
+            result = await gemini.generate_interview_questions("Backend Developer", "2-3", "medium", question_count=10)
+            fallbacks += len(result) == 2 and result[0]["question"].startswith("Tell me about yourself")
+
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return fallbacks, time.perf_counter() - started
+
+async def main(calls: int, malformed_rate: float, latency: float):
+    prepare_workspace()
+    logging.disable(logging.CRITICAL)  # Every malformed response is logged
+
+    import main as backend
+
+    services = await install_services(backend.app)
+    gemini = services.gemini_service
+    gemini.evaluation_cache = None
+    gemini.question_cache = None
+    parser = gemini.output_parser
+
+    results = []
+    for kind, payload in [("evaluation", FAKE_EVALUATION), ("questions", fake_questions(10))]:
+        for label, output_parser in [("bracket slice", BracketSliceParser()), ("structured parser", parser)]:
+            gemini.output_parser = output_parser
+            model = MalformedOutputModel(malformed_rate, latency_seconds=latency, payload=payload)
+            gemini.model = model
+            fallbacks, seconds = await _run(gemini, calls, kind)
+            results.append((kind, label, fallbacks, model.calls, model.fix_calls, seconds))
+
+    await services.shutdown()
+
+    print(f"\n== {calls} calls per kind, {malformed_rate:.0%} malformed responses, model latency {latency}s ==")
+    for kind, label, fallbacks, model_calls, fix_calls, seconds in results:
+        # Each fallback wastes the call it replaced, and the user usually asks again
+        print(
+            f"{kind:<10} {label:<18} fallbacks={fallbacks:<4} ({fallbacks / calls:.1%})  "
+            f"model calls={model_calls} (fix-up {fix_calls})  {seconds:.2f}s"
+        )
+    print(f"parser stats: {json.dumps(parser.get_stats())}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--malformed-rate", type=float, default=0.3, help="Share of responses with a JSON mistake")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.malformed_rate, args.latency))
@@ -0,0 +1,181 @@
+"""
+Shared helpers for backend benchmarks
+Workspace setup, a fixed-reply wrapper of the fake model backend, and timing utilities
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from services.fake_model import FakeModelBackend, FakeResponse  # noqa: E402
+
+FAKE_EVALUATION = {
+    "overall_score": 78,
+    "scores": {
+        "technical_accuracy": 80,
+        "communication_clarity": 75,
+        "depth_of_knowledge": 70,
+        "problem_solving": 82,
+        "confidence": 77
+    },
+    "strengths": ["Clear structure"],
+    "weaknesses": ["Few concrete examples"],
+    "detailed_feedback": "Solid answer with room for more depth.",
+    "improvement_suggestions": ["Quantify the impact of your work"],
+    "follow_up_questions": ["How would you measure success here?"],
+    "red_flags": [],
+    "positive_indicators": ["Understands the fundamentals"]
+}
+
+def fake_questions(count: int = 10) -> List[Dict[str, Any]]:
+    """A generated question set as the question prompt asks for it"""
+    question_types = ["technical", "behavioral", "situational"]
+    return [
+        {
+            "id": i,
+            "question": f"Generated question {i}: walk me through a problem you solved.",
+            "type": question_types[i % len(question_types)],
+            "difficulty": "medium",
+            "follow_ups": ["What would you do differently?"],
+            "evaluation_criteria": ["Clarity", "Depth"],
+            "expected_topics": ["Design", "Trade-offs"]
+        }
+        for i in range(1, count + 1)
+    ]
+
+def prepare_workspace() -> Path:
+    """Run the backend against a throwaway data directory"""
+    os.environ.setdefault("GOOGLE_AI_API_KEY", "benchmark-key")
+    # Measure the backend, not the API quota; bench_model_limiter sets its own limits
+    os.environ.setdefault("GEMINI_MAX_CONCURRENT_REQUESTS", "100000")
+    os.environ.setdefault("GEMINI_REQUESTS_PER_MINUTE", "0")
+    os.environ.setdefault("GEMINI_TOKENS_PER_MINUTE", "0")
+    # Benchmarks send identical prompts on purpose; bench_single_flight turns coalescing on itself
+    os.environ.setdefault("GEMINI_SINGLE_FLIGHT_ENABLED", "False")
+    logging.disable(logging.INFO)
+    workspace = Path(tempfile.mkdtemp(prefix="interview_bench_"))
+    os.chdir(workspace)
+    return workspace
+
+async def install_services(app, **overrides):
+    """Attach a service container to the app without running the lifespan
+
+    Benchmarks build the container themselves so that, once it has started,
+    they can swap in a model with fixed replies and their own latency.
+    """
+    from services.container import ServiceContainer
+
+    services = ServiceContainer(**overrides)
+    await services.startup()
+    app.state.services = services
+    return services
+
+class FakeGeminiModel(FakeModelBackend):
+    """The fake model backend with a fixed reply, as most benchmarks want
+
+    Every prompt gets `payload` after `latency_seconds`; latency, injected
+    503/429/500 failures (`failure_rate`), streaming and token usage are
+    FakeModelBackend's. Streaming calls return the payload in
+    `stream_chunks` pieces, the first after `first_chunk_seconds`. With
+    blocking=True the async entry point sleeps synchronously, which
+    reproduces the old behaviour of calling generate_content on the event loop.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.2,
+        blocking: bool = False,
+        payload: Any = None,
+        failure_rate: float = 0.0,
+        seed: int = 1,
+        first_chunk_seconds: float = None,
+        stream_chunks: int = 20
+    ):
+        super().__init__(
+            latency_ms=latency_seconds * 1000,
+            latency_distribution="fixed",
+            error_rate=failure_rate,
+            seed=seed,
+            stream_chunks=stream_chunks,
+            first_chunk_seconds=min(latency_seconds, 0.2) if first_chunk_seconds is None else first_chunk_seconds
+        )
+        self.blocking = blocking
+        self.payload = payload if isinstance(payload, str) else json.dumps(payload or FAKE_EVALUATION)
+
+    def reply(self, prompt: str, kind: str) -> str:
+        return self.payload
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        time.sleep(self.sample_latency())
+        return FakeResponse(self.payload)
+
+    async def generate_content_async(self, prompt, stream: bool = False, **kwargs):
+        if self.blocking:
+            return self.generate_content(prompt)
+        return await super().generate_content_async(prompt, stream=stream, **kwargs)
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes a periodic timer"""
+
+    def __init__(self, interval_seconds: float = 0.01):
+        self.interval_seconds = interval_seconds
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+def count_store_writes(store) -> Dict[str, int]:
+    """Wrap store.save so every write to disk is counted"""
+    counter = {"writes": 0}
+    original_save = store.save
+
+    async def counting_save(session_id, session_data):
+        counter["writes"] += 1
+        await original_save(session_id, session_data)
+
+    store.save = counting_save
+    return counter
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile, 0 for an empty sample"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/max in milliseconds"""
+    return {
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1) if values else 0.0
+    }
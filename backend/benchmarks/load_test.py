@@ -0,0 +1,294 @@
+"""
+End-to-end load test of the interview flow against the fake model backend
+
+Virtual users run complete interviews through the real app, lifespan
+included: setup, one submit-answer per question, report generation and
+analytics. The model is the deterministic fake backend (GEMINI_BACKEND=fake),
+so runs are repeatable and need no API key. Results can be saved as a
+baseline and later runs compared against it, so that a regression in
+SessionService, InterviewService or the routes shows up as a number.
+
+Usage: python -m benchmarks.load_test [--interviews 100] [--users 10] [--answers 5] [--latency-ms 200] [--save-baseline] [--compare] [--check]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.common import LoopLagMonitor, count_store_writes, prepare_workspace, summarize
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "load_test.json"
+
+ENDPOINTS = [
+    "POST /api/interview/setup",
+    "POST /api/evaluation/submit-answer",
+    "POST /api/reports/generate",
+    "GET /api/reports/analytics/{session_id}"
+]
+
+ROLES = ["Backend Developer", "Frontend Developer", "Data Scientist", "DevOps Engineer"]
+EXPERIENCE_LEVELS = ["0-1", "1-2", "2-3", "3-5", "5+"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+ANSWER_PHRASES = [
+    "I would start by measuring where the time actually goes",
+    "we added an index on the hot query and the p95 dropped",
+    "the trade-off was consistency against write latency",
+    "I explained the risk to the team and we agreed on a rollback plan",
+    "caching the read path helped but invalidation needed care",
+    "I wrote a small benchmark before changing anything"
+]
+
+class LoadRecorder:
+    """Per-endpoint latencies and failures"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {endpoint: [] for endpoint in ENDPOINTS}
+        self.errors: Dict[str, int] = {endpoint: 0 for endpoint in ENDPOINTS}
+
+    async def request(self, client, endpoint: str, path: str, **kwargs):
+        """Send one request and record its latency under the endpoint's route template"""
+        method = endpoint.split(" ", 1)[0]
+        started = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        return response.json()
+
+    @property
+    def requests(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+async def _interview(client, recorder: LoadRecorder, rng: random.Random, answers: int) -> bool:
+    """One candidate's full interview; False if it could not be completed"""
+    setup = await recorder.request(client, ENDPOINTS[0], "/api/interview/setup", json={
+        "role": rng.choice(ROLES),
+        "experience_level": rng.choice(EXPERIENCE_LEVELS),
+        "difficulty": rng.choice(DIFFICULTIES),
+        "question_count": max(5, answers)
+    })
+    if setup is None:
+        return False
+    session_id = setup["session_id"]
+
+    for question in setup["questions"][:answers]:
+        answer = ". ".join(rng.sample(ANSWER_PHRASES, rng.randint(1, len(ANSWER_PHRASES)))) + "."
+        await recorder.request(client, ENDPOINTS[1], "/api/evaluation/submit-answer", json={
+            "session_id": session_id,
+            "question_id": question["id"],
+            "question_text": question["question"],
+            "answer_text": answer,
+            "response_time_seconds": rng.randint(20, 180)
+        })
+
+    report = await recorder.request(client, ENDPOINTS[2], "/api/reports/generate", json={"session_id": session_id})
+    analytics = await recorder.request(client, ENDPOINTS[3], f"/api/reports/analytics/{session_id}")
+    return report is not None and analytics is not None
+
+def _rss_bytes() -> int:
+    """Current resident set size, or the peak where psutil is unavailable"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return _peak_rss_bytes()
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _disk_write_bytes() -> int:
+    """Bytes this process has written to storage, 0 where the platform doesn't report it"""
+    try:
+        import psutil
+        return psutil.Process().io_counters().write_bytes
+    except (ImportError, AttributeError, NotImplementedError):
+        return 0
+
+async def run_load(interviews: int, users: int, answers: int, seed: int) -> Dict[str, Any]:
+    """Run the interviews through the app and collect the results"""
+    import httpx
+    import main as backend
+
+    app = backend.app
+    recorder = LoadRecorder()
+    completed = 0
+    queue = list(range(interviews))
+
+    async with app.router.lifespan_context(app):
+        services = app.state.services
+        writes = count_store_writes(services.session_service.store)
+
+        async def user(user_id: int):
+            nonlocal completed
+            rng = random.Random(seed * 1000 + user_id)
+            while queue:
+                queue.pop()
+                if await _interview(client, recorder, rng, answers):
+                    completed += 1
+
+        monitor = LoopLagMonitor()
+        rss_before = _rss_bytes()
+        disk_before = _disk_write_bytes()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            monitor.start()
+            started = time.perf_counter()
+            await asyncio.gather(*(user(user_id) for user_id in range(users)))
+            elapsed = time.perf_counter() - started
+            await monitor.stop()
+        model_stats = services.gemini_service.get_stats()
+        rss_after = _rss_bytes()
+
+    disk_written = _disk_write_bytes() - disk_before
+    fake_model = model_stats.get("fake_model") or {}
+    lag = summarize(monitor.samples)
+    return {
+        "duration_s": round(elapsed, 3),
+        "interviews_completed": completed,
+        "requests": recorder.requests,
+        "requests_per_second": round(recorder.requests / elapsed, 1),
+        "interviews_per_second": round(completed / elapsed, 2),
+        "endpoints": {
+            endpoint: dict(summarize(values), count=len(values), errors=recorder.errors[endpoint])
+            for endpoint, values in recorder.latencies.items()
+        },
+        "loop_lag": lag,
+        # Read after shutdown so the writes flushed on close are counted too
+        "session_writes": writes["writes"],
+        "session_writes_per_interview": round(writes["writes"] / completed, 2) if completed else 0.0,
+        "disk_write_bytes": disk_written,
+        "rss_before_mb": round(rss_before / 2**20, 1),
+        "rss_after_mb": round(rss_after / 2**20, 1),
+        "rss_peak_mb": round(_peak_rss_bytes() / 2**20, 1),
+        "model_calls": fake_model.get("calls", 0),
+        "model_errors": fake_model.get("injected_errors", 0),
+        "unparseable_outputs": sum(kind["failed"] for kind in model_stats["structured_output"].values())
+    }
+
+def _comparable(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Metric name -> (value, True if bigger is better, smallest difference that counts)"""
+    metrics = {
+        "requests_per_second": (results["requests_per_second"], True, 1.0),
+        "loop_lag p99_ms": (results["loop_lag"]["p99_ms"], False, 2.0),
+        "session_writes_per_interview": (results["session_writes_per_interview"], False, 0.5),
+        "rss_after_mb": (results["rss_after_mb"], False, 5.0)
+    }
+    for endpoint, summary in results["endpoints"].items():
+        # p99 of a few hundred requests is too noisy to gate on
+        for key in ("p50_ms", "p95_ms"):
+            metrics[f"{endpoint} {key}"] = (summary[key], False, 2.0)
+    return metrics
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print each metric against the baseline; returns the ones worse by more than the tolerance"""
+    regressions = []
+    before = _comparable(baseline["results"])
+    print(f"\n== against baseline saved {baseline['saved_at']} (tolerance {tolerance:.0%}) ==")
+    for name, (value, higher_is_better, min_delta) in _comparable(results).items():
+        if name not in before:
+            continue
+        old = before[name][0]
+        change = (value - old) / old if old else 0.0
+        worse = (old - value) if higher_is_better else (value - old)
+        regressed = worse > min_delta and worse > abs(old) * tolerance
+        marker = "REGRESSION" if regressed else ""
+        print(f"{name:<58} {old:>10} -> {value:<10} {change:+.1%} {marker}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+def _print_results(config: Dict[str, Any], results: Dict[str, Any]):
+    print(
+        f"\n== {config['interviews']} interviews, {config['users']} users, {config['answers']} answers each, "
+        f"fake model {config['latency_ms']}ms ({config['error_rate']:.0%} errors, {config['malformed_rate']:.0%} malformed) =="
+    )
+    print(
+        f"{results['requests']} requests in {results['duration_s']}s: {results['requests_per_second']} req/s, "
+        f"{results['interviews_per_second']} interviews/s, {results['interviews_completed']} completed"
+    )
+    for endpoint, summary in results["endpoints"].items():
+        print(
+            f"{endpoint:<42} n={summary['count']:<5} errors={summary['errors']:<3} "
+            f"p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms"
+        )
+    lag = results["loop_lag"]
+    print(f"event-loop lag p50={lag['p50_ms']}ms p99={lag['p99_ms']}ms max={lag['max_ms']}ms")
+    print(
+        f"session writes={results['session_writes']} ({results['session_writes_per_interview']}/interview), "
+        f"disk written={results['disk_write_bytes'] / 2**20:.1f}MB"
+    )
+    print(f"RSS {results['rss_before_mb']}MB -> {results['rss_after_mb']}MB (peak {results['rss_peak_mb']}MB)")
+    print(
+        f"model calls={results['model_calls']} injected errors={results['model_errors']} "
+        f"unparseable outputs={results['unparseable_outputs']}"
+    )
+
+async def main(args) -> int:
+    config = {
+        "interviews": args.interviews,
+        "users": args.users,
+        "answers": args.answers,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "malformed_rate": args.malformed_rate,
+        "seed": args.seed
+    }
+    os.environ["GEMINI_BACKEND"] = "fake"
+    os.environ["FAKE_MODEL_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["FAKE_MODEL_ERROR_RATE"] = str(args.error_rate)
+    os.environ["FAKE_MODEL_MALFORMED_RATE"] = str(args.malformed_rate)
+    os.environ["FAKE_MODEL_SEED"] = str(args.seed)
+    # Background prefetching would add model calls that no request waits for
+    os.environ.setdefault("QUESTION_BANK_ENABLED", "False")
+    prepare_workspace()
+
+    results = await run_load(args.interviews, args.users, args.answers, args.seed)
+    _print_results(config, results)
+
+    baseline_path = Path(args.baseline)
+    regressions = []
+    if args.compare:
+        if not baseline_path.exists():
+            print(f"\nNo baseline at {baseline_path}; run with --save-baseline first")
+        else:
+            baseline = json.loads(baseline_path.read_text())
+            if baseline["config"] != config:
+                print(f"\nBaseline was recorded with a different configuration: {baseline['config']}")
+            regressions = compare(baseline, results, args.tolerance)
+            print(f"{len(regressions)} regression(s)" if regressions else "No regressions")
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline = {"saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "config": config, "results": results}
+        baseline_path.write_text(json.dumps(baseline, indent=2))
+        print(f"\nBaseline saved to {baseline_path}")
+
+    return 1 if args.check and regressions else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interviews", type=int, default=100, help="Complete interviews to run")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users running interviews concurrently")
+    parser.add_argument("--answers", type=int, default=5, help="Answers submitted per interview")
+    parser.add_argument("--latency-ms", type=int, default=200, help="FAKE_MODEL_LATENCY_MS")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="FAKE_MODEL_ERROR_RATE")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="FAKE_MODEL_MALFORMED_RATE")
+    parser.add_argument("--seed", type=int, default=42, help="FAKE_MODEL_SEED and the virtual users' answers")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run's results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare this run against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative change that counts as a regression")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if --compare finds a regression")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,99 @@
+"""
+Per-route span breakdown and critical paths from a TRACING_EXPORTER=jsonl file
+
+For each route it prints how many traces there were, their p50/p95
+duration, and the mean time per span name as a share of the request
+(inclusive, so nested layers add up to more than 100%). The slowest
+trace of each route is then printed as its critical path. Under each
+span, this path starts at the child that finished last and steps back to
+the child that finished before that one started. Children running
+alongside those are left out. Spans outside any request, such as
+write-behind session saves, are summarised at the end.
+
+Usage: python -m benchmarks.trace_report [logs/traces/spans.jsonl] [--route "POST /api/evaluation/submit-answer"] [--top 12]
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.common import percentile
+
+def load_traces(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """Spans grouped by trace ID"""
+    traces = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                span = json.loads(line)
+                traces[span["trace_id"]].append(span)
+    return traces
+
+def _root(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ids = {span["span_id"] for span in spans}
+    roots = [span for span in spans if span["parent_span_id"] not in ids]
+    return min(roots, key=lambda span: span["start_time_unix_nano"])
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """(depth, span) pairs of the spans the root was waiting on, in start order"""
+    children = defaultdict(list)
+    for span in spans:
+        children[span["parent_span_id"]].append(span)
+
+    def walk(span: Dict[str, Any], depth: int) -> List[Tuple[int, Dict[str, Any]]]:
+        chain = []
+        until = span["end_time_unix_nano"]
+        for child in sorted(children.get(span["span_id"], []), key=lambda child: -child["end_time_unix_nano"]):
+            if child["end_time_unix_nano"] <= until:
+                chain.append(child)
+                until = child["start_time_unix_nano"]
+        path = [(depth, span)]
+        for child in reversed(chain):
+            path.extend(walk(child, depth + 1))
+        return path
+
+    return walk(_root(spans), 0)
+
+def report(traces: Dict[str, List[Dict[str, Any]]], route_filter: str = None, top: int = 12):
+    by_route = defaultdict(list)
+    background = defaultdict(list)
+    for spans in traces.values():
+        root = _root(spans)
+        if root["kind"] != "server":
+            background[root["name"]].append(root["duration_ms"])
+        elif route_filter is None or root["name"] == route_filter:
+            by_route[root["name"]].append(spans)
+
+    for route, route_traces in sorted(by_route.items(), key=lambda item: -len(item[1])):
+        durations = [_root(spans)["duration_ms"] for spans in route_traces]
+        total = sum(durations)
+        print(f"\n== {route}: {len(route_traces)} traces, p50={percentile(durations, 50):.1f}ms p95={percentile(durations, 95):.1f}ms ==")
+
+        per_name = defaultdict(float)
+        for spans in route_traces:
+            for span in spans:
+                per_name[span["name"]] += span["duration_ms"]
+        print(f"{'span':<52} {'mean ms':>9} {'of request':>11}")
+        for name, spent in sorted(per_name.items(), key=lambda item: -item[1])[:top]:
+            print(f"{name:<52} {spent / len(route_traces):>9.2f} {spent / total:>10.0%}")
+
+        slowest = max(route_traces, key=lambda spans: _root(spans)["duration_ms"])
+        print(f"critical path of the slowest ({max(durations):.1f}ms):")
+        for depth, span in critical_path(slowest):
+            detail = f" [{span['error']}]" if span.get("error") else ""
+            print(f"  {'  ' * depth}{span['name']} {span['duration_ms']:.2f}ms{detail}")
+
+    if background and route_filter is None:
+        print("\n== outside requests ==")
+        for name, durations in sorted(background.items(), key=lambda item: -sum(item[1])):
+            print(f"{name:<52} {len(durations):>5}x p50={percentile(durations, 50):.2f}ms p95={percentile(durations, 95):.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?", default="logs/traces/spans.jsonl")
+    parser.add_argument("--route", help='Only this root span, e.g. "POST /api/interview/setup"')
+    parser.add_argument("--top", type=int, default=12, help="Span names listed per route")
+    args = parser.parse_args()
+    report(load_traces(Path(args.path)), args.route, args.top)
@@ -39,10 +39,55 @@ class Settings(BaseSettings):
     ]
     
     # Google AI (Gemini) settings
+    gemini_backend: str = "gemini"  # gemini | fake (local stand-in, no API key needed)
     google_ai_api_key: str = ""
     gemini_model_name: str = "gemini-1.5-flash"
     gemini_temperature: float = 0.7
     gemini_max_tokens: int = 2048
+    gemini_timeout_seconds: float = 30.0
+    gemini_max_concurrent_requests: int = 8
+    gemini_requests_per_minute: float = 60.0
+    gemini_tokens_per_minute: float = 1000000.0  # Prompt tokens, estimated; 0 disables
+    gemini_max_queue_seconds: float = 60.0
+    gemini_call_budget_seconds: float = 60.0  # Queueing, attempts and backoff for one call
+    gemini_breaker_failure_threshold: int = 5
+    gemini_breaker_recovery_seconds: float = 30.0
+    gemini_single_flight_enabled: bool = True  # Identical concurrent prompts share one call
+    structured_output_reprompt_enabled: bool = True  # Ask the model to fix JSON that can't be repaired locally
+    
+    # Fake model backend (GEMINI_BACKEND=fake) for load tests and CI
+    fake_model_latency_ms: float = 800.0  # Mean; median for lognormal
+    fake_model_latency_distribution: str = "lognormal"  # fixed | uniform | normal | lognormal | exponential
+    fake_model_latency_jitter: float = 0.3  # Relative spread (sigma for lognormal)
+    fake_model_error_rate: float = 0.0  # Share of calls failing with a retryable 503/429/500
+    fake_model_malformed_rate: float = 0.0  # Share of JSON replies with a formatting mistake
+    fake_model_seed: int = 42
+    
+    # Generated question sets cached per role/experience/difficulty (no resume)
+    question_cache_enabled: bool = True
+    question_cache_path: str = "data/cache/question_cache.json"
+    question_cache_ttl_hours: float = 168.0
+    question_cache_max_keys: int = 500
+    question_cache_pool_size: int = 5
+    question_cache_save_interval_seconds: float = 30.0  # New sets are written in the background, not per request
+    
+    # Background worker keeping question sets ready for standard configurations; spends Gemini quota
+    question_bank_enabled: bool = False
+    question_bank_target_sets: int = 2
+    question_bank_low_water_mark: int = 1
+    question_bank_roles: str = ""  # Comma-separated InterviewConfig.JOB_ROLES to bank, or "all"; nothing is prefetched while empty
+    question_bank_refill_interval_seconds: float = 300.0
+    question_bank_concurrency: int = 2
+    
+    # Evaluations reused for identical or near-identical answers to the same question
+    evaluation_cache_enabled: bool = True
+    evaluation_cache_max_entries: int = 5000
+    evaluation_cache_similarity_threshold: float = 0.9
+    evaluation_cache_excluded_roles: str = ""  # Comma-separated roles always evaluated fresh
+    
+    # Follow-up questions generated while the answer is being evaluated; only
+    # worth the extra model call for clients that fetch follow-ups
+    speculative_follow_ups_enabled: bool = False
     
     # Interview configuration
     default_question_count: int = 10
@@ -50,15 +95,40 @@ class Settings(BaseSettings):
     min_answer_length: int = 10
     max_answer_length: int = 5000
     session_timeout_minutes: int = 120
+    session_sweep_interval_seconds: float = 60.0
     
     # Data storage
     data_directory: str = "data"
     session_storage_path: str = "data/sessions"
     reports_storage_path: str = "data/reports"
+    session_store_backend: str = "json"  # json | sqlite
+    database_url: str = ""  # Defaults to DatabaseConfig.SQLITE_URL
+    session_flush_interval_seconds: float = 1.0
+    session_max_dirty_age_seconds: float = 5.0
+    session_access_persist_interval_seconds: float = 60.0
+    session_lazy_loading: bool = False
+    session_cache_size: int = 10000
     
     # Logging configuration
     log_level: str = "INFO"
     log_file_path: str = "logs/app.log"
+    metrics_enabled: bool = True  # Request/model metrics middleware and the /metrics endpoint
+    
+    # Opt-in request profiling (X-Profile: 1 with X-Admin-Token); disabled while the token is empty
+    profiling_admin_token: str = ""
+    profiling_directory: str = "logs/profiles"
+    profiling_format: str = "speedscope"  # speedscope | collapsed
+    profiling_interval_ms: float = 5.0
+    profiling_max_profiles: int = 50
+    
+    # Span tracing across routes and services, exported in batches
+    tracing_enabled: bool = False
+    tracing_exporter: str = "jsonl"  # jsonl | otlp
+    tracing_jsonl_path: str = "logs/traces/spans.jsonl"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP JSON
+    tracing_sample_rate: float = 1.0  # Share of requests traced
+    tracing_flush_interval_seconds: float = 2.0
+    tracing_max_buffered_spans: int = 10000  # Spans beyond this between flushes are dropped
     
     # Security settings
     secret_key: str = "your-secret-key-here-change-in-production"
@@ -193,9 +263,9 @@ class AIConfig:
         "backoff_factor": 2
     }
 
-# Database configuration (if using database in future)
+# Database configuration (used by the SQLite session store)
 class DatabaseConfig:
-    """Database configuration for future use"""
+    """Database configuration for SESSION_STORE_BACKEND=sqlite"""
     
     # SQLite for development
     SQLITE_URL = "sqlite:///./interview_data.db"
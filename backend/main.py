@@ -6,17 +6,19 @@ AI Provider: Google Gemini (Google AI SDK)
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 import uvicorn
 import logging
 from contextlib import asynccontextmanager
 
 # Import our modules
 from config.settings import get_settings
-from services.gemini_service import GeminiService
 from services.session_service import SessionService
-from services.interview_service import InterviewService
-from routes import auth, interview, evaluation, reports, user_questions
+from services.container import ServiceContainer, get_container, get_session_service
+from services.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from services.profiler import ProfileStore, ProfilingMiddleware
+from services.tracing import TracingMiddleware, create_exporter, tracer
+from routes import admin, auth, interview, evaluation, reports, user_questions
 from models.api_models import *
 
 # Configure logging
@@ -25,30 +27,49 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Initialize services (will be available globally)
-gemini_service = GeminiService()
-session_service = SessionService()
-interview_service = InterviewService(gemini_service, session_service)
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup
     logger.info("🚀 Starting AI Interview Backend...")
+    
+    # Spans from every layer are batched and exported in the background
+    if settings.tracing_enabled:
+        tracer.configure(
+            create_exporter(settings.tracing_exporter, settings.tracing_jsonl_path, settings.tracing_otlp_endpoint, settings.app_name),
+            sample_rate=settings.tracing_sample_rate,
+            max_buffered_spans=settings.tracing_max_buffered_spans
+        )
+        tracer.start(settings.tracing_flush_interval_seconds)
     logger.info("🤖 Initializing Gemini AI Service...")
     
+    # Services are created once per process and shared by every router
+    services = ServiceContainer()
+    await services.startup()
+    app.state.services = services
+    
+    # Expired sessions are swept in the background instead of on every stats call
+    services.session_service.start_expiry_sweeper(settings.session_sweep_interval_seconds)
+    
     # Verify Gemini connection (optional - don't fail startup if API key is invalid)
     try:
-        await gemini_service.test_connection()
+        await services.gemini_service.test_connection()
         logger.info("✅ Gemini AI connection successful")
     except Exception as e:
         logger.warning(f"⚠️  Gemini AI connection test failed: {e}")
         logger.warning("⚠️  The backend will start but AI features may not work properly")
     
+    # Keep question sets ready for every standard role/experience/difficulty
+    if services.question_bank is not None:
+        services.question_bank.start(settings.question_bank_refill_interval_seconds)
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down AI Interview Backend...")
+    await services.shutdown()
+    if settings.tracing_enabled:
+        await tracer.stop()
 
 # Create FastAPI app
 app = FastAPI(
@@ -57,6 +78,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson encodes responses much faster than stdlib json
     lifespan=lifespan
 )
 
@@ -69,35 +91,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Latency histograms per route and status, exposed on /metrics
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Server span per request; services add child spans (see services/tracing.py)
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+
+# Opt-in per-request profiles (X-Profile: 1 plus the admin token), saved under logs/profiles/
+app.state.profile_store = ProfileStore(
+    settings.profiling_directory,
+    profile_format=settings.profiling_format,
+    max_profiles=settings.profiling_max_profiles
+)
+if settings.profiling_admin_token:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=app.state.profile_store,
+        admin_token=settings.profiling_admin_token,
+        interval_seconds=settings.profiling_interval_ms / 1000
+    )
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error(f"Global exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)}
     )
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check(services: ServiceContainer = Depends(get_container)):
     """Health check endpoint to verify backend status"""
+    circuit = services.gemini_service.circuit_breaker.get_stats()
     return {
-        "status": "healthy",
+        # Still serving (with fallback AI output) while the model circuit is open
+        "status": "healthy" if circuit["state"] == "closed" and services.gemini_service.available else "degraded",
         "service": "AI Interview Backend",
         "ai_provider": "Google Gemini",
+        "ai_backend": services.gemini_service.backend,
+        "ai_available": services.gemini_service.available,
+        "ai_circuit": circuit,
         "version": "1.0.0"
     }
 
-# Dependency injection for services
-async def get_gemini_service() -> GeminiService:
-    return gemini_service
-
-async def get_session_service() -> SessionService:
-    return session_service
-
-async def get_interview_service() -> InterviewService:
-    return interview_service
+# Service metrics endpoint for monitoring scrapes
+@app.get("/stats")
+async def service_stats(services: ServiceContainer = Depends(get_container)):
+    """Counters maintained by the services; does not touch session storage"""
+    return services.get_stats()
+
+# Prometheus scrape endpoint
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def prometheus_metrics(services: ServiceContainer = Depends(get_container)):
+    """Request, model and session metrics in the Prometheus text format"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    services.collect_metrics()
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
 
 # Include all route modules
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -105,6 +159,7 @@ app.include_router(interview.router, prefix="/api/interview", tags=["Interview M
 app.include_router(evaluation.router, prefix="/api/evaluation", tags=["Answer Evaluation"])
 app.include_router(reports.router, prefix="/api/reports", tags=["Report Generation"])
 app.include_router(user_questions.router, prefix="/api/questions", tags=["General Questions"])
+app.include_router(admin.router, prefix="/api/admin", tags=["Administration"])
 
 # Legacy endpoints for frontend compatibility
 @app.post("/login")
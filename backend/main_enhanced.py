@@ -12,19 +12,57 @@ import uvicorn
 import logging
 import uuid
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """One GeminiService for the whole process instead of one per request"""
+    app.state.gemini_service = None
+    app.state.gemini_error = None
+    try:
+        from services.gemini_service import GeminiService
+        gemini_service = GeminiService()
+        await gemini_service.initialize()
+        app.state.gemini_service = gemini_service
+    except Exception as e:
+        # Follow-ups fall back to generic questions
+        app.state.gemini_error = str(e)
+        logger.warning(f"⚠️  Gemini AI unavailable, using generic follow-ups: {e}")
+    
+    if app.state.gemini_service is not None and app.state.gemini_service.available:
+        # Opens the connection now so the first answer doesn't pay for it
+        try:
+            await app.state.gemini_service.test_connection()
+        except Exception as e:
+            logger.warning(f"⚠️  Gemini AI connection test failed: {e}")
+    
+    yield
+    
+    if app.state.gemini_service is not None:
+        await app.state.gemini_service.close()
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Interview Practice Partner",
     description="Backend API for AI-powered interview practice with question progression",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+def get_gemini_service():
+    """The shared GeminiService; raises if it could not be created at startup"""
+    gemini_service = getattr(app.state, "gemini_service", None)
+    if gemini_service is None:
+        raise RuntimeError(getattr(app.state, "gemini_error", None) or "Gemini AI service is not initialized")
+    if not gemini_service.available:
+        raise RuntimeError(gemini_service.model_error)
+    return gemini_service
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -142,9 +180,7 @@ def get_current_question(session_id: str) -> Optional[Dict[str, Any]]:
 async def generate_ai_followup_question(current_question: str, user_answer: str, role: str, conversation_history: List[Dict]) -> str:
     """Generate AI-powered follow-up question based on user's answer"""
     try:
-        # Import Gemini service
-        from services.gemini_service import GeminiService
-        gemini = GeminiService()
+        gemini = get_gemini_service()
         
         # Build conversation context
         context = "\n".join([f"Q: {qa.get('question', '')}\nA: {qa.get('answer', '')}" for qa in conversation_history[-3:]])
@@ -173,7 +209,7 @@ For example:
 Respond with ONLY the follow-up question, nothing else.
 """
         
-        response = await gemini._generate_response(prompt)
+        response = await gemini._generate_response(prompt, method="follow_up")
         return response.strip()
         
     except Exception as e:
@@ -261,16 +297,15 @@ async def health_check():
 async def test_ai():
     """Test AI service availability"""
     try:
-        # Import here to check if AI service can be imported
-        from services.gemini_service import GeminiService
-        
-        # Test basic initialization
-        gemini_service = GeminiService()
+        from config.settings import get_settings
+        gemini_service = get_gemini_service()
         
         return {
             "status": "success",
             "message": "AI service is available",
-            "service": "gemini-1.5-flash"
+            "service": get_settings().gemini_model_name if gemini_service.backend == "gemini" else f"{gemini_service.backend} model",
+            "backend": gemini_service.backend,
+            "circuit": gemini_service.circuit_breaker.get_stats()["state"]
         }
     except Exception as e:
         logger.error(f"AI service test failed: {e}")
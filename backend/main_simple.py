@@ -8,16 +8,39 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import logging
+from contextlib import asynccontextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the AI service once; /test-ai reports whether that worked"""
+    app.state.gemini_service = None
+    app.state.gemini_error = None
+    try:
+        # Import here to check if AI service can be imported
+        from services.gemini_service import GeminiService
+        gemini_service = GeminiService()
+        await gemini_service.initialize()
+        app.state.gemini_service = gemini_service
+    except Exception as e:
+        app.state.gemini_error = str(e)
+        logger.warning(f"AI service unavailable: {e}")
+    
+    yield
+    
+    # Saves the question cache and stops its background tasks
+    if app.state.gemini_service is not None:
+        await app.state.gemini_service.close()
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Interview Practice Partner",
     description="Backend API for AI-powered interview practice",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -52,16 +75,18 @@ async def health_check():
 async def test_ai():
     """Test AI service availability"""
     try:
-        # Import here to check if AI service can be imported
-        from services.gemini_service import GeminiService
-        
-        # Test basic initialization
-        gemini_service = GeminiService()
+        from config.settings import get_settings
+        gemini_service = app.state.gemini_service
+        if gemini_service is None:
+            raise RuntimeError(app.state.gemini_error or "AI service is not initialized")
+        if not gemini_service.available:
+            raise RuntimeError(gemini_service.model_error)
         
         return {
             "status": "success",
             "message": "AI service is available",
-            "service": "gemini-1.5-flash"
+            "service": get_settings().gemini_model_name if gemini_service.backend == "gemini" else f"{gemini_service.backend} model",
+            "backend": gemini_service.backend
         }
     except Exception as e:
         logger.error(f"AI service test failed: {e}")
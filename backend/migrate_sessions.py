@@ -0,0 +1,37 @@
+# Session File Migration Script
+# One-shot upgrade of stored session files to the current compact format
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+def main():
+    """Rewrite legacy pretty-printed session files in the versioned orjson format"""
+    parser = argparse.ArgumentParser(description="Migrate stored session files to the current format")
+    parser.add_argument("--data-dir", help="Directory holding the session files (default: data/sessions)")
+    args = parser.parse_args()
+    data_dir = Path(args.data_dir).resolve() if args.data_dir else None
+
+    # Run from the backend directory so settings and imports resolve
+    backend_dir = Path(__file__).resolve().parent
+    os.chdir(backend_dir)
+    sys.path.insert(0, str(backend_dir))
+
+    from services.serialization import SESSION_FORMAT_VERSION
+    from services.session_store import JsonFileSessionStore
+
+    data_dir = data_dir or backend_dir / "data" / "sessions"
+    if not data_dir.is_dir():
+        print(f"❌ Session directory not found: {data_dir}")
+        sys.exit(1)
+
+    print(f"🔄 Migrating sessions in {data_dir} to format version {SESSION_FORMAT_VERSION}...")
+    counts = JsonFileSessionStore(str(data_dir)).migrate()
+    print(f"✅ Migrated: {counts['migrated']}  Already current: {counts['current']}  Failed: {counts['failed']}")
+
+    if counts["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,11 @@ class GeneralQuestionRequest(BaseModel):
     question: str = Field(..., min_length=5, max_length=500)
     context: Optional[str] = None
 
+class CodeReviewRequest(BaseModel):
+    code: str = Field(..., min_length=1)
+    language: str
+    focus_areas: Optional[List[str]] = None  # ["performance", "security", "readability", "best_practices"]
+
 class ReportGenerationRequest(BaseModel):
     session_id: str
     include_detailed_analysis: bool = True
@@ -98,6 +103,7 @@ class InterviewQuestion(BaseModel):
     follow_ups: List[str] = []
     evaluation_criteria: List[str] = []
     expected_topics: List[str] = []
+    previous_follow_up: Optional[str] = None  # Follow-up to the last answer, generated during its evaluation
 
 class QuestionGenerationResponse(BaseModel):
     success: bool
@@ -124,6 +130,7 @@ class AnswerEvaluationResponse(BaseModel):
     follow_up_questions: List[str]
     red_flags: List[str] = []
     positive_indicators: List[str] = []
+    follow_up_question: Optional[str] = None  # Set when requested with include_follow_up
 
 class GeneralQuestionResponse(BaseModel):
     success: bool
@@ -0,0 +1,48 @@
+"""
+Admin routes
+Lists and serves request profiles recorded by the profiling middleware
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import FileResponse
+import logging
+from typing import Optional
+
+from config.settings import get_settings
+from models.api_models import APIResponse
+from services.profiler import ProfileStore, is_admin_token
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+def get_profile_store(request: Request) -> ProfileStore:
+    return request.app.state.profile_store
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    """Reject requests without the configured PROFILING_ADMIN_TOKEN"""
+    if not is_admin_token(x_admin_token, get_settings().profiling_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+@router.get("/profiles", response_model=APIResponse, dependencies=[Depends(require_admin)])
+async def list_profiles(limit: int = 20, store: ProfileStore = Depends(get_profile_store)):
+    """Most recent request profiles, newest first"""
+    try:
+        profiles = await store.list(limit)
+        return APIResponse(
+            success=True,
+            message=f"{len(profiles)} profiles",
+            data={"profiles": profiles, "format": store.profile_format}
+        )
+    except Exception as e:
+        logger.error(f"Listing profiles failed: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list profiles")
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def get_profile(profile_id: str, store: ProfileStore = Depends(get_profile_store)):
+    """Download one profile; speedscope files open at https://www.speedscope.app"""
+    path = store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "application/json" if path.name.endswith(".json") else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=path.name)
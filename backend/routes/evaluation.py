@@ -8,28 +8,33 @@ import logging
 
 from models.api_models import *
 from services.interview_service import InterviewService
+from services.session_service import SessionService
+from services.container import get_interview_service, get_session_service
+from services.streaming import sse_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Dependency functions
-def get_interview_service() -> InterviewService:
-    return InterviewService()
-
 @router.post("/submit-answer", response_model=AnswerEvaluationResponse)
 async def submit_and_evaluate_answer(
     request: AnswerSubmissionRequest,
+    include_follow_up: bool = False,
     interview_service: InterviewService = Depends(get_interview_service)
 ):
-    """Submit an answer and get AI evaluation with scores and feedback"""
+    """Submit an answer and get AI evaluation with scores and feedback
+
+    With include_follow_up=true the follow-up question is generated
+    concurrently and returned in the same response.
+    """
     try:
         evaluation = await interview_service.submit_answer(
             session_id=request.session_id,
             question_id=request.question_id,
             question_text=request.question_text,
             answer_text=request.answer_text,
-            response_time_seconds=request.response_time_seconds
+            response_time_seconds=request.response_time_seconds,
+            include_follow_up=include_follow_up
         )
         
         logger.info(f"Answer evaluated for session {request.session_id}, question {request.question_id}")
@@ -42,6 +47,30 @@ async def submit_and_evaluate_answer(
         logger.error(f"Answer evaluation failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to evaluate answer")
 
+@router.post("/submit-answer/stream")
+async def submit_and_evaluate_answer_stream(
+    request: AnswerSubmissionRequest,
+    interview_service: InterviewService = Depends(get_interview_service)
+):
+    """Submit an answer and stream the evaluation over Server-Sent Events
+
+    Emits `feedback` events ({"text": ...}) as the detailed feedback is
+    generated, then a `result` event with the AnswerEvaluationResponse
+    /submit-answer returns, after the answer has been saved.
+    """
+    try:
+        events = await interview_service.stream_submit_answer(
+            session_id=request.session_id,
+            question_id=request.question_id,
+            question_text=request.question_text,
+            answer_text=request.answer_text,
+            response_time_seconds=request.response_time_seconds
+        )
+    except ValueError as e:
+        logger.error(f"Invalid request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    return sse_response(events)
+
 @router.post("/generate-followup", response_model=APIResponse)
 async def generate_follow_up_question(
     session_id: str,
@@ -73,7 +102,8 @@ async def generate_follow_up_question(
 @router.get("/evaluation-history/{session_id}", response_model=APIResponse)
 async def get_evaluation_history(
     session_id: str,
-    interview_service: InterviewService = Depends(get_interview_service)
+    interview_service: InterviewService = Depends(get_interview_service),
+    session_service: SessionService = Depends(get_session_service)
 ):
     """Get evaluation history for a session"""
     try:
@@ -83,8 +113,6 @@ async def get_evaluation_history(
             raise HTTPException(status_code=404, detail="Session not found")
         
         # Get session summary for detailed history
-        from services.session_service import SessionService
-        session_service = SessionService()
         summary = await session_service.get_interview_summary(session_id)
         
         if summary:
@@ -191,12 +219,17 @@ async def submit_manual_score(
     question_id: int,
     manual_scores: Dict[str, int],
     feedback: str = None,
-    interview_service: InterviewService = Depends(get_interview_service)
+    session_service: SessionService = Depends(get_session_service)
 ):
     """Submit manual scores (for admin/reviewer override)"""
     try:
-        # This would be used by human reviewers to override AI scores
-        # For now, we'll log it and return success
+        # Replaces the AI scores for the answer and adjusts the session totals
+        session_scores = await session_service.override_answer_scores(
+            session_id, question_id, manual_scores, feedback
+        )
+        if session_scores is None:
+            raise HTTPException(status_code=404, detail="Session or answer not found")
+        
         logger.info(f"Manual scores submitted for session {session_id}, question {question_id}: {manual_scores}")
         
         return APIResponse(
@@ -206,10 +239,13 @@ async def submit_manual_score(
                 "session_id": session_id,
                 "question_id": question_id,
                 "manual_scores": manual_scores,
-                "feedback": feedback
+                "feedback": feedback,
+                "session_scores": session_scores
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Manual scoring failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to record manual scores")
\ No newline at end of file
@@ -10,18 +10,12 @@ from typing import Optional
 from models.api_models import *
 from services.session_service import SessionService
 from services.interview_service import InterviewService
+from services.container import get_session_service, get_interview_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Dependency functions
-def get_session_service() -> SessionService:
-    return SessionService()
-
-def get_interview_service() -> InterviewService:
-    return InterviewService()
-
 @router.post("/create-session", response_model=APIResponse)
 async def create_interview_session(
     user_email: Optional[str] = None,
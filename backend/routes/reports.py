@@ -11,15 +11,13 @@ import json
 
 from models.api_models import *
 from services.interview_service import InterviewService
+from services.session_service import SessionService
+from services.container import get_interview_service, get_session_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Dependency functions
-def get_interview_service() -> InterviewService:
-    return InterviewService()
-
 @router.post("/generate", response_model=FinalReportResponse)
 async def generate_final_report(
     request: ReportGenerationRequest,
@@ -111,12 +109,10 @@ async def get_report_summary(
 @router.get("/analytics/{session_id}", response_model=APIResponse)
 async def get_interview_analytics(
     session_id: str,
-    interview_service: InterviewService = Depends(get_interview_service)
+    session_service: SessionService = Depends(get_session_service)
 ):
     """Get detailed analytics and insights from the interview"""
     try:
-        from services.session_service import SessionService
-        session_service = SessionService()
         summary = await session_service.get_interview_summary(session_id)
         
         if not summary:
@@ -126,6 +122,11 @@ async def get_interview_analytics(
         answers = summary.get("answers", [])
         questions = summary.get("questions", [])
         
+        # Variance comes from the session's running score aggregates
+        score_variance = summary.get("statistics", {}).get("score_variance")
+        if score_variance is None:
+            score_variance = _calculate_score_variance(answers)
+        
         analytics = {
             "performance_trend": _calculate_performance_trend(answers),
             "question_type_performance": _analyze_question_type_performance(questions, answers),
@@ -135,8 +136,8 @@ async def get_interview_analytics(
             "benchmark_comparison": _compare_to_benchmarks(summary.get("scores", {})),
             "detailed_metrics": {
                 "average_score": summary.get("scores", {}).get("overall", 0),
-                "score_variance": _calculate_score_variance(answers),
-                "consistency_rating": _calculate_consistency(answers),
+                "score_variance": score_variance,
+                "consistency_rating": _calculate_consistency(score_variance),
                 "total_interview_time": _calculate_total_time(summary)
             }
         }
@@ -312,9 +313,8 @@ def _calculate_score_variance(answers: List[Dict]) -> float:
     variance = sum((score - mean) ** 2 for score in scores) / len(scores)
     return round(variance, 2)
 
-def _calculate_consistency(answers: List[Dict]) -> str:
-    """Calculate consistency rating"""
-    variance = _calculate_score_variance(answers)
+def _calculate_consistency(variance: float) -> str:
+    """Calculate consistency rating from the score variance"""
     if variance < 50:
         return "Very Consistent"
     elif variance < 100:
@@ -7,17 +7,15 @@ from fastapi import APIRouter, HTTPException, Depends
 import logging
 from typing import List
 
-from models.api_models import GeneralQuestionRequest, GeneralQuestionResponse, APIResponse
+from models.api_models import CodeReviewRequest, GeneralQuestionRequest, GeneralQuestionResponse, APIResponse
 from services.interview_service import InterviewService
+from services.container import get_interview_service
+from services.streaming import sse_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Dependency functions
-def get_interview_service() -> InterviewService:
-    return InterviewService()
-
 @router.post("/ask", response_model=GeneralQuestionResponse)
 async def ask_general_question(
     request: GeneralQuestionRequest,
@@ -37,6 +35,18 @@ async def ask_general_question(
         logger.error(f"General question answering failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to answer question")
 
+@router.post("/ask/stream")
+async def ask_general_question_stream(
+    request: GeneralQuestionRequest,
+    interview_service: InterviewService = Depends(get_interview_service)
+):
+    """Stream the answer over Server-Sent Events
+
+    Emits `chunk` events ({"text": ...}) as the model writes, then a final
+    `result` event with the same GeneralQuestionResponse /ask returns.
+    """
+    return sse_response(interview_service.stream_general_answer(request.question, request.context))
+
 @router.get("/popular-questions", response_model=APIResponse)
 async def get_popular_questions():
     """Get a list of popular technical questions users ask"""
@@ -100,12 +110,7 @@ async def explain_technical_concept(
 ):
     """Get detailed explanation of technical concepts with examples"""
     try:
-        # Create detailed question with context
-        context = f"Explain this concept for {level} level understanding"
-        if include_examples:
-            context += " with practical examples and code snippets where applicable"
-        
-        question = f"Explain {concept} in detail"
+        question, context = _concept_question(concept, level, include_examples)
         
         response = await interview_service.answer_general_question(
             question=question,
@@ -119,41 +124,74 @@ async def explain_technical_concept(
         logger.error(f"Concept explanation failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to explain concept")
 
+@router.post("/explain-concept/stream")
+async def explain_technical_concept_stream(
+    concept: str,
+    level: str = "intermediate",
+    include_examples: bool = True,
+    interview_service: InterviewService = Depends(get_interview_service)
+):
+    """Stream a concept explanation over Server-Sent Events (see /ask/stream)"""
+    question, context = _concept_question(concept, level, include_examples)
+    return sse_response(interview_service.stream_general_answer(question, context))
+
+def _concept_question(concept: str, level: str, include_examples: bool):
+    """Question and context for a concept explanation"""
+    # Create detailed question with context
+    context = f"Explain this concept for {level} level understanding"
+    if include_examples:
+        context += " with practical examples and code snippets where applicable"
+    
+    question = f"Explain {concept} in detail"
+    return question, context
+
 @router.post("/code-review", response_model=GeneralQuestionResponse)
 async def review_code_snippet(
-    code: str,
-    language: str,
-    focus_areas: List[str] = None,  # ["performance", "security", "readability", "best_practices"]
+    request: CodeReviewRequest,
     interview_service: InterviewService = Depends(get_interview_service)
 ):
     """Get AI code review with suggestions and improvements"""
     try:
-        focus = ", ".join(focus_areas) if focus_areas else "overall code quality"
-        
-        question = f"""
-Please review this {language} code and provide feedback focusing on {focus}:
-
-```{language}
-{code}
-```
-
-Provide specific suggestions for improvement, identify any issues, and explain best practices.
-"""
-        
-        context = "Code review with constructive feedback and suggestions"
+        question, context = _code_review_question(request.code, request.language, request.focus_areas)
         
         response = await interview_service.answer_general_question(
             question=question,
             context=context
         )
         
-        logger.info(f"Reviewed {language} code snippet")
+        logger.info(f"Reviewed {request.language} code snippet")
         return response
         
     except Exception as e:
         logger.error(f"Code review failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to review code")
 
+@router.post("/code-review/stream")
+async def review_code_snippet_stream(
+    request: CodeReviewRequest,
+    interview_service: InterviewService = Depends(get_interview_service)
+):
+    """Stream a code review over Server-Sent Events (see /ask/stream)"""
+    question, context = _code_review_question(request.code, request.language, request.focus_areas)
+    return sse_response(interview_service.stream_general_answer(question, context))
+
+def _code_review_question(code: str, language: str, focus_areas: List[str] = None):
+    """Question and context for a code review"""
+    focus = ", ".join(focus_areas) if focus_areas else "overall code quality"
+    
+    question = f"""
+Please review this {language} code and provide feedback focusing on {focus}:
+
+```{language}
+{code}
+```
+
+Provide specific suggestions for improvement, identify any issues, and explain best practices.
+"""
+    
+    context = "Code review with constructive feedback and suggestions"
+    return question, context
+
 @router.post("/interview-tips", response_model=APIResponse)
 async def get_interview_tips(
     role: str = None,
@@ -5,5 +5,6 @@ Initialize services package
 from .gemini_service import GeminiService
 from .session_service import SessionService  
 from .interview_service import InterviewService
+from .container import ServiceContainer
 
-__all__ = ['GeminiService', 'SessionService', 'InterviewService']
\ No newline at end of file
+__all__ = ['GeminiService', 'SessionService', 'InterviewService', 'ServiceContainer']
\ No newline at end of file
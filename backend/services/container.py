@@ -0,0 +1,96 @@
+"""
+Application-scoped service container
+Created once in the main.py lifespan and injected into every router
+"""
+
+import logging
+from typing import Dict, Any, Optional
+
+from fastapi import Request
+
+from config.settings import get_settings
+from services.gemini_service import GeminiService
+from services.metrics import ACTIVE_SESSIONS, GEMINI_IN_FLIGHT, GEMINI_QUEUED, SESSIONS
+from services.question_bank import QuestionBankPrefetcher, parse_roles, standard_configurations
+from services.session_service import SessionService
+from services.tracing import tracer
+from services.interview_service import InterviewService
+
+logger = logging.getLogger(__name__)
+
+class ServiceContainer:
+    """Holds the single instance of each backend service for the process"""
+
+    def __init__(
+        self,
+        gemini_service: Optional[GeminiService] = None,
+        session_service: Optional[SessionService] = None
+    ):
+        self.gemini_service = gemini_service or GeminiService()
+        self.session_service = session_service or SessionService()
+        self.interview_service = InterviewService(self.gemini_service, self.session_service)
+        
+        # Prefetches question sets into the question cache; started by the main.py lifespan
+        settings = get_settings()
+        self.question_bank = None
+        roles = parse_roles(settings.question_bank_roles)
+        if settings.question_bank_enabled and not roles:
+            logger.warning("QUESTION_BANK_ENABLED is set but QUESTION_BANK_ROLES is empty; not prefetching questions")
+        elif settings.question_bank_enabled and self.gemini_service.question_cache is not None:
+            self.question_bank = QuestionBankPrefetcher(
+                self.gemini_service,
+                standard_configurations(roles),
+                target_sets=settings.question_bank_target_sets,
+                low_water_mark=settings.question_bank_low_water_mark,
+                question_count=settings.default_question_count,
+                concurrency=settings.question_bank_concurrency
+            )
+        logger.info("Service container initialized")
+
+    async def startup(self):
+        """Open storage and load state that needs the event loop"""
+        await self.session_service.initialize()
+        await self.gemini_service.initialize()
+
+    async def shutdown(self):
+        """Release storage connections"""
+        if self.question_bank is not None:
+            await self.question_bank.stop()
+        await self.interview_service.close()
+        await self.gemini_service.close()
+        await self.session_service.close()
+        logger.info("Service container shut down")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """In-memory counters from every service, cheap enough to scrape often"""
+        return {
+            "sessions": self.session_service.get_metrics(),
+            "gemini": self.gemini_service.get_stats(),
+            "interview": self.interview_service.get_stats(),
+            "question_bank": self.question_bank.get_stats() if self.question_bank is not None else None,
+            "tracing": tracer.get_stats()
+        }
+
+    def collect_metrics(self):
+        """Set the gauges on /metrics from the services' current state"""
+        limiter = self.gemini_service.limiter.get_stats()
+        GEMINI_IN_FLIGHT.set(limiter["in_flight"])
+        GEMINI_QUEUED.set(limiter["queue_depth"])
+        counters = self.session_service.status_counters
+        SESSIONS.clear()
+        for status, count in counters.get_stats()["by_status"].items():
+            SESSIONS.set(count, status=status)
+        ACTIVE_SESSIONS.set(counters.total())
+
+# Dependency functions shared by all routers
+def get_container(request: Request) -> ServiceContainer:
+    return request.app.state.services
+
+def get_gemini_service(request: Request) -> GeminiService:
+    return get_container(request).gemini_service
+
+def get_session_service(request: Request) -> SessionService:
+    return get_container(request).session_service
+
+def get_interview_service(request: Request) -> InterviewService:
+    return get_container(request).interview_service
@@ -0,0 +1,217 @@
+"""
+Answer evaluation cache
+Reuses evaluations for identical or near-identical answers to the same question
+"""
+
+import copy
+import hashlib
+import logging
+import random
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+def normalize_text(text: str) -> str:
+    """Lowercase words only, so case, punctuation and spacing do not matter"""
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+def _hash32(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=4).digest(), "little")
+
+class MinHasher:
+    """MinHash signatures over character shingles of normalized text
+
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of the two texts' shingle sets. Every permutation is applied
+    to every shingle hash in one NumPy matrix operation, so the Python-level
+    work is one hash per shingle.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 4, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        prime = int(_MERSENNE_PRIME)
+        self._a = np.array([rng.randrange(1, prime) for _ in range(num_perm)], dtype=np.uint64)
+        self._b = np.array([rng.randrange(0, prime) for _ in range(num_perm)], dtype=np.uint64)
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        k = self.shingle_size
+        shingles = {text[i:i + k] for i in range(max(1, len(text) - k + 1))}
+        hashes = np.fromiter((_hash32(shingle) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+        # uint64 products wrap around; that is still a fixed hash per permutation
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return tuple(permuted.min(axis=0).tolist())
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+class EvaluationKey(NamedTuple):
+    """Where an answer lives in the cache, computed once per submission"""
+    bucket: str
+    key: str
+    signature: Optional[Tuple[int, ...]]
+
+class EvaluationCache:
+    """Exact and near-duplicate lookup of previous evaluations
+
+    Answers are grouped by (question, role, experience level, criteria).
+    Exact matches are found by hashing the normalized answer. Shorter answers
+    also get a MinHash signature, indexed by LSH bands, so near-duplicates
+    above `similarity_threshold` reuse the stored evaluation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        similarity_threshold: float = 0.9,
+        max_near_match_chars: int = 2000,
+        excluded_roles: List[str] = None,
+        num_perm: int = 64,
+        bands: int = 16
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.max_near_match_chars = max_near_match_chars
+        self.excluded_roles = {role.strip().lower() for role in (excluded_roles or []) if role.strip()}
+
+        self.minhash = MinHasher(num_perm=num_perm)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+
+        # exact key -> {"bucket", "evaluation", "signature", "latency_seconds"}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # (bucket, band index, band values) -> exact keys sharing that band
+        self._band_index: Dict[tuple, set] = {}
+
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.skipped_roles = 0
+        self.latency_saved_seconds = 0.0
+
+    def enabled_for(self, role: str) -> bool:
+        """False for roles that opted out of cached evaluations"""
+        if (role or "").strip().lower() in self.excluded_roles:
+            self.skipped_roles += 1
+            return False
+        return True
+
+    @staticmethod
+    def _bucket(question: str, role: str, experience_level: str, criteria: List[str] = None) -> str:
+        parts = [normalize_text(question), (role or "").strip().lower(), (experience_level or "").strip().lower()]
+        parts.extend(sorted(normalize_text(c) for c in (criteria or [])))
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def _bands_of(self, bucket: str, signature: Tuple[int, ...]):
+        r = self.rows_per_band
+        return [(bucket, band, signature[band * r:(band + 1) * r]) for band in range(self.bands)]
+
+    def key_for(
+        self,
+        question: str,
+        answer: str,
+        role: str,
+        experience_level: str,
+        criteria: List[str] = None
+    ) -> EvaluationKey:
+        """Cache key for an answer, shared by lookup and the store after a miss"""
+        bucket = self._bucket(question, role, experience_level, criteria)
+        normalized = normalize_text(answer)
+        key = hashlib.sha256(f"{bucket}\x1e{normalized}".encode()).hexdigest()
+        signature = None
+        if normalized and len(normalized) <= self.max_near_match_chars:
+            signature = self.minhash.signature(normalized)
+        return EvaluationKey(bucket, key, signature)
+
+    def lookup(self, cache_key: EvaluationKey) -> Optional[Tuple[Dict[str, Any], str, float]]:
+        """(evaluation, "exact" | "near", similarity) for a cached match, else None"""
+        bucket, key, signature = cache_key
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.exact_hits += 1
+            return self._hit(key, entry), "exact", 1.0
+
+        if signature is not None:
+            candidates = set()
+            for band_key in self._bands_of(bucket, signature):
+                candidates.update(self._band_index.get(band_key, ()))
+            best_key, best_similarity = None, 0.0
+            for candidate in candidates:
+                similarity = MinHasher.similarity(signature, self._entries[candidate]["signature"])
+                if similarity > best_similarity:
+                    best_key, best_similarity = candidate, similarity
+            if best_key is not None and best_similarity >= self.similarity_threshold:
+                self.near_hits += 1
+                return self._hit(best_key, self._entries[best_key]), "near", round(best_similarity, 3)
+
+        self.misses += 1
+        return None
+
+    def _hit(self, key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        self._entries.move_to_end(key)
+        self.latency_saved_seconds += entry["latency_seconds"]
+        return copy.deepcopy(entry["evaluation"])
+
+    def store(self, cache_key: EvaluationKey, evaluation: Dict[str, Any], latency_seconds: float):
+        """Remember a model evaluation and how long it took to produce"""
+        bucket, key, signature = cache_key
+        if key in self._entries:
+            self._remove(key)
+
+        if signature is not None:
+            for band_key in self._bands_of(bucket, signature):
+                self._band_index.setdefault(band_key, set()).add(key)
+
+        self._entries[key] = {
+            "bucket": bucket,
+            "evaluation": copy.deepcopy(evaluation),
+            "signature": signature,
+            "latency_seconds": latency_seconds
+        }
+        self.stores += 1
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        if entry["signature"] is not None:
+            for band_key in self._bands_of(entry["bucket"], entry["signature"]):
+                keys = self._band_index.get(band_key)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._band_index[band_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit counters and model latency avoided by cache hits"""
+        hits = self.exact_hits + self.near_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.similarity_threshold,
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "skipped_roles": self.skipped_roles,
+            "latency_saved_seconds": round(self.latency_saved_seconds, 3),
+            "avg_latency_saved_ms": round(self.latency_saved_seconds / hits * 1000, 1) if hits else 0.0
+        }
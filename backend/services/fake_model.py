@@ -0,0 +1,310 @@
+"""
+Deterministic local stand-in for the Gemini model
+Schema-valid questions, evaluations and reports with configurable latency, errors and malformed output
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from config.settings import get_settings
+from models.api_models import QuestionType
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+# Retryable upstream failures, in the proportions a busy API returns them
+_ERRORS = [(503, "The service is currently unavailable."), (429, "Resource has been exhausted (e.g. check quota)."), (500, "An internal error has occurred.")]
+_ERROR_WEIGHTS = [6, 3, 1]
+
+_MALFORMATIONS = ["code fence", "trailing comma", "trailing prose", "python literal", "truncated"]
+
+class FakeModelError(Exception):
+    """An injected upstream error; `code` makes it retryable like the SDK's errors"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+
+class FakeUsage:
+    def __init__(self, prompt_tokens: int, output_tokens: int):
+        self.prompt_token_count = prompt_tokens
+        self.candidates_token_count = output_tokens
+        self.total_token_count = prompt_tokens + output_tokens
+
+class FakeResponse:
+    """The parts of a GenerateContentResponse GeminiService reads"""
+
+    def __init__(self, text: str, usage: Optional[FakeUsage] = None):
+        self.text = text
+        self.usage_metadata = usage
+
+class FakeModelBackend:
+    """Answers every GeminiService prompt locally, no API key or network needed
+
+    The reply is chosen from the prompt: a question set, an evaluation or a
+    report that validates against models/api_models.py, a follow-up
+    question, or a plain-text answer. Content is a function of the prompt and
+    the seed, so the same prompt always gets the same reply. Latency, errors
+    and malformed output are drawn from a seeded sequence; a run with the
+    same calls in the same order behaves identically. Replies to "fix this
+    JSON" prompts are never malformed.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_distribution: str = "lognormal",
+        latency_jitter: float = 0.3,
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: int = 42,
+        stream_chunks: int = 20,
+        first_chunk_seconds: Optional[float] = None
+    ):
+        if latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{latency_distribution}' (expected one of: {', '.join(LATENCY_DISTRIBUTIONS)})")
+        self.latency_ms = latency_ms
+        self.latency_distribution = latency_distribution
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.seed = seed
+        self.stream_chunks = stream_chunks
+        # None: the first streamed chunk arrives after a fifth of the call's latency
+        self.first_chunk_seconds = first_chunk_seconds
+        self._rng = random.Random(seed)
+
+        self.calls = 0
+        self.errors = 0
+        self.malformed = 0
+        self.calls_by_kind: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls) -> "FakeModelBackend":
+        settings = get_settings()
+        return cls(
+            latency_ms=settings.fake_model_latency_ms,
+            latency_distribution=settings.fake_model_latency_distribution,
+            latency_jitter=settings.fake_model_latency_jitter,
+            error_rate=settings.fake_model_error_rate,
+            malformed_rate=settings.fake_model_malformed_rate,
+            seed=settings.fake_model_seed
+        )
+
+    def sample_latency(self) -> float:
+        """One call's latency in seconds"""
+        mean = self.latency_ms / 1000
+        jitter = self.latency_jitter
+        if self.latency_distribution == "fixed" or mean <= 0:
+            return max(0.0, mean)
+        if self.latency_distribution == "uniform":
+            return mean * self._rng.uniform(max(0.0, 1 - jitter), 1 + jitter)
+        if self.latency_distribution == "normal":
+            return max(0.0, self._rng.gauss(mean, mean * jitter))
+        if self.latency_distribution == "exponential":
+            return self._rng.expovariate(1 / mean)
+        # Median `mean`, long right tail like real model latency
+        return mean * self._rng.lognormvariate(0, jitter)
+
+    def _draw(self, kind: str):
+        """(latency, injected error or None, malformation or None) for one call"""
+        self.calls += 1
+        self.calls_by_kind[kind] = self.calls_by_kind.get(kind, 0) + 1
+        latency = self.sample_latency()
+        error = None
+        if self.error_rate and self._rng.random() < self.error_rate:
+            code, message = self._rng.choices(_ERRORS, weights=_ERROR_WEIGHTS)[0]
+            error = FakeModelError(code, message)
+            self.errors += 1
+        malformation = None
+        if kind in ("questions", "evaluation", "report") and self.malformed_rate and self._rng.random() < self.malformed_rate:
+            malformation = self._rng.choice(_MALFORMATIONS)
+            self.malformed += 1
+        return latency, error, malformation
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **kwargs):
+        kind = self.classify(prompt)
+        latency, error, malformation = self._draw(kind)
+        text = self.reply(prompt, kind)
+        if malformation:
+            text = self.malform(text, malformation)
+        usage = FakeUsage(max(1, len(prompt) // 4), max(1, len(text) // 4))
+        if stream:
+            if error is not None:
+                await asyncio.sleep(self._first_chunk_delay(latency))
+                raise error
+            return self._stream(text, latency, usage)
+        await asyncio.sleep(latency)
+        if error is not None:
+            raise error
+        return FakeResponse(text, usage)
+
+    async def _stream(self, text: str, latency: float, usage: FakeUsage) -> AsyncIterator[FakeResponse]:
+        size = max(1, -(-len(text) // self.stream_chunks))
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        first_delay = self._first_chunk_delay(latency)
+        later_delay = max(0.0, latency - first_delay) / max(1, len(pieces) - 1)
+        for index, piece in enumerate(pieces):
+            await asyncio.sleep(first_delay if index == 0 else later_delay)
+            yield FakeResponse(piece, usage if index == len(pieces) - 1 else None)
+
+    def _first_chunk_delay(self, latency: float) -> float:
+        if self.first_chunk_seconds is None:
+            return latency * 0.2
+        return min(latency, self.first_chunk_seconds)
+
+    @staticmethod
+    def classify(prompt: str) -> str:
+        """Which GeminiService prompt this is"""
+        if "is malformed or does not match the expected fields" in prompt:
+            return "fix"
+        if "Format your response as a JSON array" in prompt:
+            return "questions"
+        if "Provide a detailed evaluation in JSON format" in prompt:
+            return "evaluation"
+        if "comprehensive report in JSON format" in prompt:
+            return "report"
+        if "follow-up question" in prompt.lower():
+            return "follow_up"
+        if prompt.startswith("Test connection"):
+            return "test"
+        return "general"
+
+    def reply(self, prompt: str, kind: str) -> str:
+        """Well-formed reply text, a function of the prompt and the seed only"""
+        rng = random.Random(f"{self.seed}:{hashlib.sha256(prompt.encode()).hexdigest()}")
+        if kind == "fix":
+            # The broken JSON is the last part of the fix prompt; answer with a valid one of the same kind
+            if "JSON array" in prompt:
+                return json.dumps(self._questions(prompt, rng))
+            return json.dumps(self._report(rng) if "executive_summary" in prompt else self._evaluation(prompt, rng))
+        if kind == "questions":
+            return json.dumps(self._questions(prompt, rng), indent=2)
+        if kind == "evaluation":
+            return json.dumps(self._evaluation(prompt, rng), indent=2)
+        if kind == "report":
+            return json.dumps(self._report(rng), indent=2)
+        if kind == "follow_up":
+            return rng.choice([
+                "Can you walk me through a specific example of that?",
+                "What trade-offs did you consider, and why did you choose that one?",
+                "How would you measure whether that approach worked?",
+                "What would you do differently if you had to do it again?"
+            ])
+        if kind == "test":
+            return "Connected"
+        topic = _field(prompt, "Question") or "that topic"
+        return " ".join([
+            f"Here is an overview of {topic.rstrip('?.')}.",
+            "Start with the core idea, then look at how it is used in practice.",
+            "For example, consider a small service that has to stay responsive under load.",
+            "In an interview, explain the trade-offs and give a concrete example."
+        ] * rng.randint(2, 4))
+
+    def _questions(self, prompt: str, rng: random.Random) -> List[Dict[str, Any]]:
+        count_match = re.search(r"Generate (\d+) interview questions", prompt)
+        count = int(count_match.group(1)) if count_match else 10
+        role = _field(prompt, "Role") or "Software Developer"
+        difficulty = (_field(prompt, "Difficulty") or "medium").lower()
+        question_types = [question_type.value for question_type in QuestionType if question_type != QuestionType.RESUME_SPECIFIC]
+        if "Candidate's Resume:" in prompt:
+            question_types.append(QuestionType.RESUME_SPECIFIC.value)
+        subjects = ["a system you designed", "a production incident", "a disagreement with a teammate", "a deadline you missed",
+                    "code you are proud of", "a performance problem", "a feature you cut", "how you test your work",
+                    "a technology you learned quickly", "a decision you would reverse"]
+        rng.shuffle(subjects)
+        return [
+            {
+                "id": i,
+                "question": f"As a {role}, tell me about {subjects[(i - 1) % len(subjects)]} (question {i}).",
+                "type": rng.choice(question_types),
+                "difficulty": difficulty if difficulty in ("easy", "medium", "hard", "expert") else "medium",
+                "follow_ups": ["What would you do differently?", "How did you measure the outcome?"],
+                "evaluation_criteria": ["Clarity", "Depth", "Ownership"],
+                "expected_topics": ["Trade-offs", "Impact"]
+            }
+            for i in range(1, count + 1)
+        ]
+
+    def _evaluation(self, prompt: str, rng: random.Random) -> Dict[str, Any]:
+        answer = _field(prompt, "Candidate's Answer") or ""
+        # Longer answers score higher, as a rough stand-in for substance
+        base = min(90, 45 + len(answer.split()) // 3)
+
+        def score() -> int:
+            return max(0, min(100, base + rng.randint(-10, 10)))
+
+        scores = {
+            "technical_accuracy": score(),
+            "communication_clarity": score(),
+            "depth_of_knowledge": score(),
+            "problem_solving": score(),
+            "confidence": score()
+        }
+        return {
+            "detailed_feedback": "The answer addresses the question and follows a clear structure. "
+                                 "It would be stronger with a concrete example and the outcome it led to.",
+            "overall_score": round(sum(scores.values()) / len(scores)),
+            "scores": scores,
+            "strengths": ["Clear structure", "Relevant experience"],
+            "weaknesses": ["Few concrete examples"],
+            "improvement_suggestions": ["Quantify the impact of your work", "Use the STAR format"],
+            "follow_up_questions": ["How did you measure success?"],
+            "red_flags": [],
+            "positive_indicators": ["Understands the fundamentals"]
+        }
+
+    def _report(self, rng: random.Random) -> Dict[str, Any]:
+        categories = ["technical_skills", "communication", "problem_solving", "cultural_fit", "leadership_potential"]
+        category_scores = {category: rng.randint(55, 95) for category in categories}
+        overall = round(sum(category_scores.values()) / len(category_scores))
+        rating = "Strong Hire" if overall >= 85 else "Hire" if overall >= 70 else "No Hire"
+        return {
+            "executive_summary": "The candidate communicated clearly and showed solid fundamentals.",
+            "overall_rating": rating,
+            "overall_score": overall,
+            "category_scores": category_scores,
+            "key_strengths": ["Communication", "Fundamentals", "Ownership"],
+            "areas_for_improvement": ["Concrete examples", "System design depth"],
+            "detailed_analysis": "Answers were well structured; deeper technical detail would strengthen them.",
+            "recommendation": f"{rating}: a good fit for the role with some coaching on depth.",
+            "next_steps": ["Technical deep-dive", "Team interview"],
+            "interview_highlights": ["Clear explanation of past projects"],
+            "red_flags": [],
+            "salary_range_assessment": "Within the market range for the level"
+        }
+
+    @staticmethod
+    def malform(text: str, malformation: str) -> str:
+        """Apply one of the mistakes real model output contains"""
+        if malformation == "code fence":
+            return f"```json\n{text}\n```"
+        if malformation == "trailing comma":
+            return re.sub(r"(\S)(\n\s*[}\]])", r"\1,\2", text, count=3)
+        if malformation == "trailing prose":
+            return f"{text}\n\nLet me know if you need anything else {{or more detail}}."
+        if malformation == "python literal":
+            return text.replace("[]", "[None]", 1) if "[]" in text else text.replace("true", "True", 1)
+        return text[:int(len(text) * 0.85)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Calls served and faults injected"""
+        return {
+            "calls": self.calls,
+            "calls_by_kind": dict(self.calls_by_kind),
+            "injected_errors": self.errors,
+            "malformed_responses": self.malformed,
+            "latency_distribution": self.latency_distribution,
+            "latency_ms": self.latency_ms
+        }
+
+def _field(prompt: str, label: str) -> Optional[str]:
+    """Value of a "Label: value" line in a prompt"""
+    match = re.search(rf"^{re.escape(label)}: (.+)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else None
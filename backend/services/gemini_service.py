@@ -3,15 +3,29 @@ Google Gemini AI Service for Interview Practice Partner
 Handles: Question Generation, Answer Evaluation, Follow-up Generation, Report Creation
 """
 
-import google.generativeai as genai
 import asyncio
-import json
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from config.settings import get_settings, AIConfig
+from services.question_cache import QuestionCache
+from services.evaluation_cache import EvaluationCache
+from services.metrics import GEMINI_FALLBACKS, record_model_failure, record_model_response
+from services.model_backend import ModelUnavailableError, create_model
+from services.rate_limiter import ModelRateLimiter, Priority, QueueTimeoutError
+from services.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, is_retryable
+from services.single_flight import SingleFlight
+from services.streaming import JsonStringFieldReader
+from services.structured_output import StructuredOutputParser
+from services.tracing import traced, tracer
+
 logger = logging.getLogger(__name__)
 
+# Bump when the question prompt changes so cached sets from the old prompt are not served
+QUESTION_PROMPT_VERSION = 1
+
 class GeminiService:
     def __init__(self):
         self.model = None
@@ -30,48 +44,339 @@ class GeminiService:
             {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
         ]
         
+        settings = get_settings()
+        
+        # Upper bound for a single model round trip
+        self.request_timeout_seconds = settings.gemini_timeout_seconds
+        
+        # Every model call takes a slot: bounded concurrency, paced by request and token budgets
+        self.limiter = ModelRateLimiter(
+            max_in_flight=settings.gemini_max_concurrent_requests,
+            requests_per_minute=settings.gemini_requests_per_minute,
+            tokens_per_minute=settings.gemini_tokens_per_minute
+        )
+        self.max_queue_seconds = settings.gemini_max_queue_seconds
+        
+        # Transient failures are retried within a per-call budget; a run of
+        # failures opens the breaker so callers fall back immediately
+        self.retry_policy = RetryPolicy.from_config(AIConfig.RETRY_CONFIG)
+        self.call_budget_seconds = settings.gemini_call_budget_seconds
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.gemini_breaker_failure_threshold,
+            recovery_timeout_seconds=settings.gemini_breaker_recovery_seconds
+        )
+        self.retries = 0
+        self.retries_exhausted = 0
+        
+        # Identical prompts in flight at the same time share one model call
+        self.single_flight = SingleFlight() if settings.gemini_single_flight_enabled else None
+        
+        # Question sets for resume-less configurations are shared between users
+        self.question_cache = QuestionCache(
+            path=settings.question_cache_path,
+            ttl_seconds=settings.question_cache_ttl_hours * 3600,
+            max_keys=settings.question_cache_max_keys,
+            pool_size=settings.question_cache_pool_size
+        ) if settings.question_cache_enabled else None
+        
+        # Identical and near-identical answers to the same question reuse an evaluation
+        self.evaluation_cache = EvaluationCache(
+            max_entries=settings.evaluation_cache_max_entries,
+            similarity_threshold=settings.evaluation_cache_similarity_threshold,
+            excluded_roles=settings.evaluation_cache_excluded_roles.split(",")
+        ) if settings.evaluation_cache_enabled else None
+        
+        # Malformed JSON is repaired locally, or fixed with a short re-prompt, before giving up
+        self.output_parser = StructuredOutputParser(reprompt_enabled=settings.structured_output_reprompt_enabled)
+        
         self._initialize_model()
 
     def _initialize_model(self):
-        """Initialize Gemini AI model with API key"""
+        """Create the configured model backend
+
+        Without a usable backend (e.g. no API key) the service still starts;
+        every model call raises ModelUnavailableError and callers fall back.
+        """
+        settings = get_settings()
+        self.backend = settings.gemini_backend
+        self.model_error = None
         try:
-            # You'll need to set your API key in environment variables
-            # Get your API key from: https://makersuite.google.com/app/apikey
-            import os
-            api_key = os.getenv("GOOGLE_AI_API_KEY")
-            if not api_key:
-                raise ValueError("GOOGLE_AI_API_KEY environment variable is required")
-            
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel(
-                model_name="gemini-1.5-flash",  # Latest and fastest model
-                generation_config=self.generation_config,
-                safety_settings=self.safety_settings
-            )
-            logger.info("✅ Gemini AI model initialized successfully")
+            self.model = create_model(self.backend, settings.gemini_model_name, self.generation_config, self.safety_settings)
+            logger.info(f"✅ Gemini AI model initialized successfully ({self.backend} backend)")
         except Exception as e:
+            self.model = None
+            self.model_error = str(e)
             logger.error(f"❌ Failed to initialize Gemini AI: {e}")
-            raise e
+
+    @property
+    def available(self) -> bool:
+        """Whether a model backend was created"""
+        return self.model is not None
+
+    def _require_model(self):
+        if self.model is None:
+            raise ModelUnavailableError(f"Gemini AI is not available: {self.model_error}")
+
+    async def initialize(self):
+        """Load persisted caches and start saving them in the background"""
+        if self.question_cache is not None:
+            await self.question_cache.load()
+            self.question_cache.start(get_settings().question_cache_save_interval_seconds)
+
+    async def close(self):
+        """Persist caches"""
+        if self.question_cache is not None:
+            await self.question_cache.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Limiter and cache counters"""
+        return {
+            "backend": self.backend,
+            "model_error": self.model_error,
+            "fake_model": self.model.get_stats() if hasattr(self.model, "get_stats") else None,
+            "limiter": self.limiter.get_stats(),
+            "circuit_breaker": self.circuit_breaker.get_stats(),
+            "retries": self.retries,
+            "retries_exhausted": self.retries_exhausted,
+            "single_flight": self.single_flight.get_stats() if self.single_flight is not None else None,
+            "question_cache": self.question_cache.get_stats() if self.question_cache is not None else None,
+            "evaluation_cache": self.evaluation_cache.get_stats() if self.evaluation_cache is not None else None,
+            "structured_output": self.output_parser.get_stats()
+        }
 
     async def test_connection(self):
         """Test Gemini AI connection"""
         try:
-            response = await self._generate_response("Test connection. Respond with 'Connected'")
+            response = await self._generate_response("Test connection. Respond with 'Connected'", retry=False, method="test")
             logger.info(f"Gemini connection test: {response}")
             return True
         except Exception as e:
             logger.error(f"Gemini connection test failed: {e}")
             raise e
 
-    async def _generate_response(self, prompt: str) -> str:
-        """Generate response using Gemini AI"""
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """Rough prompt size for the token budget (about four characters per token)"""
+        return max(1, len(prompt) // 4)
+
+    async def _generate_response(
+        self,
+        prompt: str,
+        priority: Priority = Priority.STANDARD,
+        retry: bool = True,
+        coalesce: bool = True,
+        method: str = "general"
+    ) -> str:
+        """Generate response using Gemini AI without blocking the event loop
+
+        Concurrent calls with the same prompt (whitespace aside) and
+        generation config share one upstream call; the first caller's
+        priority applies to it. Callers that need a fresh sample pass
+        coalesce=False. `method` labels the call in the metrics.
+        """
+        if self.single_flight is None or not coalesce:
+            return await self._call_model(prompt, priority, retry, method)
+        key = SingleFlight.make_key(prompt, self.generation_config, retry)
+        return await self.single_flight.run(key, lambda: self._call_model(prompt, priority, retry, method))
+
+    async def _call_model(self, prompt: str, priority: Priority, retry: bool, method: str = "general") -> str:
+        """One model call with limiting, retries and the circuit breaker
+
+        Waits for a limiter slot first; callers with a higher priority are
+        admitted ahead of queued lower-priority calls. Transient errors are
+        retried with jittered backoff until the call budget runs out, and
+        while the circuit breaker is open the model is not called at all.
+        """
+        self._require_model()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.call_budget_seconds
+        max_retries = self.retry_policy.max_retries if retry else 0
+        attempt = 0
+        
+        while True:
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenError("Gemini circuit breaker is open")
+            
+            remaining = deadline - loop.time()
+            queued = time.perf_counter()
+            started = None
+            call_span = None
+            try:
+                async with self.limiter.slot(
+                    priority, self._estimate_tokens(prompt), timeout=min(self.max_queue_seconds, remaining)
+                ):
+                    started = time.perf_counter()
+                    call_span = self._start_call_span(method, attempt, started - queued)
+                    response = await asyncio.wait_for(
+                        self.model.generate_content_async(prompt),
+                        timeout=min(self.request_timeout_seconds, max(0.0, deadline - loop.time()))
+                    )
+                text = response.text.strip()
+            except (QueueTimeoutError, asyncio.CancelledError) as e:
+                # Local overload or an abandoned request, not a model failure
+                self._end_call_span(call_span, error=e)
+                self.circuit_breaker.release_probe()
+                raise
+            except Exception as e:
+                self._end_call_span(call_span, error=e)
+                if started is not None:
+                    record_model_failure(method, started, e)
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.error(f"Gemini generation timed out (attempt {attempt + 1})")
+                else:
+                    logger.error(f"Gemini generation error (attempt {attempt + 1}): {e}")
+                retryable = is_retryable(e)
+                self._record_breaker_failure(e, retryable)
+                
+                if not retryable or attempt >= max_retries:
+                    if attempt > 0:
+                        self.retries_exhausted += 1
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                if loop.time() + delay >= deadline:
+                    self.retries_exhausted += 1
+                    raise
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            
+            record_model_response(method, started, response)
+            self._end_call_span(call_span, response)
+            self.circuit_breaker.record_success()
+            return text
+
+    def _record_breaker_failure(self, error: Exception, retryable: bool):
+        """Count only transient upstream failures towards opening the circuit
+
+        A rejected or safety-blocked prompt says nothing about the model's
+        health, so it just frees the half-open probe slot.
+        """
+        if retryable:
+            self.circuit_breaker.record_failure(error)
+        else:
+            self.circuit_breaker.release_probe()
+
+    @staticmethod
+    def _start_call_span(method: str, attempt: int, queued_seconds: float):
+        """Span for one upstream attempt, started once a limiter slot is held"""
+        return tracer.start_span("GeminiService.model_call", kind="client", **{
+            "gemini.method": method,
+            "gemini.attempt": attempt + 1,
+            "gemini.queued_ms": round(queued_seconds * 1000, 3)
+        })
+
+    @staticmethod
+    def _end_call_span(span, response=None, error: BaseException = None):
+        if span is None:
+            return
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            span.set_attribute("gemini.prompt_tokens", getattr(usage, "prompt_token_count", 0) or 0)
+            span.set_attribute("gemini.output_tokens", getattr(usage, "candidates_token_count", 0) or 0)
+        span.end(error)
+
+    @traced(record=("kind",))
+    async def _parse_structured(self, response: str, kind: str, priority: Priority, method: str) -> Any:
+        """Validated JSON from a response; unusable output is sent back with a cheap fix-up prompt"""
+        return await self.output_parser.parse_or_fix(
+            response, kind, lambda fix_prompt: self._generate_response(fix_prompt, priority, method=method)
+        )
+
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        """Text of one streamed chunk; chunks without text parts (e.g. a bare finish reason) are empty"""
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            logger.error(f"Gemini generation error: {e}")
-            raise e
+            return chunk.text
+        except ValueError:
+            return ""
+
+    async def _stream_response(
+        self,
+        prompt: str,
+        priority: Priority = Priority.STANDARD,
+        method: str = "general"
+    ) -> AsyncIterator[str]:
+        """Yield response text as the model generates it
+
+        Takes the same limiter slot and circuit breaker as _generate_response.
+        The first chunk must arrive within the request timeout and each later
+        chunk within the same idle timeout. Failures before any text was
+        yielded are retried; after that the stream just ends with the error,
+        since the caller has already forwarded the partial text.
+        """
+        self._require_model()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.call_budget_seconds
+        attempt = 0
+        
+        while True:
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenError("Gemini circuit breaker is open")
+            
+            yielded = False
+            started = None
+            usage_chunk = None
+            call_span = None
+            queued = time.perf_counter()
+            try:
+                async with self.limiter.slot(
+                    priority, self._estimate_tokens(prompt), timeout=min(self.max_queue_seconds, deadline - loop.time())
+                ):
+                    started = time.perf_counter()
+                    call_span = self._start_call_span(method, attempt, started - queued)
+                    response = await asyncio.wait_for(
+                        self.model.generate_content_async(prompt, stream=True),
+                        timeout=min(self.request_timeout_seconds, max(0.0, deadline - loop.time()))
+                    )
+                    chunks = response.__aiter__()
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=self.request_timeout_seconds)
+                        except StopAsyncIteration:
+                            break
+                        if getattr(chunk, "usage_metadata", None) is not None:
+                            # Usage is reported on the last chunk, or updated on every one
+                            usage_chunk = chunk
+                        text = self._chunk_text(chunk)
+                        if text:
+                            yielded = True
+                            yield text
+            except (QueueTimeoutError, asyncio.CancelledError, GeneratorExit) as e:
+                # Local overload, or the client went away mid-stream
+                self._end_call_span(call_span, error=e)
+                self.circuit_breaker.release_probe()
+                raise
+            except Exception as e:
+                self._end_call_span(call_span, error=e)
+                if started is not None:
+                    record_model_failure(method, started, e)
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.error(f"Gemini stream timed out (attempt {attempt + 1})")
+                else:
+                    logger.error(f"Gemini stream error (attempt {attempt + 1}): {e}")
+                retryable = is_retryable(e)
+                self._record_breaker_failure(e, retryable)
+                
+                if yielded or not retryable or attempt >= self.retry_policy.max_retries:
+                    if attempt > 0:
+                        self.retries_exhausted += 1
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                if loop.time() + delay >= deadline:
+                    self.retries_exhausted += 1
+                    raise
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            
+            record_model_response(method, started, usage_chunk)
+            self._end_call_span(call_span, usage_chunk)
+            self.circuit_breaker.record_success()
+            return
 
+    @traced()
     async def generate_interview_questions(
         self, 
         role: str, 
@@ -80,8 +385,73 @@ class GeminiService:
         resume_text: str = None,
         question_count: int = 10
     ) -> List[Dict[str, Any]]:
-        """Generate tailored interview questions based on role, experience, and resume"""
+        """Generate tailored interview questions based on role, experience, and resume
+
+        Without a resume the questions only depend on the configuration, so
+        they are served from the question cache when a pool exists for it.
+        """
+        cache_key = None
+        if self.question_cache is not None and not resume_text:
+            cache_key = QuestionCache.make_key(role, experience_level, difficulty, question_count, QUESTION_PROMPT_VERSION)
+            cached = self.question_cache.get(cache_key, question_count)
+            if cached:
+                logger.info(f"Served {len(cached)} cached questions for {role} ({difficulty})")
+                return cached
+        
+        try:
+            questions = await self._generate_questions(role, experience_level, difficulty, resume_text, question_count)
+        except Exception as e:
+            logger.error(f"Question generation error: {e}")
+            # Fallback questions if AI fails
+            GEMINI_FALLBACKS.inc(method="questions")
+            return self._get_fallback_questions(role, experience_level, difficulty)
         
+        if cache_key is not None and questions:
+            self._cache_questions(cache_key, questions, role, experience_level, difficulty, question_count)
+        return questions
+
+    @traced()
+    async def prefetch_questions(self, role: str, experience_level: str, difficulty: str, question_count: int = 10):
+        """Generate one more question set for a configuration's cache pool
+
+        Runs at background priority and raises on failure.
+        """
+        # Two sets for the same pool must be generated separately, not shared
+        questions = await self._generate_questions(
+            role, experience_level, difficulty, question_count=question_count, priority=Priority.BACKGROUND, coalesce=False
+        )
+        if questions:
+            cache_key = QuestionCache.make_key(role, experience_level, difficulty, question_count, QUESTION_PROMPT_VERSION)
+            self._cache_questions(cache_key, questions, role, experience_level, difficulty, question_count)
+
+    def _cache_questions(
+        self,
+        cache_key: str,
+        questions: List[Dict[str, Any]],
+        role: str,
+        experience_level: str,
+        difficulty: str,
+        question_count: int
+    ):
+        self.question_cache.put(cache_key, questions, {
+            "role": role,
+            "experience_level": experience_level,
+            "difficulty": difficulty,
+            "question_count": question_count,
+            "prompt_version": QUESTION_PROMPT_VERSION
+        })
+
+    async def _generate_questions(
+        self,
+        role: str,
+        experience_level: str,
+        difficulty: str,
+        resume_text: str = None,
+        question_count: int = 10,
+        priority: Priority = Priority.INTERACTIVE,
+        coalesce: bool = True
+    ) -> List[Dict[str, Any]]:
+        """One model round trip for a question set; raises on failure"""
         resume_section = f"\n\nCandidate's Resume:\n{resume_text}" if resume_text else ""
         
         prompt = f"""
@@ -114,23 +484,12 @@ Format your response as a JSON array with this structure:
 Generate diverse, engaging questions that thoroughly assess the candidate's capabilities.
 """
 
-        try:
-            response = await self._generate_response(prompt)
-            # Clean and parse JSON response
-            json_start = response.find('[')
-            json_end = response.rfind(']') + 1
-            if json_start >= 0 and json_end > json_start:
-                questions_json = response[json_start:json_end]
-                questions = json.loads(questions_json)
-                logger.info(f"Generated {len(questions)} questions for {role} ({difficulty})")
-                return questions
-            else:
-                raise ValueError("Invalid JSON response from Gemini")
-        except Exception as e:
-            logger.error(f"Question generation error: {e}")
-            # Fallback questions if AI fails
-            return self._get_fallback_questions(role, experience_level, difficulty)
+        response = await self._generate_response(prompt, priority, coalesce=coalesce, method="questions")
+        questions = await self._parse_structured(response, "questions", priority, "questions")
+        logger.info(f"Generated {len(questions)} questions for {role} ({difficulty})")
+        return questions
 
+    @traced()
     async def evaluate_answer(
         self, 
         question: str, 
@@ -139,11 +498,55 @@ Generate diverse, engaging questions that thoroughly assess the candidate's capa
         experience_level: str,
         evaluation_criteria: List[str] = None
     ) -> Dict[str, Any]:
-        """Evaluate candidate's answer using AI"""
+        """Evaluate candidate's answer using AI, reusing cached evaluations of matching answers"""
+        use_cache = self.evaluation_cache is not None and self.evaluation_cache.enabled_for(role)
+        if use_cache:
+            cache_key = self.evaluation_cache.key_for(question, answer, role, experience_level, evaluation_criteria)
+            cached = self.evaluation_cache.lookup(cache_key)
+            if cached:
+                evaluation, match, similarity = cached
+                logger.info(f"Served cached evaluation ({match} match, similarity {similarity})")
+                return evaluation
         
+        try:
+            started = time.perf_counter()
+            evaluation = await self._evaluate(question, answer, role, experience_level, evaluation_criteria)
+            latency = time.perf_counter() - started
+        except Exception as e:
+            logger.error(f"Answer evaluation error: {e}")
+            # Fallback evaluation
+            GEMINI_FALLBACKS.inc(method="evaluate")
+            return self._get_fallback_evaluation(answer)
+        
+        if use_cache:
+            self.evaluation_cache.store(cache_key, evaluation, latency)
+        return evaluation
+
+    async def _evaluate(
+        self,
+        question: str,
+        answer: str,
+        role: str,
+        experience_level: str,
+        evaluation_criteria: List[str] = None
+    ) -> Dict[str, Any]:
+        """One model round trip for an evaluation; raises on failure"""
+        prompt = self._evaluation_prompt(question, answer, role, experience_level, evaluation_criteria)
+        response = await self._generate_response(prompt, Priority.INTERACTIVE, method="evaluate")
+        return await self._parse_evaluation(response)
+
+    @staticmethod
+    def _evaluation_prompt(
+        question: str,
+        answer: str,
+        role: str,
+        experience_level: str,
+        evaluation_criteria: List[str] = None
+    ) -> str:
+        """Evaluation prompt; detailed_feedback comes first so streaming can show it early"""
         criteria_section = f"Evaluation Criteria: {', '.join(evaluation_criteria)}" if evaluation_criteria else ""
         
-        prompt = f"""
+        return f"""
 You are an expert interviewer evaluating a candidate's response. Analyze this answer comprehensively:
 
 Position: {role}
@@ -154,6 +557,7 @@ Candidate's Answer: {answer}
 
 Provide a detailed evaluation in JSON format:
 {{
+  "detailed_feedback": "Comprehensive paragraph explaining the evaluation",
   "overall_score": 85,
   "scores": {{
     "technical_accuracy": 80,
@@ -164,7 +568,6 @@ Provide a detailed evaluation in JSON format:
   }},
   "strengths": ["Strong communication", "Good technical understanding"],
   "weaknesses": ["Could elaborate more on implementation", "Missing edge case considerations"],
-  "detailed_feedback": "Comprehensive paragraph explaining the evaluation",
   "improvement_suggestions": ["Suggestion 1", "Suggestion 2"],
   "follow_up_questions": ["Follow-up question 1", "Follow-up question 2"],
   "red_flags": ["Any concerning responses"],
@@ -174,29 +577,74 @@ Provide a detailed evaluation in JSON format:
 Be thorough, constructive, and provide actionable feedback.
 """
 
+    async def _parse_evaluation(self, response: str) -> Dict[str, Any]:
+        """Extract the evaluation JSON from a model response"""
+        evaluation = await self._parse_structured(response, "evaluation", Priority.INTERACTIVE, "evaluate")
+        logger.info(f"Evaluated answer - Score: {evaluation.get('overall_score', 0)}")
+        return evaluation
+
+    async def stream_evaluation(
+        self,
+        question: str,
+        answer: str,
+        role: str,
+        experience_level: str,
+        evaluation_criteria: List[str] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Evaluate an answer, streaming the detailed feedback as it is generated
+
+        Yields ("feedback", text) while the model writes the
+        "detailed_feedback" field, then ("evaluation", dict) once the whole
+        JSON object has been parsed. Cache hits and fallbacks yield their
+        feedback in one piece.
+        """
+        use_cache = self.evaluation_cache is not None and self.evaluation_cache.enabled_for(role)
+        if use_cache:
+            cache_key = self.evaluation_cache.key_for(question, answer, role, experience_level, evaluation_criteria)
+            cached = self.evaluation_cache.lookup(cache_key)
+            if cached:
+                evaluation, match, similarity = cached
+                logger.info(f"Served cached evaluation ({match} match, similarity {similarity})")
+                yield "feedback", evaluation.get("detailed_feedback", "")
+                yield "evaluation", evaluation
+                return
+        
+        prompt = self._evaluation_prompt(question, answer, role, experience_level, evaluation_criteria)
+        feedback = JsonStringFieldReader("detailed_feedback")
+        parts = []
+        streamed_feedback = False
         try:
-            response = await self._generate_response(prompt)
-            # Extract JSON from response
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                evaluation_json = response[json_start:json_end]
-                evaluation = json.loads(evaluation_json)
-                logger.info(f"Evaluated answer - Score: {evaluation.get('overall_score', 0)}")
-                return evaluation
-            else:
-                raise ValueError("Invalid JSON response from Gemini")
+            started = time.perf_counter()
+            async for text in self._stream_response(prompt, Priority.INTERACTIVE, method="evaluate"):
+                parts.append(text)
+                delta = feedback.feed(text)
+                if delta:
+                    streamed_feedback = True
+                    yield "feedback", delta
+            evaluation = await self._parse_evaluation("".join(parts))
+            latency = time.perf_counter() - started
         except Exception as e:
             logger.error(f"Answer evaluation error: {e}")
-            # Fallback evaluation
-            return self._get_fallback_evaluation(answer)
+            # The final evaluation replaces any partial feedback already sent
+            GEMINI_FALLBACKS.inc(method="evaluate")
+            evaluation = self._get_fallback_evaluation(answer)
+            if not streamed_feedback:
+                yield "feedback", evaluation["detailed_feedback"]
+            yield "evaluation", evaluation
+            return
+        
+        if use_cache:
+            self.evaluation_cache.store(cache_key, evaluation, latency)
+        yield "evaluation", evaluation
 
+    @traced()
     async def generate_follow_up_question(
         self, 
         original_question: str, 
         answer: str, 
         role: str,
-        context: str = None
+        context: str = None,
+        priority: Priority = Priority.INTERACTIVE
     ) -> str:
         """Generate intelligent follow-up questions based on the answer"""
         
@@ -219,14 +667,16 @@ Keep it conversational and professional.
 """
 
         try:
-            response = await self._generate_response(prompt)
+            response = await self._generate_response(prompt, priority, method="follow_up")
             follow_up = response.strip().replace('"', '').replace("Follow-up question:", "").strip()
             logger.info("Generated follow-up question")
             return follow_up
         except Exception as e:
             logger.error(f"Follow-up generation error: {e}")
+            GEMINI_FALLBACKS.inc(method="follow_up")
             return "Can you elaborate more on that approach?"
 
+    @traced()
     async def generate_final_report(
         self, 
         candidate_data: Dict[str, Any],
@@ -276,28 +726,40 @@ Provide honest, constructive, and comprehensive feedback.
 """
 
         try:
-            response = await self._generate_response(prompt)
-            # Extract JSON
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                report_json = response[json_start:json_end]
-                report = json.loads(report_json)
-                report['generated_at'] = datetime.now().isoformat()
-                logger.info("Generated comprehensive interview report")
-                return report
-            else:
-                raise ValueError("Invalid JSON response from Gemini")
+            response = await self._generate_response(prompt, Priority.BACKGROUND, method="report")
+            report = await self._parse_structured(response, "report", Priority.BACKGROUND, "report")
+            report['generated_at'] = datetime.now().isoformat()
+            logger.info("Generated comprehensive interview report")
+            return report
         except Exception as e:
             logger.error(f"Report generation error: {e}")
+            GEMINI_FALLBACKS.inc(method="report")
             return self._get_fallback_report(interview_session)
 
+    @traced()
     async def answer_general_question(self, question: str, context: str = None) -> str:
         """Answer general technical/career questions"""
-        
+        try:
+            response = await self._generate_response(self._general_question_prompt(question, context), Priority.STANDARD)
+            logger.info("Answered general question")
+            return response.strip()
+        except Exception as e:
+            logger.error(f"General question error: {e}")
+            GEMINI_FALLBACKS.inc(method="general")
+            return "I apologize, but I'm having trouble processing that question right now. Please try rephrasing or ask something else."
+
+    async def stream_general_answer(self, question: str, context: str = None) -> AsyncIterator[str]:
+        """Answer a general question chunk by chunk; raises if the model call fails"""
+        async for text in self._stream_response(self._general_question_prompt(question, context), Priority.STANDARD):
+            yield text
+        logger.info("Streamed answer to general question")
+
+    @staticmethod
+    def _general_question_prompt(question: str, context: str = None) -> str:
+        """Mentor prompt shared by the buffered and streaming answers"""
         context_section = f"Context: {context}" if context else ""
         
-        prompt = f"""
+        return f"""
 You are a knowledgeable technical mentor and career advisor. Answer this question clearly and helpfully:
 
 Question: {question}
@@ -307,14 +769,6 @@ Provide a clear, informative, and practical answer. Include examples where appro
 Keep the response professional and educational.
 """
 
-        try:
-            response = await self._generate_response(prompt)
-            logger.info("Answered general question")
-            return response.strip()
-        except Exception as e:
-            logger.error(f"General question error: {e}")
-            return "I apologize, but I'm having trouble processing that question right now. Please try rephrasing or ask something else."
-
     def _format_qa_pairs(self, qa_pairs: List[Dict]) -> str:
         """Format Q&A pairs for report generation"""
         formatted = ""
@@ -3,12 +3,17 @@ Interview Service - Orchestrates the complete interview process
 Integrates Gemini AI service with session management
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from config.settings import get_settings
 from services.gemini_service import GeminiService
+from services.rate_limiter import Priority
 from services.session_service import SessionService
+from services.speculation import SpeculativeFollowUps
+from services.tracing import traced
 from models.api_models import *
 
 logger = logging.getLogger(__name__)
@@ -17,11 +22,29 @@ class InterviewService:
     def __init__(self, gemini_service: GeminiService, session_service: SessionService):
         self.gemini = gemini_service
         self.session = session_service
+        
+        # Follow-ups are generated while the answer is evaluated and kept until asked for
+        self.follow_ups = SpeculativeFollowUps() if get_settings().speculative_follow_ups_enabled else None
+        if self.follow_ups is not None:
+            self.session.add_removal_listener(self.follow_ups.cancel)
+
+    async def close(self):
+        """Cancel speculative work still in flight"""
+        if self.follow_ups is not None:
+            await self.follow_ups.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Speculative follow-up counters"""
+        return {
+            "speculative_follow_ups": self.follow_ups.get_stats() if self.follow_ups is not None else None
+        }
 
+    @traced()
     async def create_interview_session(self, user_email: str = None) -> str:
         """Create a new interview session"""
         return await self.session.create_session(user_email)
 
+    @traced(record=("session_id",))
     async def setup_interview(
         self, 
         session_id: str, 
@@ -76,22 +99,35 @@ class InterviewService:
                 estimated_duration_minutes=0
             )
 
+    @traced(record=("session_id",))
     async def get_next_question(self, session_id: str) -> Optional[InterviewQuestion]:
         """Get the next question in the interview"""
         question_data = await self.session.get_next_question(session_id)
         if question_data:
-            return InterviewQuestion(**question_data)
+            question = InterviewQuestion(**question_data)
+            if self.follow_ups is not None:
+                # Only if already generated; the next question must not wait on the model
+                question.previous_follow_up = self.follow_ups.ready(session_id)
+            return question
         return None
 
+    @traced(record=("session_id",))
     async def submit_answer(
         self, 
         session_id: str, 
         question_id: int, 
         question_text: str, 
         answer_text: str,
-        response_time_seconds: int = None
+        response_time_seconds: int = None,
+        include_follow_up: bool = False
     ) -> AnswerEvaluationResponse:
-        """Submit and evaluate an answer"""
+        """Submit and evaluate an answer
+
+        With `include_follow_up` the follow-up to the answer is generated at
+        the same time and both are returned in one response. Otherwise, if
+        speculative follow-ups are enabled, it is generated in the background
+        and kept for the next follow-up or next-question call.
+        """
         
         # Get session data for context
         session_data = await self.session.get_session(session_id)
@@ -100,15 +136,27 @@ class InterviewService:
 
         role = session_data.get("role", "")
         experience_level = session_data.get("experience_level", "")
+        self._speculate_follow_up(
+            session_id, session_data, question_text, answer_text,
+            # Awaited below when included, so it is as urgent as the evaluation
+            Priority.INTERACTIVE if include_follow_up else Priority.BACKGROUND
+        )
 
         try:
             # Evaluate answer using Gemini AI
-            evaluation = await self.gemini.evaluate_answer(
+            evaluation_call = self.gemini.evaluate_answer(
                 question=question_text,
                 answer=answer_text,
                 role=role,
                 experience_level=experience_level
             )
+            follow_up = None
+            if include_follow_up:
+                evaluation, follow_up = await asyncio.gather(
+                    evaluation_call, self._follow_up(session_id, role, question_text, answer_text)
+                )
+            else:
+                evaluation = await evaluation_call
 
             # Save answer and evaluation to session
             await self.session.submit_answer(
@@ -121,40 +169,150 @@ class InterviewService:
             logger.info(f"Answer evaluated for session {session_id}, question {question_id}: {evaluation.get('overall_score', 0)}/100")
 
             # Convert to response model
-            return AnswerEvaluationResponse(
-                success=True,
-                overall_score=evaluation.get("overall_score", 0),
-                scores=AnswerEvaluationScores(**evaluation.get("scores", {})),
-                strengths=evaluation.get("strengths", []),
-                weaknesses=evaluation.get("weaknesses", []),
-                detailed_feedback=evaluation.get("detailed_feedback", ""),
-                improvement_suggestions=evaluation.get("improvement_suggestions", []),
-                follow_up_questions=evaluation.get("follow_up_questions", []),
-                red_flags=evaluation.get("red_flags", []),
-                positive_indicators=evaluation.get("positive_indicators", [])
-            )
+            return self._evaluation_response(evaluation, follow_up)
 
         except Exception as e:
             logger.error(f"Answer evaluation failed for session {session_id}: {e}")
-            return AnswerEvaluationResponse(
-                success=False,
-                overall_score=0,
-                scores=AnswerEvaluationScores(
-                    technical_accuracy=0,
-                    communication_clarity=0,
-                    depth_of_knowledge=0,
-                    problem_solving=0,
-                    confidence=0
-                ),
-                strengths=[],
-                weaknesses=["Evaluation failed"],
-                detailed_feedback="Unable to evaluate answer at this time.",
-                improvement_suggestions=[],
-                follow_up_questions=[],
-                red_flags=[],
-                positive_indicators=[]
+            return self._failed_evaluation_response()
+
+    async def stream_submit_answer(
+        self,
+        session_id: str,
+        question_id: int,
+        question_text: str,
+        answer_text: str,
+        response_time_seconds: int = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Submit an answer and stream its evaluation
+
+        The session is checked before anything is streamed, so an invalid ID
+        still raises ValueError. The returned iterator yields
+        ("feedback", {"text": ...}) events and finally ("result", AnswerEvaluationResponse).
+        """
+        session_data = await self.session.get_session(session_id)
+        if not session_data:
+            raise ValueError("Invalid session ID")
+        self._speculate_follow_up(session_id, session_data, question_text, answer_text, Priority.BACKGROUND)
+        return self._stream_evaluation(
+            session_id, question_id, question_text, answer_text,
+            session_data.get("role", ""), session_data.get("experience_level", "")
+        )
+
+    async def _stream_evaluation(
+        self,
+        session_id: str,
+        question_id: int,
+        question_text: str,
+        answer_text: str,
+        role: str,
+        experience_level: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        try:
+            evaluation = None
+            async for event, data in self.gemini.stream_evaluation(
+                question=question_text,
+                answer=answer_text,
+                role=role,
+                experience_level=experience_level
+            ):
+                if event == "feedback":
+                    yield "feedback", {"text": data}
+                else:
+                    evaluation = data
+
+            await self.session.submit_answer(
+                session_id=session_id,
+                question_id=question_id,
+                answer_text=answer_text,
+                evaluation=evaluation
+            )
+            logger.info(f"Answer evaluated (streamed) for session {session_id}, question {question_id}: {evaluation.get('overall_score', 0)}/100")
+            result = self._evaluation_response(evaluation)
+        except Exception as e:
+            logger.error(f"Answer evaluation failed for session {session_id}: {e}")
+            result = self._failed_evaluation_response()
+        yield "result", result
+
+    def _speculate_follow_up(
+        self,
+        session_id: str,
+        session_data: Dict[str, Any],
+        question_text: str,
+        answer_text: str,
+        priority: Priority
+    ):
+        """Start generating the follow-up to an answer while it is evaluated
+
+        Skipped for the last question, where no follow-up will be asked.
+        """
+        if self.follow_ups is None:
+            return
+        questions = session_data.get("questions", [])
+        if questions and len(session_data.get("answers", [])) + 1 >= len(questions):
+            return
+        self.follow_ups.start(
+            session_id,
+            SpeculativeFollowUps.make_key(question_text, answer_text),
+            self.gemini.generate_follow_up_question(
+                original_question=question_text,
+                answer=answer_text,
+                role=session_data.get("role", ""),
+                priority=priority
             )
+        )
+
+    async def _follow_up(self, session_id: str, role: str, question_text: str, answer_text: str) -> str:
+        """The speculative follow-up for this answer if there is one, else a fresh one"""
+        if self.follow_ups is not None:
+            follow_up = await self.follow_ups.take(session_id, SpeculativeFollowUps.make_key(question_text, answer_text))
+            if follow_up is not None:
+                return follow_up
+        return await self.gemini.generate_follow_up_question(
+            original_question=question_text,
+            answer=answer_text,
+            role=role
+        )
+
+    @staticmethod
+    def _evaluation_response(evaluation: Dict[str, Any], follow_up: str = None) -> AnswerEvaluationResponse:
+        """Response model for a stored evaluation"""
+        return AnswerEvaluationResponse(
+            success=True,
+            overall_score=evaluation.get("overall_score", 0),
+            scores=AnswerEvaluationScores(**evaluation.get("scores", {})),
+            strengths=evaluation.get("strengths", []),
+            weaknesses=evaluation.get("weaknesses", []),
+            detailed_feedback=evaluation.get("detailed_feedback", ""),
+            improvement_suggestions=evaluation.get("improvement_suggestions", []),
+            follow_up_questions=evaluation.get("follow_up_questions", []),
+            red_flags=evaluation.get("red_flags", []),
+            positive_indicators=evaluation.get("positive_indicators", []),
+            follow_up_question=follow_up
+        )
+
+    @staticmethod
+    def _failed_evaluation_response() -> AnswerEvaluationResponse:
+        """Response when the answer could not be evaluated or saved"""
+        return AnswerEvaluationResponse(
+            success=False,
+            overall_score=0,
+            scores=AnswerEvaluationScores(
+                technical_accuracy=0,
+                communication_clarity=0,
+                depth_of_knowledge=0,
+                problem_solving=0,
+                confidence=0
+            ),
+            strengths=[],
+            weaknesses=["Evaluation failed"],
+            detailed_feedback="Unable to evaluate answer at this time.",
+            improvement_suggestions=[],
+            follow_up_questions=[],
+            red_flags=[],
+            positive_indicators=[]
+        )
 
+    @traced(record=("session_id",))
     async def generate_follow_up(
         self, 
         session_id: str, 
@@ -170,11 +328,7 @@ class InterviewService:
         role = session_data.get("role", "")
 
         try:
-            follow_up = await self.gemini.generate_follow_up_question(
-                original_question=original_question,
-                answer=answer,
-                role=role
-            )
+            follow_up = await self._follow_up(session_id, role, original_question, answer)
             
             logger.info(f"Generated follow-up for session {session_id}")
             return follow_up
@@ -183,13 +337,18 @@ class InterviewService:
             logger.error(f"Follow-up generation failed for session {session_id}: {e}")
             return "Can you provide more details about your approach?"
 
+    @traced(record=("session_id",))
     async def get_interview_progress(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get current interview progress"""
         return await self.session.get_interview_progress(session_id)
 
+    @traced(record=("session_id",))
     async def complete_interview(self, session_id: str) -> FinalReportResponse:
         """Complete interview and generate final report"""
         
+        if self.follow_ups is not None:
+            self.follow_ups.cancel(session_id)
+        
         # Get complete interview data
         interview_summary = await self.session.get_interview_summary(session_id)
         if not interview_summary:
@@ -264,6 +423,7 @@ class InterviewService:
             # Return a basic report on failure
             return self._create_fallback_report(session_id, interview_summary)
 
+    @traced()
     async def answer_general_question(self, question: str, context: str = None) -> GeneralQuestionResponse:
         """Answer general technical/career questions"""
         try:
@@ -283,6 +443,34 @@ class InterviewService:
                 related_topics=[]
             )
 
+    async def stream_general_answer(self, question: str, context: str = None) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream an answer as ("chunk", {"text": ...}) events, then ("result", GeneralQuestionResponse)"""
+        parts = []
+        complete = True
+        try:
+            async for text in self.gemini.stream_general_answer(question, context):
+                parts.append(text)
+                yield "chunk", {"text": text}
+        except Exception as e:
+            logger.error(f"General question streaming failed: {e}")
+            if not parts:
+                yield "result", GeneralQuestionResponse(
+                    success=False,
+                    answer="I apologize, but I'm unable to answer that question right now. Please try rephrasing or ask something else.",
+                    related_topics=[]
+                )
+                return
+            # The client keeps the partial answer it already rendered
+            complete = False
+            yield "error", {"detail": "Answer was cut off"}
+        
+        answer = "".join(parts).strip()
+        yield "result", GeneralQuestionResponse(
+            success=complete,
+            answer=answer,
+            related_topics=self._extract_topics(answer)
+        )
+
     def _calculate_interview_duration(self, interview_summary: Dict[str, Any]) -> str:
         """Calculate interview duration"""
         try:
@@ -0,0 +1,216 @@
+"""
+Process-wide metrics in the Prometheus text exposition format
+Request latency per route, Gemini calls per method, and gauges filled in at scrape time
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; model calls run to tens of seconds, most routes to a few milliseconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class _Metric:
+    """One metric family: a value per combination of label values"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        self._values.clear()
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(f"{line}\n" for line in self.samples())
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str):
+        self._values[self._key(labels)] = value
+
+class _HistogramValue:
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * bucket_count
+        self.sum = 0.0
+        self.count = 0
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        histogram = self._values.get(key)
+        if histogram is None:
+            histogram = self._values[key] = _HistogramValue(len(self.buckets) + 1)
+        # Per-bucket counts; render() makes them cumulative. The last slot is +Inf.
+        histogram.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        bounds = self.buckets + (float("inf"),)
+        for key, histogram in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, histogram.bucket_counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(histogram.sum, 6))}")
+            lines.append(f"{self.name}_count{labels} {histogram.count}")
+        return lines
+
+class MetricsRegistry:
+    """The metric families exposed on /metrics, in registration order"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Every family in the text exposition format"""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+# One registry per process, like the settings; every service records into it
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "Time from request start to the last response byte", ("method", "route", "status")
+)
+GEMINI_REQUESTS = registry.counter(
+    "gemini_requests_total", "Upstream model requests, one per attempt, by calling method and outcome", ("method", "outcome")
+)
+GEMINI_REQUEST_DURATION = registry.histogram(
+    "gemini_request_duration_seconds", "Upstream model latency per attempt, excluding time queued for a slot", ("method",)
+)
+GEMINI_FALLBACKS = registry.counter(
+    "gemini_fallbacks_total", "Calls answered with built-in fallback content after the model failed", ("method",)
+)
+GEMINI_TOKENS = registry.counter(
+    "gemini_tokens_total", "Tokens reported by the model's usage metadata", ("method", "direction")
+)
+GEMINI_IN_FLIGHT = registry.gauge("gemini_in_flight_requests", "Model calls holding a limiter slot")
+GEMINI_QUEUED = registry.gauge("gemini_queued_requests", "Model calls waiting for a limiter slot")
+SESSIONS = registry.gauge("interview_sessions", "Known sessions by status", ("status",))
+ACTIVE_SESSIONS = registry.gauge("interview_active_sessions", "Sessions that have not expired or been deleted")
+
+def record_model_response(method: str, started: float, response) -> None:
+    """Latency and token usage of one successful upstream request"""
+    GEMINI_REQUESTS.inc(method=method, outcome="success")
+    GEMINI_REQUEST_DURATION.observe(time.perf_counter() - started, method=method)
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        GEMINI_TOKENS.inc(getattr(usage, "prompt_token_count", 0) or 0, method=method, direction="prompt")
+        GEMINI_TOKENS.inc(getattr(usage, "candidates_token_count", 0) or 0, method=method, direction="output")
+
+def record_model_failure(method: str, started: float, error: Exception) -> None:
+    """Latency and outcome of one failed upstream request"""
+    outcome = "timeout" if isinstance(error, asyncio.TimeoutError) else "error"
+    GEMINI_REQUESTS.inc(method=method, outcome=outcome)
+    GEMINI_REQUEST_DURATION.observe(time.perf_counter() - started, method=method)
+
+def route_template(scope) -> str:
+    """Path template of the route that handled a request, "unmatched" if none did"""
+    # FastAPI stores the matched route in the scope it shares with middleware
+    # and its path already includes the include_router prefix
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by method, route template and status
+
+    Routes are labelled by their path template ("/api/reports/analytics/{session_id}")
+    so label cardinality stays bounded; requests that match no route share
+    one "unmatched" label. Streaming responses are timed to their last chunk.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route_template(scope),
+                status=str(status["code"])
+            )
@@ -0,0 +1,39 @@
+"""
+Model backends for GeminiService
+The Google Gemini SDK, or a deterministic local fake for load tests and CI
+"""
+
+import logging
+import os
+from typing import Any, Dict, List
+
+import google.generativeai as genai
+
+logger = logging.getLogger(__name__)
+
+# Values accepted by the GEMINI_BACKEND setting
+MODEL_BACKENDS = ("gemini", "fake")
+
+class ModelUnavailableError(RuntimeError):
+    """No model backend could be created, e.g. the API key is missing"""
+
+def create_model(backend: str, model_name: str, generation_config: Dict[str, Any], safety_settings: List[Dict[str, str]]):
+    """A model object with generate_content_async(prompt, stream=False), as GeminiService calls it"""
+    if backend == "gemini":
+        return _gemini_model(model_name, generation_config, safety_settings)
+    if backend == "fake":
+        from services.fake_model import FakeModelBackend
+        return FakeModelBackend.from_settings()
+    raise ModelUnavailableError(f"Unknown model backend '{backend}' (expected one of: {', '.join(MODEL_BACKENDS)})")
+
+def _gemini_model(model_name: str, generation_config: Dict[str, Any], safety_settings: List[Dict[str, str]]):
+    # Get your API key from: https://makersuite.google.com/app/apikey
+    api_key = os.getenv("GOOGLE_AI_API_KEY")
+    if not api_key:
+        raise ModelUnavailableError("GOOGLE_AI_API_KEY environment variable is required")
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config=generation_config,
+        safety_settings=safety_settings
+    )
@@ -0,0 +1,285 @@
+"""
+Opt-in per-request sampling profiler
+Wall-clock stacks of one request, saved as speedscope or collapsed-stack files under logs/profiles/
+"""
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FORMATS = ("speedscope", "collapsed")
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$")
+
+# Leaf added to a stack while the request's task is suspended, e.g. on the model or a disk thread
+AWAITING_FRAME = "[awaiting]"
+
+_EXTENSIONS = {"speedscope": ".speedscope.json", "collapsed": ".collapsed.txt"}
+_BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_BACKEND_DIR):
+        filename = os.path.relpath(filename, _BACKEND_DIR)
+    elif "site-packages" in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({filename}:{code.co_firstlineno})"
+
+def _await_chain(coro) -> List[Any]:
+    """Frames of a suspended coroutine and everything it is awaiting, outermost first"""
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "ag_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        awaited = getattr(coro, "cr_await", None) or getattr(coro, "ag_await", None) or getattr(coro, "gi_yieldfrom", None)
+        # Follow into tasks the coroutine is waiting on directly
+        if isinstance(awaited, asyncio.Task):
+            awaited = awaited.get_coro()
+        coro = awaited
+    return frames
+
+class RequestSampler:
+    """Samples one request's stack from a background thread
+
+    A sample is the thread's real stack while the request's task is running
+    on the event loop, and the coroutine await chain plus an "[awaiting]"
+    leaf while it is suspended, so time spent waiting for the model or a
+    disk thread shows up too. Stacks start at `root_frame`, the frame of
+    the middleware that started the sampler.
+    """
+
+    def __init__(self, task: asyncio.Task, root_frame, interval_seconds: float):
+        self.task = task
+        self.root_frame = root_frame
+        self.interval_seconds = interval_seconds
+        self.thread_id = threading.get_ident()
+        self.samples: List[Tuple[str, ...]] = []
+        self.weights: List[float] = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval_seconds):
+            stack = self._sample()
+            now = time.perf_counter()
+            if stack:
+                self.samples.append(stack)
+                self.weights.append(now - last)
+            last = now
+
+    def _sample(self) -> Tuple[str, ...]:
+        coro = self.task.get_coro()
+        if getattr(coro, "cr_running", False):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                if frame is self.root_frame:
+                    break
+                frame = frame.f_back
+            frames.reverse()
+            leaf = ()
+        else:
+            frames = _await_chain(coro)
+            leaf = (AWAITING_FRAME,)
+        for index, frame in enumerate(frames):
+            if frame is self.root_frame:
+                return tuple(_frame_label(frame) for frame in frames[index:]) + leaf
+        return ()
+
+class ProfileStore:
+    """Profile files in a directory, newest kept up to `max_profiles`"""
+
+    def __init__(self, directory: str, profile_format: str = "speedscope", max_profiles: int = 50):
+        if profile_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format '{profile_format}' (expected one of: {', '.join(PROFILE_FORMATS)})")
+        self.directory = Path(directory)
+        self.profile_format = profile_format
+        self.max_profiles = max_profiles
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{secrets.token_hex(4)}"
+
+    def _meta_file(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}.meta.json"
+
+    async def save(self, profile_id: str, sampler: RequestSampler, meta: Dict[str, Any]):
+        """Write the profile and its metadata, then drop the oldest beyond the limit"""
+        meta = dict(
+            meta,
+            id=profile_id,
+            format=self.profile_format,
+            duration_ms=round(sampler.elapsed * 1000, 1),
+            samples=len(sampler.samples),
+            created_at=datetime.now().isoformat()
+        )
+        if self.profile_format == "speedscope":
+            content = json.dumps(self._speedscope(sampler, f"{meta['method']} {meta['path']}"))
+        else:
+            content = self._collapsed(sampler)
+        await asyncio.to_thread(self._write, profile_id, content, meta)
+        return meta
+
+    def _write(self, profile_id: str, content: str, meta: Dict[str, Any]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{profile_id}{_EXTENSIONS[self.profile_format]}").write_text(content, encoding="utf-8")
+        self._meta_file(profile_id).write_text(json.dumps(meta), encoding="utf-8")
+        for old in self._list_meta()[self.max_profiles:]:
+            for path in self.directory.glob(f"{old['id']}.*"):
+                path.unlink(missing_ok=True)
+
+    def _list_meta(self) -> List[Dict[str, Any]]:
+        if not self.directory.exists():
+            return []
+        profiles = []
+        for meta_file in self.directory.glob("*.meta.json"):
+            try:
+                profiles.append(json.loads(meta_file.read_text(encoding="utf-8")))
+            except (OSError, ValueError) as e:
+                logger.error(f"Unreadable profile metadata {meta_file.name}: {e}")
+        return sorted(profiles, key=lambda meta: meta.get("created_at", ""), reverse=True)
+
+    async def list(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Metadata of the most recent profiles, newest first"""
+        return (await asyncio.to_thread(self._list_meta))[:limit]
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """File of a saved profile, None for unknown or malformed IDs"""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        for extension in _EXTENSIONS.values():
+            path = self.directory / f"{profile_id}{extension}"
+            if path.exists():
+                return path
+        return None
+
+    @staticmethod
+    def _collapsed(sampler: RequestSampler) -> str:
+        """Brendan Gregg's folded format: one "frame;frame;frame milliseconds" line per distinct stack"""
+        totals: Dict[Tuple[str, ...], float] = {}
+        for stack, weight in zip(sampler.samples, sampler.weights):
+            totals[stack] = totals.get(stack, 0.0) + weight
+        return "".join(f"{';'.join(stack)} {max(1, round(weight * 1000))}\n" for stack, weight in totals.items())
+
+    @staticmethod
+    def _speedscope(sampler: RequestSampler, name: str) -> Dict[str, Any]:
+        """A sampled profile in speedscope's file format, weighted by the time between samples"""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[str, int] = {}
+        samples = []
+        for stack in sampler.samples:
+            indices = []
+            for label in stack:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(frame_index[label])
+            samples.append(indices)
+        weights = [round(weight * 1000, 3) for weight in sampler.weights]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights
+            }],
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "ai-interview-backend"
+        }
+
+def is_admin_token(token: Optional[str], admin_token: str) -> bool:
+    """Constant-time token check; an empty configured token matches nothing"""
+    return bool(admin_token) and bool(token) and hmac.compare_digest(token.encode(), admin_token.encode())
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that ask for it with an admin token
+
+    A request is profiled when it sends `X-Profile: 1` or `?profile=1`
+    together with the admin token in the `X-Admin-Token` header. The token
+    is never read from the query string, which ends up in access logs.
+    The response carries the profile's ID in `X-Profile-Id`; the file is
+    written once the response has been sent. Other requests pass straight
+    through.
+    """
+
+    def __init__(self, app, store: ProfileStore, admin_token: str, interval_seconds: float = 0.005):
+        self.app = app
+        self.store = store
+        self.admin_token = admin_token
+        self.interval_seconds = interval_seconds
+
+    def _wants_profile(self, scope) -> bool:
+        headers = dict(scope.get("headers") or [])
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        flag = headers.get(b"x-profile", b"").decode("latin-1") or (query.get("profile") or [""])[0]
+        if flag.lower() not in ("1", "true", "yes"):
+            return False
+        token = headers.get(b"x-admin-token", b"").decode("latin-1")
+        if not is_admin_token(token, self.admin_token):
+            logger.warning(f"Profiling requested without a valid admin token: {scope['method']} {scope['path']}")
+            return False
+        return True
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.admin_token or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.store.new_id()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message = dict(message, headers=list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())])
+            await send(message)
+
+        sampler = RequestSampler(asyncio.current_task(), sys._getframe(), self.interval_seconds)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            try:
+                meta = await self.store.save(profile_id, sampler, {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status["code"]
+                })
+                logger.info(f"Saved profile {profile_id}: {meta['method']} {meta['path']} {meta['duration_ms']}ms, {meta['samples']} samples")
+            except Exception as e:
+                logger.error(f"Failed to save profile {profile_id}: {e}")
@@ -0,0 +1,183 @@
+"""
+Question bank prefetcher
+Keeps the question cache stocked for every standard role, experience level and difficulty
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from config.settings import InterviewConfig
+from services.question_cache import QuestionCache
+from services.gemini_service import GeminiService, QUESTION_PROMPT_VERSION
+from services.model_backend import ModelUnavailableError
+from services.rate_limiter import QueueTimeoutError
+from services.resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+def parse_roles(value: str) -> List[str]:
+    """Roles named by QUESTION_BANK_ROLES: a comma-separated list, or "all" for every job role"""
+    if value.strip().lower() == "all":
+        return list(InterviewConfig.JOB_ROLES)
+    return [role.strip() for role in value.split(",") if role.strip()]
+
+def standard_configurations(roles: List[str]) -> List[Tuple[str, str, str]]:
+    """(role, experience level, difficulty) for every combination the setup flow offers for `roles`"""
+    return list(itertools.product(
+        roles,
+        InterviewConfig.EXPERIENCE_LEVELS.keys(),
+        InterviewConfig.DIFFICULTY_LEVELS.keys()
+    ))
+
+class QuestionBankPrefetcher:
+    """Background worker that refills question pools below a low-water mark
+
+    Every `interval_seconds` each configuration's pool in the question cache
+    is checked; pools holding fewer than `low_water_mark` live sets are
+    topped up to `target_sets`, emptiest first. Generation runs at background
+    priority through the shared limiter, so interactive calls are served
+    first and the Gemini rate limits hold. A pass stops early when the
+    circuit breaker is open or the limiter cannot admit background work.
+    """
+
+    def __init__(
+        self,
+        gemini_service: GeminiService,
+        configurations: List[Tuple[str, str, str]],
+        target_sets: int = 2,
+        low_water_mark: int = 1,
+        question_count: int = 10,
+        concurrency: int = 2
+    ):
+        self.gemini = gemini_service
+        self.cache: QuestionCache = gemini_service.question_cache
+        self.configurations = configurations
+        self.target_sets = min(target_sets, self.cache.pool_size)
+        self.low_water_mark = min(low_water_mark, self.target_sets)
+        self.question_count = question_count
+        self.concurrency = concurrency
+
+        # Every configuration needs a pool of its own, or LRU eviction undoes the bank
+        if self.cache.max_keys < len(configurations):
+            logger.warning(
+                f"The question bank covers {len(configurations)} configurations but QUESTION_CACHE_MAX_KEYS is "
+                f"{self.cache.max_keys}; pools will be evicted and regenerated. Raise the limit or bank fewer roles."
+            )
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.passes = 0
+        self.refills = 0
+        self.failures = 0
+        self.interrupted_passes = 0
+        self.last_pass_seconds: Optional[float] = None
+        self.last_pass_at: Optional[float] = None
+
+    def _key(self, role: str, experience_level: str, difficulty: str) -> str:
+        return QuestionCache.make_key(role, experience_level, difficulty, self.question_count, QUESTION_PROMPT_VERSION)
+
+    def start(self, interval_seconds: float = 300.0):
+        """Fill the bank now, then re-check every `interval_seconds`"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(interval_seconds))
+
+    async def stop(self):
+        """Stop the worker and persist what it generated"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await self.cache.save()
+
+    async def _loop(self, interval_seconds: float):
+        while True:
+            try:
+                await self.refill()
+            except Exception as e:
+                logger.error(f"Question bank refill failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def _deficits(self) -> List[Tuple[int, Tuple[str, str, str]]]:
+        """(missing sets, configuration) for pools below the low-water mark, emptiest first"""
+        deficits = []
+        for configuration in self.configurations:
+            depth = self.cache.pool_depth(self._key(*configuration))
+            if depth < self.low_water_mark:
+                deficits.append((self.target_sets - depth, configuration))
+        deficits.sort(key=lambda item: -item[0])
+        return deficits
+
+    async def refill(self) -> int:
+        """One pass over every configuration; returns the number of sets generated"""
+        started = time.monotonic()
+        # One generation per work item, so a pool needing two sets gets two slots
+        work = [configuration for missing, configuration in self._deficits() for _ in range(missing)]
+        if not work:
+            self._finish_pass(started)
+            return 0
+
+        logger.info(f"Question bank: generating {len(work)} sets for {len(set(work))} configurations")
+        queue: asyncio.Queue = asyncio.Queue()
+        for configuration in work:
+            queue.put_nowait(configuration)
+        generated = 0
+        interrupted = False
+
+        async def worker():
+            nonlocal generated, interrupted
+            while not interrupted:
+                try:
+                    role, experience_level, difficulty = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await self.gemini.prefetch_questions(role, experience_level, difficulty, self.question_count)
+                    generated += 1
+                    self.refills += 1
+                except (CircuitOpenError, QueueTimeoutError, ModelUnavailableError) as e:
+                    # The model is down or interactive traffic needs the quota; retry next pass
+                    logger.warning(f"Question bank pass interrupted: {e}")
+                    interrupted = True
+                except Exception as e:
+                    self.failures += 1
+                    logger.error(f"Question bank generation failed for {role} ({experience_level}, {difficulty}): {e}")
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        if interrupted:
+            self.interrupted_passes += 1
+        self._finish_pass(started)
+        logger.info(f"Question bank: generated {generated} sets in {self.last_pass_seconds:.1f}s")
+        return generated
+
+    def _finish_pass(self, started: float):
+        self.passes += 1
+        self.last_pass_seconds = round(time.monotonic() - started, 3)
+        self.last_pass_at = time.time()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fill level across all configurations and worker counters"""
+        depths = [self.cache.pool_depth(self._key(*configuration)) for configuration in self.configurations]
+        ready = sum(min(depth, self.target_sets) for depth in depths)
+        capacity = len(self.configurations) * self.target_sets
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "configurations": len(self.configurations),
+            "target_sets": self.target_sets,
+            "low_water_mark": self.low_water_mark,
+            "ready_sets": ready,
+            "fill_ratio": round(ready / capacity, 4) if capacity else 0.0,
+            "empty_configurations": sum(1 for depth in depths if depth == 0),
+            "below_low_water": sum(1 for depth in depths if depth < self.low_water_mark),
+            "passes": self.passes,
+            "interrupted_passes": self.interrupted_passes,
+            "refills": self.refills,
+            "failures": self.failures,
+            "last_pass_seconds": self.last_pass_seconds,
+            "last_pass_at": self.last_pass_at
+        }
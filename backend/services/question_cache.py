@@ -0,0 +1,212 @@
+"""
+Interview question cache
+Persistent pools of generated question sets keyed on the interview configuration
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from services.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+class QuestionCache:
+    """Pools of previously generated question sets with TTL and an LRU size bound
+
+    Each key (role, experience level, difficulty, question count, prompt
+    version) holds up to `pool_size` generated sets. A hit samples a fresh
+    combination of questions from the whole pool, so users with the same
+    configuration do not all get the identical interview.
+
+    New sets only mark the cache dirty; it is written by a background loop
+    every save interval (see start()) and on stop(), not once per miss.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "data/cache/question_cache.json",
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_keys: int = 500,
+        pool_size: int = 5
+    ):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+        self.pool_size = pool_size
+
+        # key -> {"params": {...}, "sets": [{"generated_at": ts, "questions": [...]}]}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._save_lock = asyncio.Lock()
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.saves = 0
+
+    @staticmethod
+    def make_key(role: str, experience_level: str, difficulty: str, question_count: int, prompt_version: int) -> str:
+        """Content address of one interview configuration"""
+        parts = [
+            (role or "").strip().lower(),
+            (experience_level or "").strip().lower(),
+            (difficulty or "").strip().lower(),
+            str(question_count),
+            str(prompt_version)
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def _live_sets(self, key: str) -> List[Dict[str, Any]]:
+        """Sets for a key that are still within the TTL; expired ones are dropped"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return []
+        cutoff = time.time() - self.ttl_seconds
+        live = [s for s in entry["sets"] if s["generated_at"] >= cutoff]
+        if len(live) != len(entry["sets"]):
+            self.expirations += len(entry["sets"]) - len(live)
+            entry["sets"] = live
+        if not live:
+            del self._entries[key]
+        return live
+
+    def get(self, key: str, question_count: int) -> Optional[List[Dict[str, Any]]]:
+        """A randomized question set sampled from the pool, or None on a miss"""
+        sets = self._live_sets(key)
+        if not sets:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        # Unique questions across every set in the pool
+        pool = {}
+        for question_set in sets:
+            for question in question_set["questions"]:
+                pool.setdefault(str(question.get("question", "")).strip().lower(), question)
+        questions = list(pool.values())
+        sample = random.sample(questions, min(question_count, len(questions)))
+
+        result = copy.deepcopy(sample)
+        for index, question in enumerate(result, 1):
+            question["id"] = index
+        return result
+
+    def pool_depth(self, key: str) -> int:
+        """Number of live sets pooled for a key"""
+        return len(self._live_sets(key))
+
+    def put(self, key: str, questions: List[Dict[str, Any]], params: Dict[str, Any] = None):
+        """Add a generated set to the key's pool, replacing the oldest when full"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = {"params": params or {}, "sets": []}
+            self._entries[key] = entry
+        elif any(question_set["questions"] == questions for question_set in entry["sets"]):
+            return  # Callers that shared one model call each store the same set
+        entry["sets"].append({"generated_at": time.time(), "questions": copy.deepcopy(questions)})
+        if len(entry["sets"]) > self.pool_size:
+            entry["sets"] = entry["sets"][-self.pool_size:]
+        self._entries.move_to_end(key)
+        self.stores += 1
+        self._dirty = True
+
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def load(self):
+        """Read the persisted pools; expired sets are dropped on first access"""
+        if self.path is None:
+            return
+        try:
+            entries = await asyncio.to_thread(self._read)
+        except Exception as e:
+            logger.error(f"Failed to load question cache: {e}")
+            return
+        if entries:
+            self._entries = OrderedDict(entries)
+            logger.info(f"Loaded {len(self._entries)} cached question pools")
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def start(self, interval_seconds: float = 30.0):
+        """Save every `interval_seconds` while there are unsaved sets"""
+        if self._task is None and self.path is not None:
+            self._task = asyncio.create_task(self._save_loop(interval_seconds))
+
+    async def stop(self):
+        """Stop the save loop and write anything still unsaved"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.save()
+
+    async def _save_loop(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.save()
+
+    async def save(self):
+        """Persist the pools atomically if they changed since the last save"""
+        if self.path is None or not self._dirty:
+            return
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            # Stored sets are never modified, so copying the containers is enough
+            # to serialize off the event loop while new sets keep arriving
+            snapshot = {key: {"params": entry["params"], "sets": list(entry["sets"])} for key, entry in self._entries.items()}
+            self._dirty = False
+            try:
+                await asyncio.to_thread(self._write_atomic, snapshot)
+                self.saves += 1
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Failed to save question cache: {e}")
+
+    def _write_atomic(self, snapshot: Dict[str, Any]):
+        payload = dumps(snapshot)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_name(f".{self.path.name}.tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_file, self.path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and pool counters"""
+        lookups = self.hits + self.misses
+        return {
+            "keys": len(self._entries),
+            "pooled_sets": sum(len(entry["sets"]) for entry in self._entries.values()),
+            "max_keys": self.max_keys,
+            "pool_size": self.pool_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "saves": self.saves,
+            "unsaved_changes": self._dirty
+        }
@@ -0,0 +1,198 @@
+"""
+Model call limiter
+Bounds concurrent Gemini calls and paces them with request and token buckets
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class QueueTimeoutError(asyncio.TimeoutError):
+    """No limiter slot became free in time; the model was never called"""
+
+class Priority(IntEnum):
+    """Lower values are served first"""
+    INTERACTIVE = 0  # A user is waiting on the result (evaluation, question setup)
+    STANDARD = 1
+    BACKGROUND = 2   # Reports, prefetching and other work nobody is blocked on
+
+class TokenBucket:
+    """Refills at `rate` units per second up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.rate
+
+    def take(self, amount: float):
+        self._refill()
+        self._level -= min(amount, self.capacity)
+
+class ModelRateLimiter:
+    """Priority queue in front of the model with a concurrency cap and rate buckets
+
+    A caller is admitted when fewer than `max_in_flight` calls are running and
+    both the requests-per-minute and tokens-per-minute buckets have room.
+    Waiting callers are admitted strictly by priority, then arrival order, so
+    interactive work overtakes queued background work.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        requests_per_minute: float = 60.0,
+        tokens_per_minute: float = 0.0,
+        burst_seconds: float = 5.0
+    ):
+        self.max_in_flight = max_in_flight
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        # Buckets hold a few seconds of budget so spikes are smoothed, not rejected
+        self._requests = TokenBucket(
+            requests_per_minute / 60, max(1.0, requests_per_minute / 60 * burst_seconds)
+        ) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(
+            tokens_per_minute / 60, max(1.0, tokens_per_minute / 60 * burst_seconds)
+        ) if tokens_per_minute > 0 else None
+
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future, int]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self.peak_queue_depth = 0
+        self.timeouts = 0
+        self._admitted = {priority: 0 for priority in Priority}
+        self._wait_total = {priority: 0.0 for priority in Priority}
+        self._wait_max = {priority: 0.0 for priority in Priority}
+
+    def _delay(self, tokens: int) -> float:
+        delay = 0.0
+        if self._requests is not None:
+            delay = max(delay, self._requests.delay_for(1))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.delay_for(tokens))
+        return delay
+
+    def _admit(self, tokens: int):
+        self._in_flight += 1
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+
+    def _dispatch(self):
+        """Admit queued callers in priority order while capacity allows"""
+        self._wakeup = None
+        while self._waiters:
+            _, _, future, tokens = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)  # Timed out or cancelled while queued
+                continue
+            if self._in_flight >= self.max_in_flight:
+                return  # release() dispatches again
+            delay = self._delay(tokens)
+            if delay > 0:
+                self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self._admit(tokens)
+            future.set_result(None)
+
+    async def acquire(self, priority: Priority = Priority.STANDARD, tokens: int = 1):
+        """Wait for a slot; pair with release()"""
+        started = time.monotonic()
+        if not self._waiters and self._in_flight < self.max_in_flight and self._delay(tokens) == 0:
+            self._admit(tokens)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (int(priority), next(self._sequence), future, tokens))
+            self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiters))
+            if self._wakeup is None:
+                self._dispatch()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release()  # Admitted just as the caller gave up
+                else:
+                    future.cancel()
+                raise
+        waited = time.monotonic() - started
+        self._admitted[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+
+    def release(self):
+        """Free a slot taken by acquire()"""
+        self._in_flight -= 1
+        if self._waiters and self._wakeup is None:
+            self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.STANDARD, tokens: int = 1, timeout: float = None):
+        """Hold a slot for the duration of a model call
+
+        Raises QueueTimeoutError if no slot is free within `timeout` seconds.
+        """
+        try:
+            await asyncio.wait_for(self.acquire(priority, tokens), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"Gemini call queued longer than {timeout:.1f}s ({priority.name.lower()})")
+            raise QueueTimeoutError(f"No model slot free within {timeout:.1f}s") from None
+        try:
+            yield
+        finally:
+            self.release()
+
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future, _ in self._waiters if not future.done())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Concurrency, queue depth and wait times per priority"""
+        depth_by_priority = {priority.name.lower(): 0 for priority in Priority}
+        for priority, _, future, _ in self._waiters:
+            if not future.done():
+                depth_by_priority[Priority(priority).name.lower()] += 1
+        return {
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "queue_depth": sum(depth_by_priority.values()),
+            "queue_depth_by_priority": depth_by_priority,
+            "peak_queue_depth": self.peak_queue_depth,
+            "queue_timeouts": self.timeouts,
+            "wait_by_priority": {
+                priority.name.lower(): {
+                    "admitted": self._admitted[priority],
+                    "avg_wait_ms": round(self._wait_total[priority] / self._admitted[priority] * 1000, 1)
+                    if self._admitted[priority] else 0.0,
+                    "max_wait_ms": round(self._wait_max[priority] * 1000, 1)
+                }
+                for priority in Priority
+            }
+        }
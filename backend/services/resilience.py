@@ -0,0 +1,123 @@
+"""
+Model call resilience
+Jittered exponential retry within a deadline budget, and a circuit breaker
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: timeouts, rate limiting and server-side errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+_RETRYABLE_MESSAGES = ("429", "resource has been exhausted", "unavailable", "deadline exceeded", "internal error")
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the model while the circuit breaker is open"""
+
+def is_retryable(error: Exception) -> bool:
+    """Transient failures (timeouts, 429s, 5xx, dropped connections) are retried"""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS_CODES
+    message = str(error).lower()
+    return any(marker in message for marker in _RETRYABLE_MESSAGES)
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, configured like AIConfig.RETRY_CONFIG"""
+
+    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0, backoff_factor: float = 2.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetryPolicy":
+        return cls(
+            max_retries=config.get("max_retries", 3),
+            retry_delay=config.get("retry_delay", 1),
+            backoff_factor=config.get("backoff_factor", 2)
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (0-based), drawn from [0, backoff cap]"""
+        cap = min(self.max_delay, self.retry_delay * self.backoff_factor ** attempt)
+        return random.uniform(0, cap)
+
+class CircuitBreaker:
+    """Opens after consecutive failures so callers fall back without waiting
+
+    closed: calls pass through. open: calls are refused until
+    `recovery_timeout_seconds` have passed. half_open: a single probe call is
+    let through; its success closes the circuit and its failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout_seconds = recovery_timeout_seconds
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+        self.times_opened = 0
+        self.short_circuited = 0
+        self.last_error: Optional[str] = None
+
+    def allow(self) -> bool:
+        """Whether a call may go to the model now"""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self._opened_at >= self.recovery_timeout_seconds:
+            self.state = "half_open"
+            self._probe_in_flight = False
+            logger.info("Gemini circuit half-open, probing")
+        if self.state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def release_probe(self):
+        """The half-open probe ended without reaching the model; allow another"""
+        self._probe_in_flight = False
+
+    def record_success(self):
+        if self.state != "closed":
+            logger.info("Gemini circuit closed")
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, error: Exception):
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"[:200]
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+                logger.warning(f"Gemini circuit opened after {self.consecutive_failures} consecutive failures")
+            self.state = "open"
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Breaker state for /health and /stats"""
+        retry_in = None
+        if self.state == "open":
+            retry_in = round(max(0.0, self.recovery_timeout_seconds - (time.monotonic() - self._opened_at)), 1)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_in_seconds": retry_in,
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+            "last_error": self.last_error
+        }
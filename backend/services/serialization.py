@@ -0,0 +1,41 @@
+"""
+Session serialization
+Compact orjson encoding with a versioned envelope for session files
+"""
+
+from typing import Dict, Any, Tuple
+
+import orjson
+
+# Version 1 is the original pretty-printed JSON with the session at the top level.
+# Version 2 wraps the session in {"format_version": 2, "session": {...}}.
+SESSION_FORMAT_VERSION = 2
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def dumps(data: Any) -> bytes:
+    """Compact JSON bytes; values orjson cannot encode fall back to str()"""
+    return orjson.dumps(data, default=str, option=_DUMPS_OPTIONS)
+
+def loads(payload) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(payload)
+
+def encode_session(session_data: Dict[str, Any]) -> bytes:
+    """Serialize a session in the current on-disk format"""
+    return dumps({"format_version": SESSION_FORMAT_VERSION, "session": session_data})
+
+def decode_session(payload) -> Tuple[Dict[str, Any], int]:
+    """Parse a session file of any supported version
+
+    Returns the session data and the format version it was stored in, so
+    callers can tell which files still need migrating.
+    """
+    data = loads(payload)
+    if isinstance(data, dict) and "format_version" in data and "session" in data:
+        version = data["format_version"]
+        if version > SESSION_FORMAT_VERSION:
+            raise ValueError(f"Unsupported session format version {version}")
+        return data["session"], version
+    # Legacy pretty-printed JSON written by json.dump(indent=2)
+    return data, 1
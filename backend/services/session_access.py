@@ -0,0 +1,63 @@
+"""
+Session access tracking
+Keeps last-access times in memory so reads never have to write the session
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class SessionAccessTracker:
+    """In-memory last-access times, handed back in batches for lazy persistence"""
+
+    def __init__(self, persist_interval_seconds: float = 60.0):
+        self.persist_interval_seconds = persist_interval_seconds
+        self._last_access: Dict[str, float] = {}
+        self._touched: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self, session_id: str):
+        """Record a read of the session"""
+        now = time.time()
+        self._last_access[session_id] = now
+        self._touched[session_id] = now
+
+    def last_access(self, session_id: str) -> Optional[float]:
+        """Epoch seconds of the last recorded read"""
+        return self._last_access.get(session_id)
+
+    def forget(self, session_id: str):
+        """Stop tracking a deleted session"""
+        self._last_access.pop(session_id, None)
+        self._touched.pop(session_id, None)
+
+    def drain(self) -> Dict[str, float]:
+        """Access times recorded since the previous drain"""
+        touched, self._touched = self._touched, {}
+        return touched
+
+    def start(self, persist: Callable[[], Awaitable[None]]):
+        """Call `persist` every persist interval"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._persist_loop(persist))
+
+    async def stop(self):
+        """Stop the periodic persist task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _persist_loop(self, persist: Callable[[], Awaitable[None]]):
+        while True:
+            await asyncio.sleep(self.persist_interval_seconds)
+            try:
+                await persist()
+            except Exception as e:
+                logger.error(f"Failed to persist session access times: {e}")
@@ -0,0 +1,114 @@
+"""
+Bounded in-memory session cache
+LRU over loaded sessions that evicts completed interviews before live ones
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+class SessionCache:
+    """Dict-like LRU of session data keyed by session ID
+
+    Completed sessions and live sessions are kept in separate LRU segments so
+    that a completed interview is always evicted before an in-progress one.
+    A max_size of None keeps every session (eager mode).
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self._live: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._completed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.completed_evictions = 0
+
+    def _segment(self, session_data: Dict[str, Any]) -> "OrderedDict[str, Dict[str, Any]]":
+        return self._completed if session_data.get("status") == "completed" else self._live
+
+    def lookup(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session and record a cache hit or miss"""
+        session_data = self.get(session_id)
+        if session_data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.mark_used(session_id)
+        return session_data
+
+    def mark_used(self, session_id: str):
+        """Move a session to the most-recently-used end of its segment"""
+        session_data = self.pop(session_id, None)
+        if session_data is not None:
+            self._segment(session_data)[session_id] = session_data
+
+    def get(self, session_id: str, default=None) -> Optional[Dict[str, Any]]:
+        session_data = self._live.get(session_id)
+        if session_data is None:
+            session_data = self._completed.get(session_id)
+        return default if session_data is None else session_data
+
+    def pop(self, session_id: str, default=None) -> Optional[Dict[str, Any]]:
+        session_data = self._live.pop(session_id, None)
+        if session_data is None:
+            session_data = self._completed.pop(session_id, None)
+        return default if session_data is None else session_data
+
+    def clear(self):
+        self._live.clear()
+        self._completed.clear()
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        while len(self) > self.max_size:
+            if self._completed:
+                self._completed.popitem(last=False)
+                self.completed_evictions += 1
+            else:
+                self._live.popitem(last=False)
+            self.evictions += 1
+
+    def __setitem__(self, session_id: str, session_data: Dict[str, Any]):
+        self.pop(session_id, None)
+        self._segment(session_data)[session_id] = session_data
+        self._evict()
+
+    def __getitem__(self, session_id: str) -> Dict[str, Any]:
+        session_data = self.get(session_id)
+        if session_data is None:
+            raise KeyError(session_id)
+        return session_data
+
+    def __delitem__(self, session_id: str):
+        if self.pop(session_id, None) is None:
+            raise KeyError(session_id)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._live or session_id in self._completed
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._completed)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._completed) + list(self._live))
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return iter(list(self._completed.items()) + list(self._live.items()))
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._completed.values()) + list(self._live.values()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, hit rate and eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "cached_sessions": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "completed_evictions": self.completed_evictions
+        }
@@ -0,0 +1,62 @@
+"""
+Session expiry index
+Min-heap of numeric expiry deadlines so sweeps only visit sessions that are due
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+class ExpiryIndex:
+    """Tracks one expiry deadline (epoch seconds) per session
+
+    Activity only updates the deadline map, which is O(1). Each session has a
+    single heap entry; when it comes due with a newer deadline it is pushed back
+    instead of expiring, so a sweep costs O(due log n).
+    """
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self._deadlines: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._deadlines
+
+    def schedule(self, session_id: str, last_activity: float):
+        """Start tracking a session whose last activity is known"""
+        deadline = last_activity + self.timeout_seconds
+        if session_id not in self._deadlines:
+            heapq.heappush(self._heap, (deadline, session_id))
+            self._deadlines[session_id] = deadline
+        else:
+            self._deadlines[session_id] = max(self._deadlines[session_id], deadline)
+
+    def touch(self, session_id: str, now: float):
+        """Push the deadline of an already tracked session out from `now`"""
+        if session_id in self._deadlines:
+            self._deadlines[session_id] = now + self.timeout_seconds
+
+    def deadline(self, session_id: str) -> Optional[float]:
+        return self._deadlines.get(session_id)
+
+    def remove(self, session_id: str):
+        """Stop tracking a session; its heap entry is discarded when popped"""
+        self._deadlines.pop(session_id, None)
+
+    def pop_expired(self, now: float) -> List[str]:
+        """Remove and return every session whose deadline has passed"""
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            _, session_id = heapq.heappop(self._heap)
+            deadline = self._deadlines.get(session_id)
+            if deadline is None:
+                continue  # Removed since it was scheduled
+            if deadline > now:
+                heapq.heappush(self._heap, (deadline, session_id))
+                continue
+            del self._deadlines[session_id]
+            expired.append(session_id)
+        return expired
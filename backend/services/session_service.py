@@ -3,65 +3,228 @@ Session Management Service
 Handles user sessions, interview state, and data persistence
 """
 
-import json
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional, List
 import logging
-import os
-from pathlib import Path
+import time
+
+from config.settings import get_settings
+from services.session_store import SessionStore, create_session_store
+from services.session_writer import SessionWriteBehind
+from services.session_access import SessionAccessTracker
+from services.session_cache import SessionCache
+from services.session_expiry import ExpiryIndex
+from services.session_stats import SessionStatusCounters
+from services.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Session score dimension -> where its value lives in an answer evaluation
+SCORE_DIMENSIONS = {
+    "overall": "overall_score",
+    "technical": "technical_accuracy",
+    "communication": "communication_clarity",
+    "problem_solving": "problem_solving",
+    "confidence": "confidence"
+}
+
+def _evaluation_scores(evaluation: Dict[str, Any]) -> Dict[str, float]:
+    """Per-dimension values an evaluation contributes to the session scores"""
+    scores = evaluation.get("scores", {})
+    contribution = {"overall": evaluation.get("overall_score", 0)}
+    for dimension, key in SCORE_DIMENSIONS.items():
+        if dimension != "overall":
+            contribution[dimension] = scores.get(key, 0)
+    return contribution
+
 class SessionService:
-    def __init__(self):
-        self.sessions: Dict[str, Dict[str, Any]] = {}
-        self.session_timeout_minutes = 120  # 2 hours
-        self.data_dir = Path("data/sessions")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing sessions synchronously on startup
-        self._load_sessions_sync()
+    def __init__(self, store: SessionStore = None):
+        settings = get_settings()
+        self.session_timeout_minutes = settings.session_timeout_minutes
+        self.store = store or create_session_store()
+        
+        # Lazy mode keeps only an index of session IDs and loads sessions on
+        # first access into a bounded LRU; indexed stores are always lazy
+        self.lazy_loading = settings.session_lazy_loading or self.store.indexed
+        self.sessions = SessionCache(settings.session_cache_size if self.lazy_loading else None)
+        self._session_index: Optional[set] = None
+        self._index_task: Optional[asyncio.Task] = None
+        
+        # Mutations are coalesced and persisted in the background
+        self.writer = SessionWriteBehind(
+            self.store,
+            flush_interval_seconds=settings.session_flush_interval_seconds,
+            max_dirty_age_seconds=settings.session_max_dirty_age_seconds
+        )
+        
+        # Reads only record access times in memory; they are persisted in batches
+        self.access_tracker = SessionAccessTracker(settings.session_access_persist_interval_seconds)
+        
+        # Numeric expiry deadlines, swept periodically by a background task
+        self.expiry_index = ExpiryIndex(self.session_timeout_minutes * 60)
+        self._sweeper_task: Optional[asyncio.Task] = None
+        
+        # Per-status counts, updated on every transition rather than recounted
+        self.status_counters = SessionStatusCounters()
+        
+        # Called with the session ID after a session is deleted or expires
+        self._removal_listeners: List[Callable[[str], None]] = []
+
+    async def initialize(self):
+        """Open the session store and load existing sessions
+
+        In eager mode every stored session is loaded up front. In lazy mode
+        the ID index is built in the background and sessions are loaded on
+        demand, so startup time and memory do not grow with the archive.
+        """
+        await self.store.initialize()
+        if self.store.indexed:
+            try:
+                self.status_counters.seed_counts(await self.store.count_by_status())
+            except Exception as e:
+                logger.error(f"Failed to count sessions by status: {e}")
+        if self.lazy_loading:
+            self._index_task = asyncio.create_task(self._build_session_index())
+        else:
+            try:
+                for session_id, session_data in (await self.store.load_all()).items():
+                    self.sessions[session_id] = session_data
+                    self._schedule_expiry(session_id, session_data)
+            except Exception as e:
+                logger.error(f"Failed to load sessions: {e}")
+            self.status_counters.seed({
+                session_id: session_data.get("status") for session_id, session_data in self.sessions.items()
+            })
+        self.writer.start()
+        self.access_tracker.start(self.persist_access_times)
+
+    async def close(self):
+        """Flush pending writes and close the session store"""
+        if self._index_task is not None:
+            self._index_task.cancel()
+        await self.stop_expiry_sweeper()
+        await self.access_tracker.stop()
+        await self.persist_access_times()
+        await self.writer.stop()
+        await self.store.close()
 
-    def _load_sessions_sync(self):
-        """Load existing sessions from disk synchronously"""
+    async def persist_access_times(self):
+        """Copy batched read times onto their sessions and schedule one write each"""
+        for session_id, accessed_at in self.access_tracker.drain().items():
+            session_data = self.sessions.get(session_id) or self.writer.pending(session_id)
+            if session_data is not None:
+                session_data["last_accessed"] = datetime.fromtimestamp(accessed_at).isoformat()
+                self.writer.mark_dirty(session_id, session_data)
+
+    async def _build_session_index(self):
+        """Collect the IDs and expiry deadlines of all stored sessions without loading them"""
         try:
-            if self.data_dir.exists():
-                for session_file in self.data_dir.glob("*.json"):
-                    try:
-                        with open(session_file, 'r') as f:
-                            session_data = json.load(f)
-                            session_id = session_file.stem
-                            self.sessions[session_id] = session_data
-                            logger.info(f"Loaded session: {session_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to load session {session_file}: {e}")
+            started = time.perf_counter()
+            session_ids = set(await self.store.list_ids())
+            # Sessions created while the index was being built
+            session_ids.update(self.sessions)
+            self._session_index = session_ids
+            logger.info(f"Indexed {len(session_ids)} stored sessions in {time.perf_counter() - started:.2f}s")
         except Exception as e:
-            logger.error(f"Failed to load sessions: {e}")
+            logger.error(f"Failed to index sessions: {e}")
+        
+        if not self.store.indexed:
+            # Unindexed stores would rescan the archive on every sweep, so keep a
+            # deadline for every session, loaded or not; the same scan provides the status counts
+            try:
+                activity = await self.store.load_activity()
+            except Exception as e:
+                logger.error(f"Failed to scan stored sessions: {e}")
+                return
+            for session_id, (_, last_activity) in activity.items():
+                # Sessions loaded or created meanwhile already have a newer deadline
+                if session_id not in self.expiry_index and (self._session_index is None or session_id in self._session_index):
+                    self.expiry_index.schedule(session_id, last_activity)
+            if not self.status_counters.seeded:
+                # Transitions made during the scan are folded in
+                self.status_counters.seed({session_id: status for session_id, (status, _) in activity.items()})
+        elif not self.status_counters.seeded:
+            # One background scan of the archive; transitions meanwhile are folded in
+            try:
+                self.status_counters.seed(await self.store.load_statuses())
+            except Exception as e:
+                logger.error(f"Failed to count sessions by status: {e}")
+
+    async def _stored_status(self, session_id: str) -> Optional[str]:
+        """Status of a session, loading it from the store if it is not in memory"""
+        session_data = self.sessions.get(session_id) or self.writer.pending(session_id)
+        if session_data is None:
+            try:
+                session_data = await self.store.load(session_id)
+            except Exception as e:
+                logger.error(f"Failed to load session {session_id}: {e}")
+        return session_data.get("status") if session_data else None
 
+    @traced(record=("session_id",))
     async def _save_session(self, session_id: str):
-        """Save session to disk"""
-        try:
-            session_file = self.data_dir / f"{session_id}.json"
-            with open(session_file, 'w') as f:
-                json.dump(self.sessions[session_id], f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Failed to save session {session_id}: {e}")
+        """Schedule session for a background write"""
+        self.expiry_index.touch(session_id, time.time())
+        self.sessions.mark_used(session_id)
+        self.writer.mark_dirty(session_id, self.sessions[session_id])
+
+    @traced(record=("session_id",))
+    async def _load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return a session from memory, loading it from the store on a miss in lazy mode"""
+        session_data = self.sessions.lookup(session_id)
+        if session_data is None:
+            # Evicted but still waiting to be written back
+            session_data = self.writer.pending(session_id)
+            if session_data is not None:
+                self.sessions[session_id] = session_data
+        if session_data is None and self.lazy_loading:
+            if self._session_index is not None and session_id not in self._session_index:
+                return None
+            try:
+                session_data = await self.store.load(session_id)
+            except Exception as e:
+                logger.error(f"Failed to load session {session_id}: {e}")
+                return None
+            if session_data is not None:
+                self.sessions[session_id] = session_data
+                self._schedule_expiry(session_id, session_data)
+        return session_data
 
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
         import uuid
         return f"session_{uuid.uuid4().hex[:12]}"
 
+    def _last_activity(self, session_data: Dict[str, Any]) -> float:
+        """Epoch seconds of the latest update or read of the session"""
+        last_activity = datetime.fromisoformat(session_data.get('last_updated', '')).timestamp()
+        if session_data.get('last_accessed'):
+            last_activity = max(last_activity, datetime.fromisoformat(session_data['last_accessed']).timestamp())
+        tracked = self.access_tracker.last_access(session_data.get('session_id', ''))
+        if tracked:
+            last_activity = max(last_activity, tracked)
+        return last_activity
+
+    def _schedule_expiry(self, session_id: str, session_data: Dict[str, Any]):
+        """Add a session that has just entered memory to the expiry index"""
+        try:
+            last_activity = self._last_activity(session_data)
+        except (TypeError, ValueError):
+            last_activity = 0.0  # Unreadable timestamps expire on the next sweep
+        self.expiry_index.schedule(session_id, last_activity)
+
     def _is_session_expired(self, session_data: Dict[str, Any]) -> bool:
         """Check if session is expired"""
+        deadline = self.expiry_index.deadline(session_data.get('session_id', ''))
+        if deadline is not None:
+            return time.time() > deadline
         try:
-            last_updated = datetime.fromisoformat(session_data.get('last_updated', ''))
-            expiry_time = last_updated + timedelta(minutes=self.session_timeout_minutes)
-            return datetime.now() > expiry_time
+            expiry_time = self._last_activity(session_data) + self.session_timeout_minutes * 60
+            return time.time() > expiry_time
         except:
             return True
 
+    @traced()
     async def create_session(self, user_email: str = None) -> str:
         """Create new user session"""
         session_id = self._generate_session_id()
@@ -89,45 +252,56 @@ class SessionService:
         }
         
         self.sessions[session_id] = session_data
+        self.status_counters.transition(session_id, None, "not_started")
+        self.status_counters.record("created")
+        self.expiry_index.schedule(session_id, time.time())
+        if self._session_index is not None:
+            self._session_index.add(session_id)
         await self._save_session(session_id)
         
         logger.info(f"Created new session: {session_id}")
         return session_id
 
+    @traced(record=("session_id",))
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data"""
-        if session_id not in self.sessions:
+        session_data = await self._load_session(session_id)
+        if session_data is None:
             return None
         
-        session_data = self.sessions[session_id]
-        
         # Check if expired
         if self._is_session_expired(session_data):
-            await self.delete_session(session_id)
+            await self.delete_session(session_id, expired=True)
             return None
         
-        # Update last accessed time
-        session_data['last_updated'] = datetime.now().isoformat()
-        await self._save_session(session_id)
+        # Record the read without touching the disk
+        self.access_tracker.touch(session_id)
+        self.expiry_index.touch(session_id, time.time())
         
         return session_data
 
+    @traced(record=("session_id",))
     async def update_session(self, session_id: str, updates: Dict[str, Any]) -> bool:
         """Update session data"""
-        if session_id not in self.sessions:
+        session_data = await self._load_session(session_id)
+        if session_data is None:
             return False
         
-        session_data = self.sessions[session_id]
-        
         # Check if expired
         if self._is_session_expired(session_data):
-            await self.delete_session(session_id)
+            await self.delete_session(session_id, expired=True)
             return False
         
         # Apply updates
+        old_status = session_data.get("status")
         for key, value in updates.items():
             session_data[key] = value
         
+        if session_data.get("status") != old_status:
+            self.status_counters.transition(session_id, old_status, session_data.get("status"))
+            if session_data.get("status") == "in_progress":
+                self.status_counters.record("started")
+        
         session_data['last_updated'] = datetime.now().isoformat()
         await self._save_session(session_id)
         
@@ -150,6 +324,7 @@ class SessionService:
         """Set resume text for session"""
         return await self.update_session(session_id, {"resume_text": resume_text})
 
+    @traced(record=("session_id",))
     async def start_interview(self, session_id: str, questions: List[Dict[str, Any]]) -> bool:
         """Start interview with generated questions"""
         updates = {
@@ -159,6 +334,7 @@ class SessionService:
         }
         return await self.update_session(session_id, updates)
 
+    @traced(record=("session_id",))
     async def submit_answer(
         self, 
         session_id: str, 
@@ -190,10 +366,13 @@ class SessionService:
         session_data["current_question_index"] = len(session_data["answers"])
         
         # Update overall scores
-        self._update_session_scores(session_data)
+        self._update_session_scores(session_data, add=evaluation)
         
         # Check if interview is complete
         if len(session_data["answers"]) >= len(session_data.get("questions", [])):
+            if session_data.get("status") != "completed":
+                self.status_counters.transition(session_id, session_data.get("status"), "completed")
+                self.status_counters.record("completed")
             session_data["status"] = "completed"
             session_data["completed_at"] = datetime.now().isoformat()
         
@@ -203,37 +382,112 @@ class SessionService:
         logger.info(f"Submitted answer for session {session_id}, question {question_id}")
         return True
 
-    def _update_session_scores(self, session_data: Dict[str, Any]):
-        """Update session scores based on answers"""
-        answers = session_data.get("answers", [])
-        if not answers:
+    def _score_aggregates(self, session_data: Dict[str, Any], exclude_latest: bool = False) -> Dict[str, Any]:
+        """Running score sums for the session, rebuilt once for older sessions"""
+        aggregates = session_data.get("score_aggregates")
+        if aggregates is None:
+            answers = session_data.get("answers", [])
+            if exclude_latest:
+                answers = answers[:-1]
+            aggregates = {
+                "count": 0,
+                "totals": {dimension: 0 for dimension in SCORE_DIMENSIONS},
+                "overall_sum_squares": 0
+            }
+            for answer in answers:
+                self._apply_score_delta(aggregates, _evaluation_scores(answer.get("evaluation", {})), 1)
+            session_data["score_aggregates"] = aggregates
+        return aggregates
+
+    @staticmethod
+    def _apply_score_delta(aggregates: Dict[str, Any], contribution: Dict[str, float], sign: int):
+        for dimension, value in contribution.items():
+            aggregates["totals"][dimension] += sign * value
+        aggregates["overall_sum_squares"] += sign * contribution["overall"] ** 2
+        aggregates["count"] += sign
+
+    def _update_session_scores(
+        self,
+        session_data: Dict[str, Any],
+        add: Dict[str, Any] = None,
+        remove: Dict[str, Any] = None
+    ):
+        """Update session scores in O(1) by adding/removing one evaluation"""
+        aggregates = self._score_aggregates(session_data, exclude_latest=add is not None and remove is None)
+        
+        if remove is not None:
+            self._apply_score_delta(aggregates, _evaluation_scores(remove), -1)
+        if add is not None:
+            self._apply_score_delta(aggregates, _evaluation_scores(add), 1)
+        
+        count = aggregates["count"]
+        if count <= 0:
             return
         
-        # Calculate averages
-        total_scores = {
-            "overall": 0,
-            "technical": 0,
-            "communication": 0,
-            "problem_solving": 0,
-            "confidence": 0
+        # Update session scores
+        session_data["scores"] = {
+            key: round(value / count) for key, value in aggregates["totals"].items()
         }
+
+    def get_score_variance(self, session_data: Dict[str, Any]) -> float:
+        """Variance of the overall answer scores from the running sums"""
+        aggregates = self._score_aggregates(session_data)
+        count = aggregates["count"]
+        if count < 2:
+            return 0
+        mean = aggregates["totals"]["overall"] / count
+        variance = aggregates["overall_sum_squares"] / count - mean ** 2
+        return round(max(0.0, variance), 2)
+
+    @traced(record=("session_id",))
+    async def override_answer_scores(
+        self,
+        session_id: str,
+        question_id: int,
+        manual_scores: Dict[str, int],
+        feedback: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """Replace the scores of an evaluated answer and adjust the session totals
+
+        `manual_scores` may contain `overall_score` and any evaluation score key
+        such as `technical_accuracy`. Returns the updated session scores, or
+        None if the session or answer does not exist.
+        """
+        session_data = await self.get_session(session_id)
+        if not session_data:
+            return None
         
-        count = len(answers)
-        for answer in answers:
-            evaluation = answer.get("evaluation", {})
-            scores = evaluation.get("scores", {})
-            
-            total_scores["overall"] += evaluation.get("overall_score", 0)
-            total_scores["technical"] += scores.get("technical_accuracy", 0)
-            total_scores["communication"] += scores.get("communication_clarity", 0)
-            total_scores["problem_solving"] += scores.get("problem_solving", 0)
-            total_scores["confidence"] += scores.get("confidence", 0)
+        answer = next(
+            (a for a in reversed(session_data.get("answers", [])) if a.get("question_id") == question_id),
+            None
+        )
+        if answer is None:
+            return None
         
-        # Update session scores
-        session_data["scores"] = {
-            key: round(value / count) for key, value in total_scores.items()
+        old_evaluation = answer.get("evaluation", {})
+        new_evaluation = dict(old_evaluation)
+        new_evaluation["scores"] = dict(old_evaluation.get("scores", {}))
+        for key, value in manual_scores.items():
+            if key == "overall_score":
+                new_evaluation["overall_score"] = value
+            else:
+                new_evaluation["scores"][key] = value
+        
+        self._update_session_scores(session_data, add=new_evaluation, remove=old_evaluation)
+        
+        answer["evaluation"] = new_evaluation
+        answer["score"] = new_evaluation.get("overall_score", 0)
+        answer["manual_override"] = {
+            "scores": manual_scores,
+            "feedback": feedback,
+            "overridden_at": datetime.now().isoformat()
         }
+        await self._save_session(session_id)
+        
+        logger.info(f"Manual scores applied for session {session_id}, question {question_id}")
+        return session_data["scores"]
 
+    @traced(record=("session_id",))
     async def get_interview_progress(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get interview progress information"""
         session_data = await self.get_session(session_id)
@@ -256,6 +510,7 @@ class SessionService:
             "difficulty": session_data.get("difficulty")
         }
 
+    @traced(record=("session_id",))
     async def get_next_question(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get the next question for the interview"""
         session_data = await self.get_session(session_id)
@@ -270,6 +525,7 @@ class SessionService:
         
         return questions[current_index]
 
+    @traced(record=("session_id",))
     async def get_interview_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get complete interview summary"""
         session_data = await self.get_session(session_id)
@@ -293,20 +549,35 @@ class SessionService:
                 "total_questions": len(session_data.get("questions", [])),
                 "questions_answered": len(session_data.get("answers", [])),
                 "average_score": session_data.get("scores", {}).get("overall", 0),
+                "score_variance": self.get_score_variance(session_data),
                 "completion_rate": len(session_data.get("answers", [])) / len(session_data.get("questions", [])) if session_data.get("questions") else 0
             }
         }
 
-    async def delete_session(self, session_id: str) -> bool:
-        """Delete session"""
+    @traced(record=("session_id",))
+    async def delete_session(self, session_id: str, expired: bool = False, status: Optional[str] = None) -> bool:
+        """Delete session
+
+        `status` may be passed when the caller already knows the stored status,
+        which saves loading an evicted session just to update the counters.
+        """
         try:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+            if status is None:
+                status = await self._stored_status(session_id)
+            self.sessions.pop(session_id, None)
+            if self._session_index is not None:
+                self._session_index.discard(session_id)
+            self.access_tracker.forget(session_id)
+            self.expiry_index.remove(session_id)
+            await self.writer.discard(session_id)
+            await self.store.delete(session_id)
             
-            # Delete file
-            session_file = self.data_dir / f"{session_id}.json"
-            if session_file.exists():
-                session_file.unlink()
+            if status is not None:
+                self.status_counters.transition(session_id, status, None)
+                self.status_counters.record("expired" if expired else "deleted")
+            
+            for listener in self._removal_listeners:
+                listener(session_id)
             
             logger.info(f"Deleted session: {session_id}")
             return True
@@ -314,36 +585,82 @@ class SessionService:
             logger.error(f"Failed to delete session {session_id}: {e}")
             return False
 
+    def add_removal_listener(self, listener: Callable[[str], None]):
+        """Register a callback for sessions that are deleted or expire"""
+        self._removal_listeners.append(listener)
+
     async def cleanup_expired_sessions(self):
-        """Clean up expired sessions"""
-        expired_sessions = []
+        """Clean up expired sessions
+
+        Only sessions whose deadline has passed are visited, so a sweep costs
+        O(expired log n) rather than a scan of every session.
+        """
+        expired_sessions = {session_id: None for session_id in self.expiry_index.pop_expired(time.time())}
         
-        for session_id, session_data in self.sessions.items():
-            if self._is_session_expired(session_data):
-                expired_sessions.append(session_id)
+        if self.store.indexed:
+            cutoff = time.time() - self.session_timeout_minutes * 60
+            for session_id, status in (await self.store.find_expired(cutoff)).items():
+                # The in-memory copy is authoritative until it has been written back
+                if session_id not in self.expiry_index and self.writer.pending(session_id) is None:
+                    expired_sessions.setdefault(session_id, status)
         
-        for session_id in expired_sessions:
-            await self.delete_session(session_id)
+        for session_id, status in expired_sessions.items():
+            await self.delete_session(session_id, expired=True, status=status)
         
         if expired_sessions:
             logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
 
+    def start_expiry_sweeper(self, interval_seconds: float = 60.0):
+        """Sweep expired sessions in the background every `interval_seconds`"""
+        if self._sweeper_task is None:
+            self._sweeper_task = asyncio.create_task(self._expiry_sweep_loop(interval_seconds))
+
+    async def stop_expiry_sweeper(self):
+        """Stop the background expiry sweeper"""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+
+    async def _expiry_sweep_loop(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.cleanup_expired_sessions()
+            except Exception as e:
+                logger.error(f"Expiry sweep failed: {e}")
+
     async def get_active_sessions_count(self) -> int:
         """Get count of active sessions"""
-        await self.cleanup_expired_sessions()
-        return len(self.sessions)
+        return self.status_counters.total()
 
     async def get_session_statistics(self) -> Dict[str, Any]:
-        """Get session statistics"""
-        await self.cleanup_expired_sessions()
-        
-        total_sessions = len(self.sessions)
-        completed_sessions = sum(1 for s in self.sessions.values() if s.get("status") == "completed")
-        in_progress_sessions = sum(1 for s in self.sessions.values() if s.get("status") == "in_progress")
-        
+        """Get session statistics
+
+        Counts come from counters maintained on every status transition, so
+        this costs the same however many sessions exist. Expired sessions are
+        removed by the background sweeper, not here.
+        """
+        counters = self.status_counters
+        return {
+            "total_active_sessions": counters.total(),
+            "completed_sessions": counters.count("completed"),
+            "in_progress_sessions": counters.count("in_progress"),
+            "not_started_sessions": counters.count("not_started"),
+            "stored_sessions": len(self._session_index) if self._session_index is not None else counters.total(),
+            "counters_ready": counters.seeded,
+            "session_events": dict(counters.events),
+            "cache": self.sessions.get_stats()
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Session counters for the metrics endpoint; never touches the store"""
         return {
-            "total_active_sessions": total_sessions,
-            "completed_sessions": completed_sessions,
-            "in_progress_sessions": in_progress_sessions,
-            "not_started_sessions": total_sessions - completed_sessions - in_progress_sessions
-        }
\ No newline at end of file
+            "status_counts": self.status_counters.get_stats(),
+            "cache": self.sessions.get_stats(),
+            "writer": self.writer.get_stats(),
+            "expiry_tracked": len(self.expiry_index)
+        }
@@ -0,0 +1,74 @@
+"""
+Session statistics counters
+Per-status session counts kept current on every status transition
+"""
+
+from collections import Counter
+from typing import Dict, Any, Optional
+
+class SessionStatusCounters:
+    """Number of sessions per status, adjusted in O(1) on each transition
+
+    The counts are seeded once from the store at startup. Until then,
+    transitions are remembered per session and folded into the seed, so a
+    session that changes while the archive is being scanned is counted once,
+    with its latest status.
+    """
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._seeded = False
+        self._changed_before_seed: Dict[str, Optional[str]] = {}
+
+        # Lifetime transition events: created, started, completed, expired, deleted
+        self.events: Counter = Counter()
+
+    @property
+    def seeded(self) -> bool:
+        return self._seeded
+
+    def seed(self, statuses: Dict[str, Optional[str]]):
+        """Set the counts from the stored status of every session"""
+        statuses = dict(statuses)
+        statuses.update(self._changed_before_seed)
+        self._counts = Counter(status for status in statuses.values() if status is not None)
+        self._changed_before_seed = {}
+        self._seeded = True
+
+    def seed_counts(self, counts: Dict[str, int]):
+        """Set the counts directly; only valid before any transition is recorded"""
+        self._counts = Counter(counts)
+        self._changed_before_seed = {}
+        self._seeded = True
+
+    def transition(self, session_id: str, old_status: Optional[str], new_status: Optional[str]):
+        """Move one session between statuses; None means the session does not exist"""
+        if old_status == new_status:
+            return
+        if not self._seeded:
+            self._changed_before_seed[session_id] = new_status
+            return
+        if old_status is not None:
+            self._counts[old_status] -= 1
+            if self._counts[old_status] <= 0:
+                del self._counts[old_status]
+        if new_status is not None:
+            self._counts[new_status] += 1
+
+    def record(self, event: str):
+        """Count a lifetime transition event"""
+        self.events[event] += 1
+
+    def count(self, status: str) -> int:
+        return self._counts.get(status, 0)
+
+    def total(self) -> int:
+        return sum(self._counts.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current counts and lifetime events"""
+        return {
+            "seeded": self._seeded,
+            "by_status": dict(self._counts),
+            "events": dict(self.events)
+        }
@@ -0,0 +1,391 @@
+"""
+Session Storage Backends
+Pluggable persistence for interview sessions: JSON files or SQLite via aiosqlite
+"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+from config.settings import get_settings, DatabaseConfig
+from services.serialization import SESSION_FORMAT_VERSION, decode_session, dumps, encode_session, loads
+from services.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+class SessionStore(ABC):
+    """Persistence interface used by SessionService"""
+
+    # Indexed stores answer expiry and statistics queries from an index, so
+    # SessionService does not need to keep every session in memory. Other
+    # stores fall back to a scan of every stored session
+    indexed = False
+
+    async def initialize(self):
+        """Prepare the backing storage"""
+
+    async def close(self):
+        """Release connections and file handles"""
+
+    @abstractmethod
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a single session, or None if it is not stored"""
+
+    @abstractmethod
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Load every stored session keyed by session ID"""
+
+    @abstractmethod
+    async def save(self, session_id: str, session_data: Dict[str, Any]):
+        """Insert or replace a session"""
+
+    @abstractmethod
+    async def delete(self, session_id: str):
+        """Remove a session if it exists"""
+
+    @abstractmethod
+    async def list_ids(self) -> List[str]:
+        """IDs of all stored sessions"""
+
+    async def load_statuses(self) -> Dict[str, Optional[str]]:
+        """Status of every stored session keyed by session ID"""
+        return {session_id: session_data.get("status") for session_id, session_data in (await self.load_all()).items()}
+
+    async def load_activity(self) -> Dict[str, Tuple[Optional[str], float]]:
+        """Status and last activity (epoch seconds) of every stored session"""
+        return {
+            session_id: (session_data.get("status"), self._last_activity(session_data))
+            for session_id, session_data in (await self.load_all()).items()
+        }
+
+    async def find_expired(self, cutoff_timestamp: float) -> Dict[str, Optional[str]]:
+        """Status of each session last updated before the cutoff; indexed stores query an index"""
+        return {
+            session_id: status
+            for session_id, (status, last_activity) in (await self.load_activity()).items()
+            if last_activity < cutoff_timestamp
+        }
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Number of stored sessions per status; indexed stores query an index"""
+        return dict(Counter(status for status, _ in (await self.load_activity()).values()))
+
+    @staticmethod
+    def _timestamp(value: Any) -> float:
+        try:
+            return datetime.fromisoformat(str(value)).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+
+    @classmethod
+    def _last_activity(cls, session_data: Dict[str, Any]) -> float:
+        """Latest of the stored update and read times; 0 if neither is readable"""
+        return max(cls._timestamp(session_data.get("last_updated")), cls._timestamp(session_data.get("last_accessed")))
+
+class JsonFileSessionStore(SessionStore):
+    """One compact orjson file per session
+
+    Writes go to a temporary file that is renamed over the old one, on a worker
+    thread so the event loop never waits on the disk. Files in the original
+    pretty-printed format are still read and are upgraded on their next save
+    or by `migrate()`.
+    """
+
+    def __init__(self, data_dir: str = "data/sessions"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+    def _session_file(self, session_id: str) -> Path:
+        return self.data_dir / f"{session_id}.json"
+
+    @traced(record=("session_id",))
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, self._session_file(session_id))
+
+    @staticmethod
+    def _read(session_file: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(session_file, 'rb') as f:
+                return decode_session(f.read())[0]
+        except FileNotFoundError:
+            return None
+
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self._read_all)
+
+    def _read_all(self) -> Dict[str, Dict[str, Any]]:
+        sessions = {}
+        for session_id in self._list_ids():
+            try:
+                session_data = self._read(self._session_file(session_id))
+                if session_data is not None:
+                    sessions[session_id] = session_data
+            except Exception as e:
+                logger.error(f"Failed to load session {session_id}: {e}")
+        logger.info(f"Loaded {len(sessions)} sessions")
+        return sessions
+
+    async def load_statuses(self) -> Dict[str, Optional[str]]:
+        return await asyncio.to_thread(self._read_statuses)
+
+    def _read_statuses(self) -> Dict[str, Optional[str]]:
+        return {session_id: status for session_id, (status, _) in self._read_activity().items()}
+
+    async def load_activity(self) -> Dict[str, Tuple[Optional[str], float]]:
+        return await asyncio.to_thread(self._read_activity)
+
+    def _read_activity(self) -> Dict[str, Tuple[Optional[str], float]]:
+        activity = {}
+        for session_id in self._list_ids():
+            try:
+                session_data = self._read(self._session_file(session_id))
+            except Exception as e:
+                logger.error(f"Failed to read session {session_id}: {e}")
+                continue
+            if session_data is not None:
+                activity[session_id] = (session_data.get("status"), self._last_activity(session_data))
+        return activity
+
+    @traced(record=("session_id",))
+    async def save(self, session_id: str, session_data: Dict[str, Any]):
+        # Serialize on the loop so the snapshot cannot change mid-write
+        payload = encode_session(session_data)
+        await asyncio.to_thread(self._write_atomic, self._session_file(session_id), payload)
+
+    @staticmethod
+    def _write_atomic(session_file: Path, payload: bytes):
+        temp_file = session_file.with_name(f".{session_file.name}.tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_file, session_file)
+
+    def migrate(self) -> Dict[str, int]:
+        """Rewrite every session file that is not in the current format
+
+        Blocking; meant for the one-shot `migrate_sessions.py` command while the
+        server is stopped. Returns counts of migrated, current and failed files.
+        """
+        counts = {"migrated": 0, "current": 0, "failed": 0}
+        for session_id in self._list_ids():
+            session_file = self._session_file(session_id)
+            try:
+                with open(session_file, 'rb') as f:
+                    session_data, version = decode_session(f.read())
+                if version == SESSION_FORMAT_VERSION:
+                    counts["current"] += 1
+                    continue
+                self._write_atomic(session_file, encode_session(session_data))
+                counts["migrated"] += 1
+            except Exception as e:
+                counts["failed"] += 1
+                logger.error(f"Failed to migrate session {session_id}: {e}")
+        return counts
+
+    @traced(record=("session_id",))
+    async def delete(self, session_id: str):
+        session_file = self._session_file(session_id)
+        await asyncio.to_thread(session_file.unlink, True)
+
+    async def list_ids(self) -> List[str]:
+        return await asyncio.to_thread(self._list_ids)
+
+    def _list_ids(self) -> List[str]:
+        with os.scandir(self.data_dir) as entries:
+            return [entry.name[:-5] for entry in entries if entry.name.endswith(".json") and not entry.name.startswith(".")]
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite store with indexed session columns and a separate answers table
+
+    Uses SQLAlchemy's async engine over aiosqlite so connections are pooled
+    according to DatabaseConfig.
+    """
+
+    indexed = True
+
+    def __init__(self, database_url: str = None):
+        from sqlalchemy import MetaData, Table, Column, String, Float, Integer, Text, Index, ForeignKey
+
+        self.database_url = database_url or DatabaseConfig.SQLITE_URL
+        self.engine = None
+
+        self.metadata = MetaData()
+        self.sessions_table = Table(
+            "sessions", self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("user_email", String, nullable=True),
+            Column("status", String, nullable=False),
+            Column("created_at", String),
+            Column("last_updated", Float, nullable=False),
+            Column("data", Text, nullable=False),
+            Index("ix_sessions_status", "status"),
+            Index("ix_sessions_user_email", "user_email"),
+            Index("ix_sessions_last_updated", "last_updated"),
+        )
+        self.answers_table = Table(
+            "answers", self.metadata,
+            Column("session_id", String, ForeignKey("sessions.session_id"), primary_key=True),
+            Column("position", Integer, primary_key=True),
+            Column("question_id", Integer),
+            Column("score", Integer),
+            Column("submitted_at", String),
+            Column("data", Text, nullable=False),
+        )
+
+    async def initialize(self):
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        url = self.database_url
+        if url.startswith("sqlite:///"):
+            url = url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+
+        # aiosqlite defaults to NullPool, which takes no pool arguments
+        self.engine = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DatabaseConfig.POOL_SIZE,
+            max_overflow=DatabaseConfig.MAX_OVERFLOW,
+            pool_timeout=DatabaseConfig.POOL_TIMEOUT,
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.metadata.create_all)
+        logger.info(f"SQLite session store ready at {self.database_url}")
+
+    async def close(self):
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+
+    def _to_session(self, row, answer_rows) -> Dict[str, Any]:
+        session_data = loads(row.data)
+        session_data["answers"] = [loads(answer.data) for answer in answer_rows]
+        return session_data
+
+    @traced(record=("session_id",))
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        from sqlalchemy import select
+
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(
+                select(self.sessions_table.c.data).where(self.sessions_table.c.session_id == session_id)
+            )).first()
+            if row is None:
+                return None
+            answer_rows = (await conn.execute(
+                select(self.answers_table.c.data)
+                .where(self.answers_table.c.session_id == session_id)
+                .order_by(self.answers_table.c.position)
+            )).all()
+        return self._to_session(row, answer_rows)
+
+    async def load_all(self) -> Dict[str, Dict[str, Any]]:
+        return {session_id: await self.load(session_id) for session_id in await self.list_ids()}
+
+    @traced(record=("session_id",))
+    async def save(self, session_id: str, session_data: Dict[str, Any]):
+        from sqlalchemy import delete
+        from sqlalchemy.dialects.sqlite import insert
+
+        # Snapshot before the first await so every row comes from the same state of the session
+        answers = list(session_data.get("answers", []))
+        session_row = {
+            "session_id": session_id,
+            "user_email": session_data.get("user_email"),
+            "status": session_data.get("status", "not_started"),
+            "created_at": session_data.get("created_at"),
+            # Last activity, so reads recorded in last_accessed also defer expiry
+            "last_updated": self._last_activity(session_data),
+            "data": dumps({k: v for k, v in session_data.items() if k != "answers"}).decode(),
+        }
+        answer_rows = [
+            {
+                "session_id": session_id,
+                "position": position,
+                "question_id": answer.get("question_id"),
+                "score": answer.get("score", 0),
+                "submitted_at": answer.get("submitted_at"),
+                "data": dumps(answer).decode(),
+            }
+            for position, answer in enumerate(answers)
+        ]
+
+        async with self.engine.begin() as conn:
+            upsert = insert(self.sessions_table).values(**session_row)
+            await conn.execute(upsert.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_={key: upsert.excluded[key] for key in session_row if key != "session_id"}
+            ))
+
+            if answer_rows:
+                upsert_answers = insert(self.answers_table)
+                await conn.execute(
+                    upsert_answers.on_conflict_do_update(
+                        index_elements=["session_id", "position"],
+                        set_={key: upsert_answers.excluded[key] for key in ("question_id", "score", "submitted_at", "data")}
+                    ),
+                    answer_rows
+                )
+
+            await conn.execute(
+                delete(self.answers_table)
+                .where(self.answers_table.c.session_id == session_id)
+                .where(self.answers_table.c.position >= len(answer_rows))
+            )
+
+    @traced(record=("session_id",))
+    async def delete(self, session_id: str):
+        from sqlalchemy import delete
+
+        async with self.engine.begin() as conn:
+            await conn.execute(delete(self.answers_table).where(self.answers_table.c.session_id == session_id))
+            await conn.execute(delete(self.sessions_table).where(self.sessions_table.c.session_id == session_id))
+
+    async def list_ids(self) -> List[str]:
+        from sqlalchemy import select
+
+        async with self.engine.connect() as conn:
+            return list((await conn.execute(select(self.sessions_table.c.session_id))).scalars())
+
+    async def load_statuses(self) -> Dict[str, Optional[str]]:
+        from sqlalchemy import select
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(self.sessions_table.c.session_id, self.sessions_table.c.status)
+            )
+            return {session_id: status for session_id, status in result.all()}
+
+    async def find_expired(self, cutoff_timestamp: float) -> Dict[str, Optional[str]]:
+        from sqlalchemy import select
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(self.sessions_table.c.session_id, self.sessions_table.c.status)
+                .where(self.sessions_table.c.last_updated < cutoff_timestamp)
+            )
+            return {session_id: status for session_id, status in result.all()}
+
+    async def count_by_status(self) -> Dict[str, int]:
+        from sqlalchemy import select, func
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(self.sessions_table.c.status, func.count())
+                .group_by(self.sessions_table.c.status)
+            )
+            return {status: count for status, count in result.all()}
+
+def create_session_store() -> SessionStore:
+    """Build the session store selected by SESSION_STORE_BACKEND"""
+    settings = get_settings()
+    backend = settings.session_store_backend.lower()
+    if backend == "sqlite":
+        return SQLiteSessionStore(settings.database_url or DatabaseConfig.SQLITE_URL)
+    if backend != "json":
+        logger.warning(f"Unknown session store backend '{backend}', falling back to JSON files")
+    return JsonFileSessionStore(settings.session_storage_path)
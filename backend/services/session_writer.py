@@ -0,0 +1,130 @@
+"""
+Write-behind persistence for sessions
+Coalesces bursts of session mutations into a single background write
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional
+
+from services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+class SessionWriteBehind:
+    """Marks sessions dirty and flushes them to the store in the background
+
+    A dirty session is written once it has been quiet for `flush_interval_seconds`
+    or has been dirty for `max_dirty_age_seconds`, whichever comes first, so the
+    five updates made by one /setup call end up as a single write.
+    """
+
+    def __init__(
+        self,
+        store: SessionStore,
+        flush_interval_seconds: float = 1.0,
+        max_dirty_age_seconds: float = 5.0
+    ):
+        self.store = store
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_dirty_age_seconds = max_dirty_age_seconds
+
+        # session_id -> (session data, first dirtied at, last dirtied at)
+        self._dirty: Dict[str, tuple] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.writes_requested = 0
+        self.writes_performed = 0
+        self.write_failures = 0
+
+    def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flush loop and write everything that is still dirty"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush_all()
+        logger.info(f"Session writer drained ({self.writes_performed} writes for {self.writes_requested} mutations)")
+
+    def mark_dirty(self, session_id: str, session_data: Dict[str, Any]):
+        """Schedule a session for writing"""
+        now = time.monotonic()
+        first_dirtied = self._dirty[session_id][1] if session_id in self._dirty else now
+        self._dirty[session_id] = (session_data, first_dirtied, now)
+        self.writes_requested += 1
+
+    def pending(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Unwritten session data, if the session is dirty"""
+        entry = self._dirty.get(session_id)
+        return entry[0] if entry else None
+
+    async def discard(self, session_id: str):
+        """Drop a pending write, waiting out any write already in progress"""
+        async with self._lock:
+            self._dirty.pop(session_id, None)
+
+    async def flush(self, session_id: str):
+        """Write one session now if it is dirty"""
+        async with self._lock:
+            entry = self._dirty.pop(session_id, None)
+            if entry:
+                await self._write(session_id, entry[0])
+
+    async def flush_all(self):
+        """Write every dirty session now"""
+        async with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            for session_id, entry in dirty.items():
+                await self._write(session_id, entry[0])
+
+    async def _flush_due(self):
+        now = time.monotonic()
+        async with self._lock:
+            due = [
+                session_id for session_id, (_, first_dirtied, last_dirtied) in self._dirty.items()
+                if now - last_dirtied >= self.flush_interval_seconds
+                or now - first_dirtied >= self.max_dirty_age_seconds
+            ]
+            for session_id in due:
+                entry = self._dirty.pop(session_id, None)
+                if entry:
+                    await self._write(session_id, entry[0])
+
+    async def _write(self, session_id: str, session_data: Dict[str, Any]):
+        try:
+            await self.store.save(session_id, session_data)
+            self.writes_performed += 1
+        except Exception as e:
+            self.write_failures += 1
+            logger.error(f"Failed to save session {session_id}: {e}")
+            # Keep the session dirty so the next flush retries it
+            now = time.monotonic()
+            self._dirty.setdefault(session_id, (session_data, now, now))
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self._flush_due()
+            except Exception as e:
+                logger.error(f"Session flush failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Write-behind counters"""
+        return {
+            "dirty_sessions": len(self._dirty),
+            "writes_requested": self.writes_requested,
+            "writes_performed": self.writes_performed,
+            "writes_coalesced": max(0, self.writes_requested - self.writes_performed - len(self._dirty)),
+            "write_failures": self.write_failures
+        }
@@ -0,0 +1,81 @@
+"""
+Single-flight coalescing of identical model calls
+Concurrent requests for the same prompt share one upstream call and its result
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """At most one in-flight call per key; later callers wait for the first one's result
+
+    Only calls that overlap in time are shared; nothing is kept once the call
+    finishes, so this is not a cache. Exceptions reach every waiter. The call
+    keeps running while anyone is waiting for it and is cancelled when the
+    last waiter goes away.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+
+        self.issued = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    @staticmethod
+    def make_key(prompt: str, *config: Any) -> str:
+        """Hash of the prompt with whitespace runs collapsed, plus any generation settings"""
+        normalized = " ".join(prompt.split())
+        settings = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(f"{normalized}\x1f{settings}".encode()).hexdigest()
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of `call()`, or of the identical call already in flight"""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _, flight=flight: self._finish(key, flight))
+            self.issued += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # Shielded so one caller disconnecting doesn't cancel the others' result
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+                self.abandoned += 1
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Mark any exception retrieved; the waiters re-raise it, but all of them may have gone
+            flight.task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Upstream calls issued vs requests that joined one already in flight"""
+        requests = self.issued + self.coalesced
+        return {
+            "in_flight": len(self._flights),
+            "issued": self.issued,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / requests, 4) if requests else 0.0,
+            "abandoned": self.abandoned
+        }
@@ -0,0 +1,129 @@
+"""
+Speculative follow-up generation
+Follow-up questions started alongside the answer evaluation and held per session until asked for
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Awaitable, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class SpeculativeFollowUps:
+    """At most one in-flight or finished follow-up per session
+
+    A follow-up depends only on the question and the answer, so it can be
+    generated while the answer is still being evaluated. The result stays
+    here until it is served once, by a follow-up request for that answer or
+    the next question. A newer answer replaces the previous speculation, and
+    deleting or completing the session cancels it.
+    """
+
+    def __init__(self):
+        # session ID -> (question/answer key, task producing the follow-up)
+        self._entries: Dict[str, Tuple[str, asyncio.Task]] = {}
+
+        self.started = 0
+        self.served = 0
+        self.misses = 0
+        self.replaced = 0
+        self.cancelled = 0
+
+    @staticmethod
+    def make_key(question: str, answer: str) -> str:
+        return hashlib.sha256(f"{(question or '').strip()}\x1f{(answer or '').strip()}".encode()).hexdigest()
+
+    def start(self, session_id: str, key: str, follow_up: Awaitable[str]):
+        """Begin generating a follow-up; an older one for the session is dropped"""
+        if self._drop(session_id):
+            self.replaced += 1
+        self._entries[session_id] = (key, asyncio.ensure_future(follow_up))
+        self.started += 1
+
+    async def take(self, session_id: str, key: str) -> Optional[str]:
+        """The speculative follow-up to this answer, or None; used when a follow-up is requested
+
+        Waits for it if it is still being generated, since the caller would
+        otherwise generate the same follow-up again. A served follow-up is
+        dropped, so it is handed out once.
+        """
+        entry = self._entries.get(session_id)
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+        task = entry[1]
+        try:
+            # Shielded: a caller that disconnects must not cancel work the next call can use
+            follow_up = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            follow_up = None  # The session went away while we waited
+        except Exception as e:
+            logger.error(f"Speculative follow-up failed for session {session_id}: {e}")
+            follow_up = None
+        return self._served(session_id, task, follow_up)
+
+    def ready(self, session_id: str) -> Optional[str]:
+        """The session's follow-up if it has finished, else None without waiting
+
+        Used by next-question polling, which must not wait on a model call.
+        A follow-up still being generated stays for a later take().
+        """
+        entry = self._entries.get(session_id)
+        if entry is None or not entry[1].done():
+            return None
+        task = entry[1]
+        follow_up = None
+        if not task.cancelled():
+            if task.exception() is not None:
+                logger.error(f"Speculative follow-up failed for session {session_id}: {task.exception()}")
+            else:
+                follow_up = task.result()
+        return self._served(session_id, task, follow_up)
+
+    def _served(self, session_id: str, task: asyncio.Task, follow_up: Optional[str]) -> Optional[str]:
+        """Count a hit or miss and drop the finished entry"""
+        entry = self._entries.get(session_id)
+        if entry is not None and entry[1] is task:
+            del self._entries[session_id]
+        if follow_up is None:
+            self.misses += 1
+        else:
+            self.served += 1
+        return follow_up
+
+    def cancel(self, session_id: str):
+        """Stop any speculation for a session that was deleted, expired or completed"""
+        if self._drop(session_id):
+            self.cancelled += 1
+
+    def _drop(self, session_id: str) -> bool:
+        """Remove the session's entry; True if it was still running"""
+        entry = self._entries.pop(session_id, None)
+        if entry is None or entry[1].done():
+            return False
+        entry[1].cancel()
+        return True
+
+    async def close(self):
+        """Cancel everything still in flight"""
+        tasks = [task for _, task in self._entries.values() if not task.done()]
+        self._entries.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """How many speculative follow-ups were used, wasted or cancelled"""
+        running = sum(1 for _, task in self._entries.values() if not task.done())
+        return {
+            "running": running,
+            "ready": len(self._entries) - running,
+            "started": self.started,
+            "served": self.served,
+            "misses": self.misses,
+            "replaced_while_running": self.replaced,
+            "cancelled": self.cancelled
+        }
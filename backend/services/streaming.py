@@ -0,0 +1,106 @@
+"""
+Server-Sent Events helpers
+Formats streamed model output as SSE and pulls readable text out of streaming JSON
+"""
+
+import json
+import logging
+import re
+from typing import Any, AsyncIterator, Tuple
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from services.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+def sse_event(event: str, data: Any) -> bytes:
+    """One SSE frame; the payload is JSON so multi-line text stays on one data line"""
+    if isinstance(data, BaseModel):
+        data = data.dict()
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+async def sse_stream(events: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode (event, data) pairs; a failure mid-stream becomes an error event"""
+    try:
+        async for event, data in events:
+            yield sse_event(event, data)
+    except Exception as e:
+        logger.error(f"Event stream failed: {e}")
+        yield sse_event("error", {"detail": "Stream interrupted"})
+
+def sse_response(events: AsyncIterator[Tuple[str, Any]]) -> StreamingResponse:
+    """Stream events to the client without proxy buffering"""
+    return StreamingResponse(
+        sse_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+class JsonStringFieldReader:
+    """Decodes one string field of a JSON object while the document is still arriving
+
+    The model writes evaluations as JSON; feeding each chunk here returns the
+    newly completed part of e.g. "detailed_feedback" so it can be shown
+    before the rest of the object has been generated.
+    """
+
+    def __init__(self, field: str):
+        self._marker = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._position = None  # Next unread index inside the string value
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Text of the field decoded from this chunk ("" if none yet)"""
+        if self.done:
+            return ""
+        self._buffer += chunk
+        if self._position is None:
+            match = self._marker.search(self._buffer)
+            if not match:
+                return ""
+            self._position = match.end()
+
+        buffer = self._buffer
+        i = self._position
+        decoded = []
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.done = True
+                i += 1
+                break
+            if char != '\\':
+                decoded.append(char)
+                i += 1
+                continue
+            # Escapes are only decoded once complete; otherwise wait for the next chunk
+            if i + 1 >= len(buffer):
+                break
+            if buffer[i + 1] != 'u':
+                decoded.append(_ESCAPES.get(buffer[i + 1], buffer[i + 1]))
+                i += 2
+                continue
+            if i + 6 > len(buffer):
+                break
+            try:
+                high_surrogate = 0xD800 <= int(buffer[i + 2:i + 6], 16) < 0xDC00
+            except ValueError:
+                high_surrogate = False
+            length = 12 if high_surrogate else 6
+            if i + length > len(buffer):
+                break
+            try:
+                text = json.loads(f'"{buffer[i:i + length]}"')
+            except ValueError:
+                text = ""
+            # A lone surrogate cannot be encoded as UTF-8; drop it
+            if not any(0xD800 <= ord(c) <= 0xDFFF for c in text):
+                decoded.append(text)
+            i += length
+        self._position = i
+        return "".join(decoded)
@@ -0,0 +1,366 @@
+"""
+Structured output parsing for model responses
+Extracts, repairs and validates the JSON the Gemini prompts ask for
+"""
+
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from pydantic import ValidationError as SchemaValidationError
+
+from models.api_models import AnswerEvaluationResponse, FinalReportResponse, InterviewQuestion
+
+logger = logging.getLogger(__name__)
+
+# kind -> (expected JSON shape, pydantic model for each object, fields the model requires that the prompt doesn't ask for)
+SCHEMAS: Dict[str, Tuple[type, type, Dict[str, Any]]] = {
+    "questions": (list, InterviewQuestion, {}),
+    "evaluation": (dict, AnswerEvaluationResponse, {"success": True}),
+    "report": (dict, FinalReportResponse, {"success": True, "session_id": "", "generated_at": datetime(1970, 1, 1)}),
+}
+
+_FENCE = re.compile(r"```[A-Za-z]*[ \t]*\n?(.*?)(?:```|\Z)", re.DOTALL)
+_WORDS = {"True": "true", "False": "false", "None": "null", "NaN": "null", "undefined": "null"}
+_ESCAPES = set('"\\/bfnrtu')
+_CONTROL = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+class StructuredOutputError(ValueError):
+    """The response could not be turned into valid structured output"""
+
+    def __init__(self, message: str, errors: List[str] = None):
+        super().__init__(message)
+        self.errors = errors or [message]
+
+def strip_code_fences(text: str) -> str:
+    """Content of the first ``` fenced block, or the text unchanged"""
+    match = _FENCE.search(text)
+    if match and match.group(1).strip():
+        return match.group(1)
+    return text
+
+def extract_block(text: str, opener: str) -> str:
+    """The first JSON object or array starting with `opener`, to its matching bracket
+
+    Brackets inside strings are skipped. An unclosed block (a truncated
+    response) is returned to the end of the text for repair_json to close.
+    """
+    start = text.find(opener)
+    if start < 0:
+        raise StructuredOutputError(f"No JSON {'array' if opener == '[' else 'object'} in response")
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return text[start:]
+
+def _significant_index(text: str, index: int) -> int:
+    """Index of the first non-whitespace character at or after `index`"""
+    while index < len(text) and text[index].isspace():
+        index += 1
+    return index
+
+def _next_significant(text: str, index: int) -> str:
+    """The first non-whitespace character at or after `index`, or '' at the end"""
+    index = _significant_index(text, index)
+    return text[index] if index < len(text) else ""
+
+def _ends_string(text: str, index: int, container: str) -> bool:
+    """Whether the quote at `index` closes its string rather than being part of it
+
+    A closing quote is followed by a delimiter. After a comma, what comes next
+    must also fit the container: another key in an object, another value in
+    an array. So the quote before `, then left"` stays inside the string.
+    """
+    following = _significant_index(text, index + 1)
+    if following >= len(text) or text[following] in "}]:":
+        return True
+    if text[following] != ",":
+        return False
+    after = _significant_index(text, following + 1)
+    if after >= len(text) or text[after] in "}]" or not container:
+        return True
+    if container == "[":
+        word = re.match(r"[A-Za-z_]+", text[after:])
+        return text[after] in "\"'{[-0123456789" or (word is not None and (word.group() in _WORDS or word.group() in ("true", "false", "null")))
+    # Object: the next key must be a quoted string followed by a colon
+    if text[after] not in "\"'":
+        return False
+    key_end = text.find(text[after], after + 1)
+    return key_end >= 0 and _next_significant(text, key_end + 1) == ":"
+
+def repair_json(text: str) -> str:
+    """Best-effort fix of the mistakes models make when writing JSON
+
+    In a single pass: drops trailing commas, escapes quotes that don't end
+    their string, escapes raw newlines and control characters inside
+    strings, converts single-quoted strings and Python literals, and closes
+    strings, objects and arrays left open by a truncated response. Text after
+    the top-level value is ignored.
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    quote = None          # Delimiter of the string being copied, if any
+    string_is_key = False
+    pending_key = False   # An object key was written without its value
+    last = ""             # Last significant character written outside strings
+    index = 0
+
+    while index < len(text):
+        char = text[index]
+        if quote is not None:
+            if char == "\\":
+                following = text[index + 1:index + 2]
+                if following and (following in _ESCAPES or following == "'"):
+                    # \' is only valid in single-quoted strings, where it becomes a plain quote
+                    out.append("'" if following == "'" else char + following)
+                    index += 2
+                else:
+                    # A lone backslash (a Windows path, a regex); a trailing one was cut off
+                    if following:
+                        out.append("\\\\")
+                    index += 1
+                continue
+            if char == quote and _ends_string(text, index, stack[-1] if stack else ""):
+                out.append('"')
+                quote = None
+                pending_key = string_is_key
+                last = '"'
+            elif char == '"':
+                out.append('\\"')  # Unescaped quote inside the string
+            elif char in _CONTROL:
+                out.append(_CONTROL[char])
+            elif ord(char) < 0x20:
+                out.append(f"\\u{ord(char):04x}")
+            else:
+                out.append(char)
+            index += 1
+            continue
+
+        if char in "\"'":
+            quote = char
+            string_is_key = bool(stack) and stack[-1] == "{" and last in ("{", ",")
+            out.append('"')
+        elif char == ",":
+            if _next_significant(text, index + 1) not in ("}", "]", "") and last not in ("{", "[", ","):
+                out.append(char)
+                last = char
+        elif char in "{[":
+            stack.append(char)
+            out.append(char)
+            last = char
+        elif char in "}]":
+            if char not in (_CLOSERS[opener] for opener in stack):
+                index += 1
+                continue
+            if pending_key:
+                out.append(": null")
+                pending_key = False
+            while stack:
+                opener = stack.pop()
+                out.append(_CLOSERS[opener])
+                if _CLOSERS[opener] == char:
+                    break
+            last = char
+            if not stack:
+                return "".join(out)
+        elif char == ":":
+            pending_key = False
+            out.append(char)
+            last = char
+        elif char.isalpha() or char == "_":
+            end = index
+            while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                end += 1
+            word = text[index:end]
+            out.append(_WORDS.get(word, word))
+            pending_key = False
+            last = word[-1]
+            index = end
+            continue
+        elif char == "/" and text.startswith("//", index):
+            # Line comment
+            end = text.find("\n", index)
+            index = len(text) if end < 0 else end
+            continue
+        else:
+            out.append(char)
+            if not char.isspace():
+                pending_key = False
+                last = char
+        index += 1
+
+    # Truncated response: close whatever is still open
+    if quote is not None:
+        out.append('"')
+        pending_key = string_is_key
+    repaired = "".join(out).rstrip()
+    if repaired.endswith(","):
+        repaired = repaired[:-1]
+    if pending_key:
+        repaired += ": null"
+    elif repaired.endswith(":"):
+        repaired += " null"
+    return repaired + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+class StructuredOutputParser:
+    """Turns model responses into validated JSON, counting how often that needs help
+
+    A response is parsed as-is first (after stripping code fences and any
+    prose around the JSON), then after repair_json. Either way the result is
+    validated against the pydantic model for its kind. When both fail,
+    parse_or_fix sends the broken output back to the model with a short
+    "fix this JSON" prompt instead of asking the original question again.
+    """
+
+    def __init__(self, reprompt_enabled: bool = True):
+        self.reprompt_enabled = reprompt_enabled
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, kind: str, outcome: str):
+        counters = self._counters.setdefault(kind, {
+            "attempts": 0, "clean": 0, "repaired": 0, "reprompted": 0, "reprompt_fixed": 0, "failed": 0
+        })
+        counters[outcome] += 1
+
+    def _parse(self, text: str, kind: str) -> Tuple[Any, bool]:
+        """(validated JSON, whether it needed repair_json)"""
+        shape = SCHEMAS[kind][0]
+        block = extract_block(strip_code_fences(text), "[" if shape is list else "{")
+        try:
+            return self.validate(json.loads(block), kind), False
+        except json.JSONDecodeError:
+            pass
+        try:
+            data = json.loads(repair_json(block))
+        except json.JSONDecodeError as e:
+            raise StructuredOutputError(f"Invalid JSON: {e}")
+        return self.validate(data, kind, truncated=True), True
+
+    @staticmethod
+    def validate(data: Any, kind: str, truncated: bool = False) -> Any:
+        """Check decoded JSON against the kind's pydantic model; returns the JSON unchanged
+
+        With `truncated`, an array whose only invalid item is the last one
+        (cut off mid-object) is returned without it.
+        """
+        shape, model, defaults = SCHEMAS[kind]
+        if shape is list and isinstance(data, dict):
+            # {"questions": [...]} instead of the bare array
+            lists = [value for value in data.values() if isinstance(value, list)]
+            if len(lists) == 1:
+                data = lists[0]
+        if not isinstance(data, shape):
+            raise StructuredOutputError(f"Expected a JSON {'array' if shape is list else 'object'}")
+        items = data if shape is list else [data]
+        if not items:
+            raise StructuredOutputError("Empty JSON array")
+
+        errors = []
+        invalid = set()
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append(f"item {position}: expected an object")
+                invalid.add(position)
+                continue
+            try:
+                model(**{**defaults, **item})
+            except SchemaValidationError as e:
+                invalid.add(position)
+                for error in e.errors():
+                    location = ".".join(str(part) for part in error["loc"])
+                    prefix = f"item {position} " if shape is list else ""
+                    errors.append(f"{prefix}{location}: {error['msg']}")
+        if truncated and shape is list and invalid == {len(items) - 1} and len(items) > 1:
+            return items[:-1]
+        if errors:
+            raise StructuredOutputError(f"{len(errors)} schema error(s): {errors[0]}", errors)
+        return data
+
+    def parse(self, text: str, kind: str) -> Any:
+        """Decode, repair if needed and validate; raises StructuredOutputError"""
+        self._count(kind, "attempts")
+        try:
+            data, repaired = self._parse(text, kind)
+        except StructuredOutputError:
+            self._count(kind, "failed")
+            raise
+        self._count(kind, "repaired" if repaired else "clean")
+        return data
+
+    async def parse_or_fix(self, text: str, kind: str, fix: Callable[[str], Awaitable[str]]) -> Any:
+        """Like parse(), but a failure is sent back through `fix` with a repair prompt
+
+        `fix` takes a prompt and returns the model's response. If the fixed
+        output is still unusable the original error is raised.
+        """
+        self._count(kind, "attempts")
+        try:
+            data, repaired = self._parse(text, kind)
+            self._count(kind, "repaired" if repaired else "clean")
+            return data
+        except StructuredOutputError as e:
+            error = e
+        if not self.reprompt_enabled:
+            self._count(kind, "failed")
+            raise error
+
+        self._count(kind, "reprompted")
+        logger.warning(f"Malformed {kind} output ({error}); asking the model to fix it")
+        try:
+            data, _ = self._parse(await fix(self.fix_prompt(text, kind, error.errors)), kind)
+        except Exception as e:
+            logger.error(f"Repair prompt for {kind} output failed: {e}")
+            self._count(kind, "failed")
+            raise error
+        self._count(kind, "reprompt_fixed")
+        return data
+
+    @staticmethod
+    def fix_prompt(text: str, kind: str, errors: List[str]) -> str:
+        """Short prompt asking the model to correct its own malformed output"""
+        shape = "array" if SCHEMAS[kind][0] is list else "object"
+        problems = "\n".join(f"- {error}" for error in errors[:10])
+        return f"""
+The following JSON {shape} is malformed or does not match the expected fields.
+
+Problems:
+{problems}
+
+Return only the corrected JSON {shape}: no commentary and no code fences. Keep all content unchanged except what is needed to fix the problems.
+
+{text}
+"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-kind outcomes; a first-pass failure costs a repair call, a final failure the whole call"""
+        stats = {}
+        for kind, counters in self._counters.items():
+            attempts = counters["attempts"]
+            first_pass_failures = attempts - counters["clean"] - counters["repaired"]
+            stats[kind] = {
+                **counters,
+                "repair_rate": round(counters["repaired"] / attempts, 4) if attempts else 0.0,
+                "first_pass_failure_rate": round(first_pass_failures / attempts, 4) if attempts else 0.0,
+                "failure_rate": round(counters["failed"] / attempts, 4) if attempts else 0.0
+            }
+        return stats
@@ -0,0 +1,353 @@
+"""
+Lightweight in-process span tracing
+Spans propagate through contextvars and are exported in batches to JSON lines or an OTLP/HTTP collector
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from services.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+TRACE_EXPORTERS = ("jsonl", "otlp")
+
+# Marks a request that was not sampled, so its child spans are skipped too
+_UNSAMPLED = object()
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+# OTLP span kinds
+_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """(trace ID, parent span ID, sampled) from a W3C traceparent header, None if absent or invalid"""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+    return parts[1], parts[2], sampled
+
+class Span:
+    """One timed operation; ended spans are handed to the tracer for export"""
+
+    __slots__ = ("tracer", "name", "kind", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str], kind: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def end(self, error: BaseException = None):
+        """Record the end time (and failure, if any) and queue the span for export"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.tracer._record(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The JSON-lines record"""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error
+        }
+
+class JsonLinesExporter:
+    """Appends one JSON object per span to a local file"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def export(self, spans: List[Span]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans))
+
+    def close(self):
+        pass
+
+class OTLPHttpExporter:
+    """Posts spans as OTLP/HTTP JSON (`ExportTraceServiceRequest`) to a collector's /v1/traces"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout_seconds: float = 5.0):
+        import httpx
+
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout_seconds)
+
+    @staticmethod
+    def _value(value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def _span(self, span: Span) -> Dict[str, Any]:
+        return {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "parentSpanId": span.parent_id or "",
+            "name": span.name,
+            "kind": _KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [{"key": key, "value": self._value(value)} for key, value in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+        }
+
+    def export(self, spans: List[Span]):
+        payload = {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": [self._span(span) for span in spans]}]
+        }]}
+        response = self._client.post(self.endpoint, json=payload)
+        response.raise_for_status()
+
+    def close(self):
+        self._client.close()
+
+class Tracer:
+    """Creates spans, tracks the current one per task and exports ended spans in batches
+
+    Disabled until configured; while disabled `span()` and `traced` cost one
+    attribute check. Whether a trace is recorded is decided once at its root
+    span (by `sample_rate`, or an incoming traceparent's sampled flag).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.exporter = None
+        self.sample_rate = 1.0
+        self.max_buffered_spans = 10000
+        self._buffer: List[Span] = []
+        self._task: Optional[asyncio.Task] = None
+
+        self.spans_recorded = 0
+        self.spans_exported = 0
+        self.spans_dropped = 0
+        self.export_failures = 0
+
+    def configure(self, exporter, sample_rate: float = 1.0, max_buffered_spans: int = 10000):
+        """Start recording spans for `exporter`"""
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.max_buffered_spans = max_buffered_spans
+        self.enabled = True
+
+    def start(self, interval_seconds: float):
+        """Start the background export loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(interval_seconds))
+
+    async def stop(self):
+        """Stop exporting, flush what is buffered and close the exporter"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        if self.exporter is not None:
+            self.exporter.close()
+        self.enabled = False
+
+    async def _loop(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.flush()
+
+    async def flush(self):
+        """Export every buffered span, off the event loop"""
+        if not self._buffer or self.exporter is None:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            await asyncio.to_thread(self.exporter.export, batch)
+            self.spans_exported += len(batch)
+        except Exception as e:
+            self.export_failures += 1
+            self.spans_dropped += len(batch)
+            logger.error(f"Span export failed, dropped {len(batch)} spans: {e}")
+
+    def _record(self, span: Span):
+        if len(self._buffer) >= self.max_buffered_spans:
+            self.spans_dropped += 1
+            return
+        self._buffer.append(span)
+        self.spans_recorded += 1
+
+    def start_span(self, name: str, kind: str = "internal", traceparent: str = None, **attributes: Any) -> Optional[Span]:
+        """A span under the current one, or a new trace's root; None when not recording
+
+        The span does not become the current span; end it with `span.end()`.
+        Use `span()` for spans that should parent the work inside them.
+        """
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return None
+        if parent is not None:
+            return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id, sampled = _new_id(128), None, random.random() < self.sample_rate
+        if not sampled:
+            return None
+        return Span(self, name, trace_id, parent_id, kind, attributes)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", traceparent: str = None, **attributes: Any) -> Iterator[Optional[Span]]:
+        """Time the enclosed block as the current span; yields None when not recording"""
+        if not self.enabled:
+            yield None
+            return
+        parent = _current_span.get()
+        span = self.start_span(name, kind, traceparent, **attributes)
+        if span is not None:
+            token = _current_span.set(span)
+        elif parent is None:
+            # An unsampled root hides its whole subtree
+            token = _current_span.set(_UNSAMPLED)
+        else:
+            token = None
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if token is not None:
+                _current_span.reset(token)
+            if span is not None:
+                span.end(error)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Export counters"""
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "buffered": len(self._buffer),
+            "spans_recorded": self.spans_recorded,
+            "spans_exported": self.spans_exported,
+            "spans_dropped": self.spans_dropped,
+            "export_failures": self.export_failures
+        }
+
+# One tracer per process, configured by the main.py lifespan
+tracer = Tracer()
+
+def create_exporter(exporter: str, jsonl_path: str, otlp_endpoint: str, service_name: str):
+    """The span exporter selected by TRACING_EXPORTER"""
+    if exporter == "jsonl":
+        return JsonLinesExporter(jsonl_path)
+    if exporter == "otlp":
+        return OTLPHttpExporter(otlp_endpoint, service_name)
+    raise ValueError(f"Unknown trace exporter '{exporter}' (expected one of: {', '.join(TRACE_EXPORTERS)})")
+
+def traced(name: str = None, record: Tuple[str, ...] = ()):
+    """Run an async method in a span named after it (or `name`)
+
+    Arguments listed in `record` (e.g. "session_id") become span attributes.
+    """
+    def decorate(func):
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if record else None
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            attributes = {}
+            if signature is not None:
+                arguments = signature.bind_partial(*args, **kwargs).arguments
+                attributes = {key: arguments[key] for key in record if key in arguments}
+            with tracer.span(span_name, **attributes):
+                return await func(*args, **kwargs)
+
+        return wrapper
+    return decorate
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per HTTP request
+
+    The span is named by method and route template once routing is done,
+    continues the caller's trace when a W3C `traceparent` header is sent,
+    and its trace ID is returned in `X-Trace-Id`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1") or None
+        with tracer.span(f"{scope['method']} {scope['path']}", kind="server", traceparent=traceparent, **{
+            "http.method": scope["method"],
+            "http.target": scope["path"]
+        }) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    message = dict(message, headers=list(message.get("headers", [])) + [(b"x-trace-id", span.trace_id.encode())])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                span.name = f"{scope['method']} {route_template(scope)}"
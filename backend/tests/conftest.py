@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the backend tests
+Services run against the local fake model backend in a throwaway working directory
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# Settings are read from the environment once, so fix them before any service is imported
+os.environ.update(
+    GEMINI_BACKEND="fake",
+    FAKE_MODEL_LATENCY_MS="0",
+    FAKE_MODEL_LATENCY_DISTRIBUTION="fixed",
+    GEMINI_REQUESTS_PER_MINUTE="0",
+    GEMINI_TOKENS_PER_MINUTE="0",
+    QUESTION_CACHE_ENABLED="False",
+    QUESTION_BANK_ENABLED="False",
+    EVALUATION_CACHE_ENABLED="False",
+    TRACING_ENABLED="False"
+)
+
+from config.settings import get_settings  # noqa: E402
+from services.gemini_service import GeminiService  # noqa: E402
+from services.resilience import RetryPolicy  # noqa: E402
+
+get_settings.cache_clear()
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch):
+    """Relative data and log paths land in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def gemini() -> GeminiService:
+    """A GeminiService on the fake backend with instant, undelayed retries"""
+    service = GeminiService()
+    service.retry_policy = RetryPolicy(max_retries=2, retry_delay=0.0)
+    return service
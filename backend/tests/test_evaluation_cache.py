@@ -0,0 +1,77 @@
+"""
+Evaluation cache matching and MinHash signatures
+"""
+
+from services.evaluation_cache import EvaluationCache, MinHasher, normalize_text
+
+QUESTION = "Tell me about yourself"
+ANSWER = (
+    "I am a backend developer with three years of experience building REST APIs in Python. "
+    "Most of my work has been on FastAPI services, PostgreSQL schemas and background job queues, "
+    "and lately I have been profiling slow endpoints and adding caching where it pays off."
+)
+EVALUATION = {"overall_score": 82, "detailed_feedback": "Clear and relevant"}
+
+def _key(cache, answer, role="Backend Developer"):
+    return cache.key_for(QUESTION, answer, role, "2-3", ["communication"])
+
+def test_signature_is_stable_across_hashers():
+    text = normalize_text(ANSWER)
+    first = MinHasher().signature(text)
+
+    assert len(first) == 64
+    assert all(isinstance(value, int) for value in first)
+    assert MinHasher().signature(text) == first
+    assert MinHasher(seed=2).signature(text) != first
+
+def test_similarity_tracks_overlap():
+    hasher = MinHasher()
+    original = hasher.signature(normalize_text(ANSWER))
+    edited = hasher.signature(normalize_text(ANSWER.replace("three", "four")))
+    unrelated = hasher.signature(normalize_text("Recursion is when a function calls itself until a base case."))
+
+    assert MinHasher.similarity(original, original) == 1.0
+    assert MinHasher.similarity(original, edited) > 0.8
+    assert MinHasher.similarity(original, unrelated) < 0.2
+
+def test_exact_and_near_duplicate_hits():
+    cache = EvaluationCache(similarity_threshold=0.8)
+    cache.store(_key(cache, ANSWER), EVALUATION, latency_seconds=1.5)
+
+    evaluation, match, similarity = cache.lookup(_key(cache, ANSWER.upper() + "!!"))
+    assert (evaluation, match, similarity) == (EVALUATION, "exact", 1.0)
+
+    evaluation, match, similarity = cache.lookup(_key(cache, ANSWER.replace("three years", "four years")))
+    assert evaluation == EVALUATION
+    assert match == "near"
+    assert 0.8 <= similarity < 1.0
+
+    stats = cache.get_stats()
+    assert (stats["exact_hits"], stats["near_hits"], stats["misses"]) == (1, 1, 0)
+    assert stats["latency_saved_seconds"] == 3.0
+
+def test_different_answers_and_roles_miss():
+    cache = EvaluationCache(similarity_threshold=0.8)
+    cache.store(_key(cache, ANSWER), EVALUATION, latency_seconds=1.0)
+
+    assert cache.lookup(_key(cache, "I mostly write frontend code in React and TypeScript.")) is None
+    assert cache.lookup(_key(cache, ANSWER, role="Data Scientist")) is None
+    assert cache.get_stats()["misses"] == 2
+
+def test_hits_are_copies():
+    cache = EvaluationCache()
+    cache.store(_key(cache, ANSWER), EVALUATION, latency_seconds=1.0)
+
+    evaluation, _, _ = cache.lookup(_key(cache, ANSWER))
+    evaluation["overall_score"] = 0
+
+    assert cache.lookup(_key(cache, ANSWER))[0]["overall_score"] == 82
+
+def test_long_answers_only_match_exactly():
+    cache = EvaluationCache(max_near_match_chars=100)
+    key = _key(cache, ANSWER)
+    assert key.signature is None
+
+    cache.store(key, EVALUATION, latency_seconds=1.0)
+    assert cache.lookup(_key(cache, ANSWER))[1] == "exact"
+    assert cache.lookup(_key(cache, ANSWER.replace("three", "four"))) is None
@@ -0,0 +1,39 @@
+"""
+Request latency histograms recorded by MetricsMiddleware and exposed on /metrics
+"""
+
+import re
+
+import httpx
+import pytest
+
+from services.container import ServiceContainer
+
+def _request_count(metrics: str, route: str) -> int:
+    """Requests recorded for a route template, summed over methods and statuses"""
+    pattern = re.compile(r'^http_request_duration_seconds_count\{[^}]*route="' + re.escape(route) + r'"[^}]*\} (\d+)$', re.M)
+    return sum(int(count) for count in pattern.findall(metrics))
+
+@pytest.mark.asyncio
+async def test_requests_are_labelled_by_route_template():
+    import main as backend
+
+    services = ServiceContainer()
+    await services.startup()
+    backend.app.state.services = services
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=backend.app), base_url="http://test") as client:
+        before = (await client.get("/metrics")).text
+
+        await client.get("/api/interview/progress/first-session")
+        await client.get("/api/interview/progress/second-session")
+        await client.get("/no/such/route")
+
+        response = await client.get("/metrics")
+    await services.shutdown()
+
+    assert response.status_code == 200
+    metrics = response.text
+    assert _request_count(metrics, "/api/interview/progress/{session_id}") - _request_count(before, "/api/interview/progress/{session_id}") == 2
+    assert _request_count(metrics, "unmatched") - _request_count(before, "unmatched") == 1
+    assert "first-session" not in metrics and "second-session" not in metrics
+    assert re.search(r'^http_request_duration_seconds_bucket\{method="GET",route="/api/interview/progress/\{session_id\}",status="\d+",le="\+Inf"\} \d+$', metrics, re.M)
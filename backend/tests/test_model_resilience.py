@@ -0,0 +1,191 @@
+"""
+Retries, circuit breaker and fallbacks of GeminiService model calls
+Failures and latency are injected by the fake model backend
+"""
+
+import asyncio
+
+import pytest
+
+from services.fake_model import FakeModelBackend, FakeModelError
+from services.metrics import GEMINI_FALLBACKS
+from services.rate_limiter import ModelRateLimiter, Priority, QueueTimeoutError
+from services.resilience import CircuitBreaker, CircuitOpenError
+
+PROMPT = "Explain the difference between a process and a thread."
+
+class BlockedReplyModel(FakeModelBackend):
+    """Replies whose text can't be read, like a safety-blocked Gemini response"""
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **kwargs):
+        self.calls += 1
+        raise ValueError(
+            "The `response.text` quick accessor only works when the response contains a valid `Part`, "
+            "but none was returned. Check the `candidate.safety_ratings` to see if the response was blocked."
+        )
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_the_retry_count(gemini):
+    gemini.model.error_rate = 1.0
+
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=True)
+
+    assert gemini.model.calls == 3
+    assert gemini.retries == 2
+    assert gemini.retries_exhausted == 1
+
+@pytest.mark.asyncio
+async def test_no_retries_without_retry(gemini):
+    gemini.model.error_rate = 1.0
+
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+
+    assert gemini.model.calls == 1
+    assert gemini.retries == 0
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_the_call_budget_runs_out(gemini, monkeypatch):
+    gemini.model.error_rate = 1.0
+    gemini.retry_policy.max_retries = 100
+    gemini.call_budget_seconds = 0.25
+    monkeypatch.setattr(gemini.retry_policy, "delay", lambda attempt: 0.1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=True)
+
+    # Attempts at 0, 0.1 and 0.2s; the next backoff would end past the budget
+    assert gemini.model.calls == 3
+    assert gemini.retries_exhausted == 1
+    assert loop.time() - started < 0.25
+
+@pytest.mark.asyncio
+async def test_slow_model_is_cut_off_by_the_call_budget(gemini):
+    gemini.model.latency_ms = 1000
+    gemini.call_budget_seconds = 0.1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=True)
+
+    assert gemini.model.calls == 1
+
+@pytest.mark.asyncio
+async def test_breaker_opens_then_probes_once_then_closes(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=0.1)
+    gemini.model.error_rate = 1.0
+    for _ in range(3):
+        with pytest.raises(FakeModelError):
+            await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+    assert gemini.circuit_breaker.state == "open"
+
+    # Open: refused without calling the model
+    with pytest.raises(CircuitOpenError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+    assert gemini.model.calls == 3
+
+    # Half-open: one probe goes through, concurrent callers are refused
+    await asyncio.sleep(0.15)
+    gemini.model.error_rate = 0.0
+    gemini.model.latency_ms = 50
+    probe = asyncio.create_task(gemini._call_model(PROMPT, Priority.STANDARD, retry=False))
+    await asyncio.sleep(0.01)
+    assert gemini.circuit_breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+
+    assert await probe
+    assert gemini.circuit_breaker.state == "closed"
+    assert gemini.circuit_breaker.consecutive_failures == 0
+    assert gemini.model.calls == 4
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_the_breaker(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.05)
+    gemini.model.error_rate = 1.0
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+
+    await asyncio.sleep(0.06)
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+
+    assert gemini.circuit_breaker.state == "open"
+    assert gemini.circuit_breaker.times_opened == 2
+
+@pytest.mark.asyncio
+async def test_queue_timeout_is_not_a_breaker_failure(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=60)
+    gemini.limiter = ModelRateLimiter(max_in_flight=1, requests_per_minute=0)
+    gemini.max_queue_seconds = 0.05
+
+    async with gemini.limiter.slot():
+        with pytest.raises(QueueTimeoutError):
+            await gemini._call_model(PROMPT, Priority.STANDARD, retry=True)
+
+    assert gemini.model.calls == 0
+    assert gemini.circuit_breaker.state == "closed"
+    assert gemini.circuit_breaker.consecutive_failures == 0
+
+@pytest.mark.asyncio
+async def test_cancellation_is_not_a_breaker_failure_and_frees_the_probe(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.05)
+    gemini.model.error_rate = 1.0
+    with pytest.raises(FakeModelError):
+        await gemini._call_model(PROMPT, Priority.STANDARD, retry=False)
+    await asyncio.sleep(0.06)
+
+    # The half-open probe is abandoned by its caller mid-call
+    gemini.model.error_rate = 0.0
+    gemini.model.latency_ms = 1000
+    probe = asyncio.create_task(gemini._call_model(PROMPT, Priority.STANDARD, retry=False))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert gemini.circuit_breaker.state == "half_open"
+    assert gemini.circuit_breaker.consecutive_failures == 1
+    assert gemini.circuit_breaker.allow()
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_not_retried_or_counted(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=60)
+    gemini.model = BlockedReplyModel(latency_ms=0)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await gemini._call_model(PROMPT, Priority.STANDARD, retry=True)
+
+    assert gemini.model.calls == 3
+    assert gemini.retries == 0
+    assert gemini.circuit_breaker.state == "closed"
+    assert gemini.circuit_breaker.consecutive_failures == 0
+
+@pytest.mark.asyncio
+async def test_fallback_once_retries_are_exhausted(gemini):
+    gemini.model.error_rate = 1.0
+    fallbacks = GEMINI_FALLBACKS.value(method="follow_up")
+
+    follow_up = await gemini.generate_follow_up_question(PROMPT, "Threads share memory.", "Backend Developer")
+
+    assert follow_up == "Can you elaborate more on that approach?"
+    assert gemini.model.calls == 3
+    assert gemini.retries_exhausted == 1
+    assert GEMINI_FALLBACKS.value(method="follow_up") == fallbacks + 1
+
+@pytest.mark.asyncio
+async def test_fallback_while_the_breaker_is_open(gemini):
+    gemini.circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=60)
+    gemini.model.error_rate = 1.0
+    await gemini.generate_follow_up_question(PROMPT, "Threads share memory.", "Backend Developer")
+    calls = gemini.model.calls
+    short_circuited = gemini.circuit_breaker.short_circuited
+
+    follow_up = await gemini.generate_follow_up_question("Another question?", "Another answer.", "Backend Developer")
+
+    assert follow_up == "Can you elaborate more on that approach?"
+    assert gemini.model.calls == calls
+    assert gemini.circuit_breaker.short_circuited == short_circuited + 1
@@ -0,0 +1,25 @@
+"""
+Profiling middleware request selection
+"""
+
+from services.profiler import ProfileStore, ProfilingMiddleware
+
+def _scope(query: bytes = b"", headers=()):
+    return {"type": "http", "method": "GET", "path": "/api/interview/progress/s1", "query_string": query, "headers": list(headers)}
+
+def _middleware() -> ProfilingMiddleware:
+    return ProfilingMiddleware(app=None, store=ProfileStore("profiles"), admin_token="s3cret")
+
+def test_admin_token_header_enables_profiling():
+    assert _middleware()._wants_profile(_scope(headers=[(b"x-profile", b"1"), (b"x-admin-token", b"s3cret")]))
+    assert _middleware()._wants_profile(_scope(query=b"profile=1", headers=[(b"x-admin-token", b"s3cret")]))
+
+def test_admin_token_in_query_string_is_ignored():
+    assert not _middleware()._wants_profile(_scope(query=b"profile=1&admin_token=s3cret"))
+
+def test_wrong_or_missing_token_is_rejected():
+    assert not _middleware()._wants_profile(_scope(headers=[(b"x-profile", b"1"), (b"x-admin-token", b"wrong")]))
+    assert not _middleware()._wants_profile(_scope(headers=[(b"x-profile", b"1")]))
+    assert not ProfilingMiddleware(app=None, store=ProfileStore("profiles"), admin_token="")._wants_profile(
+        _scope(headers=[(b"x-profile", b"1"), (b"x-admin-token", b"")])
+    )
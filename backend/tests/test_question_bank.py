@@ -0,0 +1,40 @@
+"""
+Question bank configuration and prefetching
+"""
+
+import pytest
+
+from config.settings import InterviewConfig
+from services.question_bank import QuestionBankPrefetcher, parse_roles, standard_configurations
+from services.question_cache import QuestionCache
+
+def test_roles_must_be_named():
+    assert parse_roles("") == []
+    assert parse_roles(" Backend Developer, Data Scientist ,") == ["Backend Developer", "Data Scientist"]
+    assert parse_roles("all") == list(InterviewConfig.JOB_ROLES)
+
+def test_configurations_cover_only_the_named_roles():
+    configurations = standard_configurations(["Backend Developer"])
+
+    assert {role for role, _, _ in configurations} == {"Backend Developer"}
+    assert len(configurations) == len(InterviewConfig.EXPERIENCE_LEVELS) * len(InterviewConfig.DIFFICULTY_LEVELS)
+
+def test_configured_cache_size_is_kept(gemini):
+    gemini.question_cache = QuestionCache(path="data/cache/question_cache.json", max_keys=5)
+
+    bank = QuestionBankPrefetcher(gemini, standard_configurations(["Backend Developer"]))
+
+    assert len(bank.configurations) > 5
+    assert gemini.question_cache.max_keys == 5
+
+@pytest.mark.asyncio
+async def test_refill_fills_every_pool_to_the_target(gemini):
+    gemini.question_cache = QuestionCache(path="data/cache/question_cache.json", max_keys=100)
+    bank = QuestionBankPrefetcher(gemini, standard_configurations(["Backend Developer"]), target_sets=1, concurrency=4)
+
+    generated = await bank.refill()
+
+    assert generated == len(bank.configurations)
+    assert gemini.model.calls == generated
+    assert bank.get_stats()["fill_ratio"] == 1.0
+    assert await bank.refill() == 0
@@ -0,0 +1,66 @@
+"""
+Question cache pools and their persistence
+"""
+
+import asyncio
+
+import pytest
+
+from services.question_cache import QuestionCache
+
+KEY = QuestionCache.make_key("Backend Developer", "2-3", "medium", 2, 1)
+QUESTIONS = [{"id": 1, "question": "What is a race condition?"}, {"id": 2, "question": "How do you profile a slow endpoint?"}]
+
+@pytest.mark.asyncio
+async def test_put_does_not_write_until_saved(workspace):
+    cache = QuestionCache(path="cache.json")
+    cache.put(KEY, QUESTIONS)
+
+    assert not (workspace / "cache.json").exists()
+    assert cache.get_stats()["unsaved_changes"]
+
+    await cache.save()
+    await cache.save()
+
+    assert (workspace / "cache.json").exists()
+    assert cache.get_stats()["saves"] == 1
+    assert not cache.get_stats()["unsaved_changes"]
+
+@pytest.mark.asyncio
+async def test_background_loop_saves_new_sets():
+    cache = QuestionCache(path="cache.json")
+    cache.start(0.02)
+    cache.put(KEY, QUESTIONS)
+    await asyncio.sleep(0.1)
+
+    assert cache.get_stats()["saves"] == 1
+    await cache.stop()
+    assert cache.get_stats()["saves"] == 1
+
+@pytest.mark.asyncio
+async def test_stop_saves_and_pools_survive_a_restart():
+    cache = QuestionCache(path="cache.json")
+    cache.start(60)
+    cache.put(KEY, QUESTIONS)
+    await cache.stop()
+
+    restarted = QuestionCache(path="cache.json")
+    await restarted.load()
+
+    assert sorted(question["question"] for question in restarted.get(KEY, 2)) == sorted(question["question"] for question in QUESTIONS)
+
+@pytest.mark.asyncio
+async def test_failed_save_is_retried(monkeypatch):
+    cache = QuestionCache(path="cache.json")
+    cache.put(KEY, QUESTIONS)
+
+    def failing_write(snapshot):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(cache, "_write_atomic", failing_write)
+        await cache.save()
+    assert cache.get_stats()["unsaved_changes"]
+
+    await cache.save()
+    assert cache.get_stats()["saves"] == 1
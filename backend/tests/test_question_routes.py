@@ -0,0 +1,58 @@
+"""
+General question routes, buffered and streamed
+Requests go through the FastAPI app in-process, answered by the fake model backend
+"""
+
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from services.container import ServiceContainer
+
+CODE_REVIEW = {
+    "code": "def add(a, b):\n    return a + b",
+    "language": "python",
+    "focus_areas": ["performance", "security"]
+}
+
+@asynccontextmanager
+async def _client():
+    """An HTTP client for main.app with fresh services; `client.prompts` records every model prompt"""
+    import main as backend
+
+    services = ServiceContainer()
+    await services.startup()
+    backend.app.state.services = services
+    prompts = []
+    generate = services.gemini_service.model.generate_content_async
+
+    async def recording_generate(prompt, **kwargs):
+        prompts.append(prompt)
+        return await generate(prompt, **kwargs)
+
+    services.gemini_service.model.generate_content_async = recording_generate
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=backend.app), base_url="http://test") as client:
+        client.prompts = prompts
+        yield client
+    await services.shutdown()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/questions/code-review", "/api/questions/code-review/stream"])
+async def test_code_review_reads_the_snippet_and_focus_areas_from_the_body(path):
+    async with _client() as client:
+        response = await client.post(path, json=CODE_REVIEW)
+
+    assert response.status_code == 200
+    assert len(client.prompts) == 1
+    assert "return a + b" in client.prompts[0]
+    assert "focusing on performance, security" in client.prompts[0]
+
+@pytest.mark.asyncio
+async def test_streamed_code_review_ends_with_a_result_event():
+    async with _client() as client:
+        async with client.stream("POST", "/api/questions/code-review/stream", json=CODE_REVIEW) as response:
+            body = "".join([chunk async for chunk in response.aiter_text()])
+
+    assert "event: chunk" in body
+    assert "event: result" in body
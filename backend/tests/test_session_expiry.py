@@ -0,0 +1,100 @@
+"""
+Expiry of stored sessions that were never loaded
+Lazy JSON mode seeds the expiry heap from the background index scan
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.settings import get_settings
+from services.session_service import SessionService
+from services.session_store import JsonFileSessionStore
+
+@pytest.fixture
+def lazy_loading(monkeypatch):
+    monkeypatch.setenv("SESSION_LAZY_LOADING", "True")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+def _stored_session(session_id: str, status: str, idle: timedelta, accessed: timedelta = None) -> dict:
+    now = datetime.now()
+    session_data = {
+        "session_id": session_id,
+        "status": status,
+        "created_at": (now - idle).isoformat(),
+        "last_updated": (now - idle).isoformat(),
+        "answers": []
+    }
+    if accessed is not None:
+        session_data["last_accessed"] = (now - accessed).isoformat()
+    return session_data
+
+async def _service_over(sessions) -> SessionService:
+    store = JsonFileSessionStore()
+    for session_data in sessions:
+        await store.save(session_data["session_id"], session_data)
+    service = SessionService(store)
+    await service.initialize()
+    await service._index_task
+    return service
+
+@pytest.mark.asyncio
+async def test_unloaded_stale_sessions_are_swept(lazy_loading):
+    service = await _service_over([
+        _stored_session("stale", "in_progress", timedelta(hours=3)),
+        _stored_session("fresh", "in_progress", timedelta(minutes=5))
+    ])
+    assert len(service.sessions) == 0
+    assert "stale" in service.expiry_index and "fresh" in service.expiry_index
+    assert (await service.get_session_statistics())["in_progress_sessions"] == 2
+
+    await service.cleanup_expired_sessions()
+
+    assert await service.store.load("stale") is None
+    assert await service.store.load("fresh") is not None
+    assert (await service.get_session_statistics())["in_progress_sessions"] == 1
+    assert await service.get_active_sessions_count() == 1
+    await service.close()
+
+@pytest.mark.asyncio
+async def test_stored_access_time_defers_expiry(lazy_loading):
+    service = await _service_over([
+        _stored_session("read", "completed", timedelta(hours=3), accessed=timedelta(minutes=5))
+    ])
+
+    await service.cleanup_expired_sessions()
+
+    assert await service.store.load("read") is not None
+    assert await service.get_active_sessions_count() == 1
+    await service.close()
+
+@pytest.mark.asyncio
+async def test_loaded_sessions_keep_their_newer_deadline(lazy_loading):
+    service = SessionService(JsonFileSessionStore())
+    await service.initialize()
+    session_id = await service.create_session()
+    await service._index_task
+    deadline = service.expiry_index.deadline(session_id)
+
+    # A rescan only sees the stored copy, which may lag behind memory
+    await service._build_session_index()
+
+    assert service.expiry_index.deadline(session_id) == deadline
+    await service.close()
+
+@pytest.mark.asyncio
+async def test_unindexed_store_answers_expiry_and_status_queries():
+    store = JsonFileSessionStore()
+    for session_data in [
+        _stored_session("stale", "in_progress", timedelta(hours=3)),
+        _stored_session("read", "completed", timedelta(hours=3), accessed=timedelta(minutes=5)),
+        _stored_session("fresh", "in_progress", timedelta(minutes=5))
+    ]:
+        await store.save(session_data["session_id"], session_data)
+
+    cutoff = (datetime.now() - timedelta(hours=1)).timestamp()
+
+    assert await store.find_expired(cutoff) == {"stale": "in_progress"}
+    assert await store.count_by_status() == {"in_progress": 2, "completed": 1}
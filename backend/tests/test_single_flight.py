@@ -0,0 +1,112 @@
+"""
+Coalescing of identical in-flight model calls
+GeminiService prompts against the fake model backend, and SingleFlight on its own
+"""
+
+import asyncio
+
+import pytest
+
+from services.fake_model import FakeModelError
+from services.single_flight import SingleFlight
+
+PROMPT = "Explain how a hash map handles collisions."
+
+@pytest.fixture
+def gemini(gemini):
+    gemini.model.latency_ms = 50
+    return gemini
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_prompts_share_one_call(gemini):
+    # Whitespace differences don't matter
+    prompts = [PROMPT, f"  {PROMPT}\n", PROMPT.replace(" ", "  ")] * 3
+
+    results = await asyncio.gather(*(gemini._generate_response(prompt) for prompt in prompts))
+
+    assert gemini.model.calls == 1
+    assert len(set(results)) == 1
+    assert gemini.single_flight.get_stats()["issued"] == 1
+    assert gemini.single_flight.get_stats()["coalesced"] == len(prompts) - 1
+
+@pytest.mark.asyncio
+async def test_different_prompts_and_opted_out_calls_are_not_shared(gemini):
+    await asyncio.gather(
+        gemini._generate_response(PROMPT),
+        gemini._generate_response("Explain how a B-tree stays balanced."),
+        gemini._generate_response(PROMPT, coalesce=False)
+    )
+
+    assert gemini.model.calls == 3
+
+@pytest.mark.asyncio
+async def test_calls_that_do_not_overlap_are_not_shared(gemini):
+    await gemini._generate_response(PROMPT)
+    await gemini._generate_response(PROMPT)
+
+    assert gemini.model.calls == 2
+
+@pytest.mark.asyncio
+async def test_exception_reaches_every_waiter(gemini):
+    gemini.model.error_rate = 1.0
+
+    results = await asyncio.gather(*(gemini._generate_response(PROMPT, retry=False) for _ in range(4)), return_exceptions=True)
+
+    assert gemini.model.calls == 1
+    assert all(isinstance(result, FakeModelError) for result in results)
+
+@pytest.mark.asyncio
+async def test_entry_cleared_after_success(gemini):
+    await asyncio.gather(gemini._generate_response(PROMPT), gemini._generate_response(PROMPT))
+
+    assert gemini.single_flight.get_stats()["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_entry_cleared_after_failure(gemini):
+    gemini.model.error_rate = 1.0
+    await asyncio.gather(gemini._generate_response(PROMPT, retry=False), gemini._generate_response(PROMPT, retry=False), return_exceptions=True)
+    assert gemini.single_flight.get_stats()["in_flight"] == 0
+
+    # The failure isn't remembered: the next call goes to the model again
+    gemini.model.error_rate = 0.0
+    assert await gemini._generate_response(PROMPT, retry=False)
+    assert gemini.model.calls == 2
+
+@pytest.mark.asyncio
+async def test_one_waiter_leaving_does_not_cancel_the_call():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    leaving = asyncio.create_task(single_flight.run("key", call))
+    staying = asyncio.create_task(single_flight.run("key", call))
+    await asyncio.sleep(0.01)
+    leaving.cancel()
+
+    assert await staying == "answer"
+    assert len(calls) == 1
+    assert single_flight.get_stats()["abandoned"] == 0
+
+@pytest.mark.asyncio
+async def test_last_waiter_leaving_cancels_the_call():
+    single_flight = SingleFlight()
+    finished = []
+
+    async def call():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    waiter = asyncio.create_task(single_flight.run("key", call))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0.06)
+
+    assert not finished
+    assert single_flight.get_stats()["abandoned"] == 1
+    assert single_flight.get_stats()["in_flight"] == 0
@@ -0,0 +1,66 @@
+"""
+Speculative follow-ups held per session
+"""
+
+import asyncio
+
+import pytest
+
+from services.speculation import SpeculativeFollowUps
+
+KEY = SpeculativeFollowUps.make_key("What is a deadlock?", "Two threads waiting on each other.")
+
+async def _follow_up(delay: float, text: str = "How would you detect one?") -> str:
+    await asyncio.sleep(delay)
+    return text
+
+@pytest.mark.asyncio
+async def test_ready_does_not_wait_for_a_running_follow_up():
+    follow_ups = SpeculativeFollowUps()
+    follow_ups.start("s1", KEY, _follow_up(10))
+
+    assert follow_ups.ready("s1") is None
+    # Still there for the follow-up request
+    assert follow_ups.get_stats()["running"] == 1
+    await follow_ups.close()
+
+@pytest.mark.asyncio
+async def test_ready_serves_a_finished_follow_up_once():
+    follow_ups = SpeculativeFollowUps()
+    follow_ups.start("s1", KEY, _follow_up(0))
+    await asyncio.sleep(0.01)
+
+    assert follow_ups.ready("s1") == "How would you detect one?"
+    assert follow_ups.ready("s1") is None
+    assert await follow_ups.take("s1", KEY) is None
+    assert follow_ups.get_stats()["served"] == 1
+
+@pytest.mark.asyncio
+async def test_take_waits_and_serves_once():
+    follow_ups = SpeculativeFollowUps()
+    follow_ups.start("s1", KEY, _follow_up(0.02))
+
+    assert await follow_ups.take("s1", KEY) == "How would you detect one?"
+    assert follow_ups.ready("s1") is None
+    assert follow_ups.get_stats()["ready"] == 0
+
+@pytest.mark.asyncio
+async def test_take_for_another_answer_is_a_miss():
+    follow_ups = SpeculativeFollowUps()
+    follow_ups.start("s1", KEY, _follow_up(0))
+
+    assert await follow_ups.take("s1", SpeculativeFollowUps.make_key("What is a deadlock?", "Something else.")) is None
+    assert follow_ups.get_stats()["misses"] == 1
+    await follow_ups.close()
+
+@pytest.mark.asyncio
+async def test_failed_follow_up_is_dropped():
+    async def failing() -> str:
+        raise RuntimeError("503 The service is currently unavailable.")
+
+    follow_ups = SpeculativeFollowUps()
+    follow_ups.start("s1", KEY, failing())
+    await asyncio.sleep(0.01)
+
+    assert follow_ups.ready("s1") is None
+    assert follow_ups.get_stats()["ready"] == 0
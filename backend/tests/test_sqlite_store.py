@@ -0,0 +1,65 @@
+"""
+SQLite session store round trips and indexed queries
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.session_store import SQLiteSessionStore
+
+def _session(session_id: str, status: str, idle: timedelta, answers: int = 0) -> dict:
+    updated = (datetime.now() - idle).isoformat()
+    return {
+        "session_id": session_id,
+        "status": status,
+        "created_at": updated,
+        "last_updated": updated,
+        "questions": [{"id": i, "question": f"Question {i}"} for i in range(1, 4)],
+        "answers": [
+            {"question_id": i, "answer_text": f"Answer {i}", "score": 70 + i, "submitted_at": updated}
+            for i in range(1, answers + 1)
+        ]
+    }
+
+async def _open_store() -> SQLiteSessionStore:
+    store = SQLiteSessionStore("sqlite:///./sessions.db")
+    await store.initialize()
+    return store
+
+@pytest.mark.asyncio
+async def test_save_and_load_round_trip():
+    store = await _open_store()
+    session_data = _session("s1", "in_progress", timedelta(minutes=5), answers=2)
+    await store.save("s1", session_data)
+
+    assert await store.load("s1") == session_data
+    assert await store.load("missing") is None
+    assert await store.list_ids() == ["s1"]
+    await store.close()
+
+@pytest.mark.asyncio
+async def test_save_replaces_answers():
+    store = await _open_store()
+    await store.save("s1", _session("s1", "in_progress", timedelta(minutes=5), answers=3))
+    await store.save("s1", _session("s1", "completed", timedelta(minutes=1), answers=1))
+
+    loaded = await store.load("s1")
+    assert loaded["status"] == "completed"
+    assert [answer["question_id"] for answer in loaded["answers"]] == [1]
+    await store.close()
+
+@pytest.mark.asyncio
+async def test_indexed_expiry_and_status_queries():
+    store = await _open_store()
+    await store.save("stale", _session("stale", "in_progress", timedelta(hours=3)))
+    await store.save("done", _session("done", "completed", timedelta(hours=2)))
+    await store.save("fresh", _session("fresh", "in_progress", timedelta(minutes=5)))
+    cutoff = (datetime.now() - timedelta(hours=1)).timestamp()
+
+    assert await store.find_expired(cutoff) == {"stale": "in_progress", "done": "completed"}
+    assert await store.count_by_status() == {"in_progress": 2, "completed": 1}
+
+    await store.delete("stale")
+    assert await store.find_expired(cutoff) == {"done": "completed"}
+    await store.close()